@@ -0,0 +1,92 @@
+"""
+Benchmarks the overhead of the GA operators, separately from the time spent evaluating the model.
+"""
+from time import time
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.drivers.genetic_algorithm_driver import GeneticAlgorithm
+
+
+NVARS = 10
+BITS = 32
+POPSIZE = 10000
+MAXGEN = 5
+
+
+class TimedGADriver(om.SimpleGADriver):
+    """
+    SimpleGADriver that keeps track of the time spent evaluating the model.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.eval_time = 0.0
+
+    def objective_callback(self, x, icase):
+        t0 = time()
+        try:
+            return super().objective_callback(x, icase)
+        finally:
+            self.eval_time += time() - t0
+
+
+class BenchGAOperators(unittest.TestCase):
+
+    def benchmark_operators(self):
+        ga = GeneticAlgorithm(None)
+        ga.npop = POPSIZE
+        ga.lchrom = NVARS * BITS
+        ga.gray_code = True
+
+        vlb = np.zeros(NVARS)
+        vub = np.ones(NVARS)
+        bits = np.full(NVARS, BITS)
+        Pm = (ga.lchrom + 1.0) / (2.0 * POPSIZE * ga.lchrom)
+
+        np.random.seed(11)
+        gen = np.random.randint(2, size=(POPSIZE, ga.lchrom)).astype(np.uint8)
+        fitness = np.random.rand(POPSIZE)
+        x = ga.decode(gen, vlb, vub, bits)
+
+        timings = {}
+        for name, func in [('tournament', lambda: ga.tournament(gen, fitness)),
+                           ('crossover', lambda: ga.crossover(gen, 0.5)),
+                           ('mutate', lambda: ga.mutate(gen.copy(), Pm)),
+                           ('decode', lambda: ga.decode(gen, vlb, vub, bits)),
+                           ('encode', lambda: ga.encode(x, vlb, vub, bits))]:
+            t0 = time()
+            func()
+            timings[name] = time() - t0
+
+        for name, elapsed in timings.items():
+            print('%-12s %.4f s' % (name, elapsed))
+
+    def benchmark_driver(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f = sum(x**2)', x=np.zeros(NVARS)),
+                            promotes=['*'])
+
+        model.add_design_var('x', lower=-1.0, upper=1.0)
+        model.add_objective('f')
+
+        driver = prob.driver = TimedGADriver(max_gen=MAXGEN, pop_size=POPSIZE // 10,
+                                             bits={'x': BITS})
+
+        prob.setup()
+
+        t0 = time()
+        prob.run_driver()
+        elapsed = time() - t0
+
+        print('Elapsed Time', elapsed)
+        print('Model Evaluation Time', driver.eval_time)
+        print('GA Overhead', elapsed - driver.eval_time)
+
+
+if __name__ == '__main__':
+    unittest.main()
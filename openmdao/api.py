@@ -39,6 +39,8 @@ from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.solvers.linear.petsc_ksp import PETScKrylov
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
 from openmdao.solvers.linear.scipy_iter_solver import ScipyKrylov
+from openmdao.solvers.linear.preconditioners import ILUPreconditioner, \
+    BlockJacobiPreconditioner, AMGPreconditioner
 from openmdao.solvers.linear.user_defined import LinearUserDefined
 from openmdao.solvers.linesearch.backtracking import ArmijoGoldsteinLS
 from openmdao.solvers.linesearch.backtracking import BoundsEnforceLS
@@ -86,6 +88,9 @@ from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 from openmdao.recorders.case_reader import CaseReader
 
+# Setup Caching
+from openmdao.utils.setup_cache import load_setup
+
 # Visualizations
 from openmdao.visualization.n2_viewer.n2_viewer import n2
 from openmdao.visualization.connection_viewer.viewconns import view_connections
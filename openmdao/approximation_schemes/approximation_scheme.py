@@ -34,6 +34,9 @@ class ApproximationScheme(object):
     _during_sparsity_comp : bool
         If True, we're doing a sparsity computation and uncolored approxs need to be restricted
         to only colored columns.
+    _wrt_rel_systems : dict or None
+        If not None, maps each total derivative wrt variable to the set of systems relevant to it
+        (or None if all are relevant), and nonlinear runs skip irrelevant systems.
     """
 
     def __init__(self):
@@ -46,6 +49,7 @@ class ApproximationScheme(object):
         self._wrt_meta = {}
         self._progress_out = None
         self._during_sparsity_comp = False
+        self._wrt_rel_systems = None
 
     def __repr__(self):
         """
@@ -272,6 +276,27 @@ class ApproximationScheme(object):
                 self._approx_groups.append((wrt, data, in_idx, vec, vec_idx, directional,
                                             meta['vector']))
 
+    def _set_nl_rel_systems(self, system, wrts):
+        """
+        Restrict the following nonlinear runs to the systems relevant to the given wrt vars.
+
+        Parameters
+        ----------
+        system : System
+            System where this approximation is occurring.
+        wrts : iter of str
+            Names of the wrt variables being perturbed.
+        """
+        rel_systems = set()
+        for wrt in wrts:
+            systems = self._wrt_rel_systems.get(wrt)
+            if systems is None:
+                rel_systems = None
+                break
+            rel_systems.update(systems)
+
+        system._problem_meta['nl_rel_systems'] = rel_systems
+
     def _colored_column_iter(self, system, colored_approx_groups, total):
         """
         Perform colored approximations and yields (column_index, column) for each jac column.
@@ -325,10 +350,25 @@ class ApproximationScheme(object):
         nruns = len(colored_approx_groups)
         tosend = None
 
+        prune = total and self._wrt_rel_systems is not None
+        if prune:
+            # map jac columns to the wrt variables that own them
+            wrt_names = []
+            wrt_ends = []
+            for wrt, _, end, _, _ in system._jac_wrt_iter():
+                wrt_names.append(wrt)
+                wrt_ends.append(end)
+            wrt_ends = np.array(wrt_ends)
+
         for data, jcols, vec_ind_list, nzrows in colored_approx_groups:
             mult = self._get_multiplier(data)
 
             if fd_count % num_par_fd == system._par_fd_id:
+                if prune:
+                    self._set_nl_rel_systems(system, [wrt_names[i] for i in
+                                                      set(np.searchsorted(wrt_ends, jcols,
+                                                                          side='right'))])
+
                 # run the finite difference
                 result = self._run_point(system, vec_ind_list, data, results_array, total)
 
@@ -438,6 +478,9 @@ class ApproximationScheme(object):
 
             mult = self._get_multiplier(data)
 
+            if total and self._wrt_rel_systems is not None:
+                self._set_nl_rel_systems(system, [wrt])
+
             for i_count, (idxs, vecidxs) in enumerate(zip(jcol_idxs, vec_idxs)):
                 if fd_count % num_par_fd == system._par_fd_id:
                     # run the finite difference
@@ -518,10 +561,13 @@ class ApproximationScheme(object):
         # This will either generate new approx groups or use cached ones
         approx_groups, colored_approx_groups = self._get_approx_groups(system, under_cs)
 
-        if colored_approx_groups:
-            yield from self._colored_column_iter(system, colored_approx_groups, total)
+        try:
+            if colored_approx_groups:
+                yield from self._colored_column_iter(system, colored_approx_groups, total)
 
-        yield from self._uncolored_column_iter(system, approx_groups, total)
+            yield from self._uncolored_column_iter(system, approx_groups, total)
+        finally:
+            system._problem_meta['nl_rel_systems'] = None
 
         system._set_approx_mode(False)
 
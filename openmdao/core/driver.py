@@ -858,7 +858,7 @@ class Driver(object):
         return_format : string
             Format to return the derivatives. Default is a 'flat_dict', which
             returns them in a dictionary whose keys are tuples of form (of, wrt). For
-            the scipy optimizer, 'array' is also supported.
+            the scipy optimizer, 'array' and 'csr' are also supported.
         global_names : bool
             Deprecated.  Use 'use_abs_names' instead.
         use_abs_names : bool
@@ -952,6 +952,22 @@ class Driver(object):
         """
         return create_local_meta(case_name)
 
+    def _get_recorder_data(self, data):
+        """
+        Return the data to be recorded for the latest iteration.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary containing input, output and residual values keyed on absolute name.
+
+        Returns
+        -------
+        dict
+            Data dictionary for the recorder.
+        """
+        return data
+
     def _get_name(self):
         """
         Get name of current Driver.
@@ -1288,5 +1304,7 @@ def record_iteration(requester, prob, case_name):
             solver = model.nonlinear_solver
             norm0 = solver._norm0 if solver._norm0 != 0.0 else 1.0  # runonce never sets _norm0
             data['rel'] = norm / norm0
+    else:
+        data = requester._get_recorder_data(data)
 
     rec_mgr.record_iteration(requester, data, requester._get_recorder_metadata(case_name))
@@ -1,8 +1,12 @@
 """Define the ExplicitComponent class."""
 
 import sys
+import inspect
+import hashlib
 import numpy as np
 
+from openmdao import __version__
+
 from openmdao.jacobians.dictionary_jacobian import DictionaryJacobian
 from openmdao.core.component import Component
 from openmdao.vectors.vector import _full_slice
@@ -11,6 +15,7 @@ from openmdao.utils.general_utils import ContainsAll
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.om_warnings import warn_deprecation
+from openmdao.utils.eval_cache import EvalCache
 
 _inst_functs = ['compute_jacvec_product']
 
@@ -25,6 +30,9 @@ class ExplicitComponent(Component):
         Dictionary of names mapped to bound methods.
     _has_compute_partials : bool
         If True, the instance overrides compute_partials.
+    _eval_cache : EvalCache or None
+        Cache of compute/compute_partials results keyed on input values, or None if
+        caching is not active.
     """
 
     def __init__(self, **kwargs):
@@ -40,8 +48,23 @@ class ExplicitComponent(Component):
 
         self._inst_functs = {name: getattr(self, name, None) for name in _inst_functs}
         self._has_compute_partials = overrides_method('compute_partials', self, ExplicitComponent)
+        self._eval_cache = None
         self.options.undeclare('assembled_jac_type')
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('cache_size', types=int, default=0, lower=0,
+                             desc='Maximum number of results of compute and compute_partials, '
+                                  'keyed on input values, to keep in memory. If 0 and '
+                                  'cache_file is None, no caching is done.')
+        self.options.declare('cache_file', types=str, default=None, allow_none=True,
+                             desc='Name of a file where cached compute and compute_partials '
+                                  'results are stored so they can be reused in later runs.')
+
     def _configure(self):
         """
         Configure this system to assign children settings and detect if matrix_free.
@@ -99,6 +122,17 @@ class ExplicitComponent(Component):
         """
         super()._setup_partials()
 
+        cache_size = self.options['cache_size']
+        cache_file = self.options['cache_file']
+        if cache_file is not None and self.comm.size > 1:
+            # procs can't share the file safely and a disk hit on only some procs would leave
+            # them out of step in collective calls, so under MPI only memory caching is done.
+            cache_file = None
+        if cache_size > 0 or cache_file is not None:
+            self._eval_cache = EvalCache(cache_size, cache_file, self._get_cache_namespace())
+        else:
+            self._eval_cache = None
+
         abs2prom_out = self._var_abs2prom['output']
 
         # Note: These declare calls are outside of setup_partials so that users do not have to
@@ -209,6 +243,34 @@ class ExplicitComponent(Component):
                                   tags=tags, shape_by_conn=shape_by_conn,
                                   copy_shape=copy_shape, distributed=distributed)
 
+    def _get_cache_namespace(self):
+        """
+        Return a string identifying this component for the purpose of caching its results.
+
+        It combines the class, pathname, option values, OpenMDAO version and the source of
+        compute and compute_partials so that persisted results are not reused by a different
+        component or after the component is changed.
+
+        Returns
+        -------
+        str
+            The cache namespace.
+        """
+        klass = type(self)
+        h = hashlib.sha1(__version__.encode())
+        for name in ('compute', 'compute_partials'):
+            func = getattr(klass, name)
+            try:
+                h.update(inspect.getsource(func).encode())
+            except (OSError, TypeError):
+                h.update(func.__code__.co_code)
+
+        opts = [(n, v) for n, v in self.options.items() if n not in ('cache_size', 'cache_file')]
+        h.update(repr(sorted(opts)).encode())
+
+        return '{}.{}:{}:{}'.format(klass.__module__, klass.__qualname__, self.pathname,
+                                    h.hexdigest())
+
     def _approx_subjac_keys_iter(self):
         is_output = self._outputs._contains_abs
         for abs_key, meta in self._subjacs_info.items():
@@ -221,6 +283,20 @@ class ExplicitComponent(Component):
         """
         Call compute based on the value of the "run_root_only" option.
         """
+        cache = None if self.under_complex_step else self._eval_cache
+        if cache is not None:
+            key = cache.get_key(self._inputs, self._discrete_inputs)
+            cached = cache.get(key, 'outputs')
+            if self.comm.size > 1 and not all(self.comm.allgather(cached is not None)):
+                # all procs must agree on a hit or they get out of step in collective calls
+                cached = None
+            if cached is not None:
+                outs, disc_outs = cached
+                self._outputs.set_val(outs)
+                for name, val in disc_outs.items():
+                    self._discrete_outputs[name] = val
+                return
+
         with self._call_user_function('compute'):
             args = [self._inputs, self._outputs]
             if self._discrete_inputs or self._discrete_outputs:
@@ -239,6 +315,10 @@ class ExplicitComponent(Component):
             else:
                 self.compute(*args)
 
+        if cache is not None:
+            disc_outs = dict(self._discrete_outputs.items()) if self._discrete_outputs else {}
+            cache.set(key, 'outputs', (self._outputs.asarray().copy(), disc_outs))
+
     def _apply_nonlinear(self):
         """
         Compute residuals. The model is assumed to be in a scaled state.
@@ -435,6 +515,22 @@ class ExplicitComponent(Component):
         self._check_first_linearize()
 
         with self._unscaled_context(outputs=[self._outputs], residuals=[self._residuals]):
+            cache = None if self.under_complex_step else self._eval_cache
+            if cache is not None:
+                key = cache.get_key(self._inputs, self._discrete_inputs)
+                cached = cache.get(key, 'partials')
+                if self.comm.size > 1 and not all(self.comm.allgather(cached is not None)):
+                    cached = None
+                if cached is not None:
+                    for abs_key, val in cached.items():
+                        meta = self._subjacs_info[abs_key]
+                        if isinstance(val, np.ndarray):
+                            meta['val'][:] = val
+                        else:
+                            meta['val'] = val.copy()
+                    self._jacobian._update(self)
+                    return
+
             # Computing the approximation before the call to compute_partials allows users to
             # override FD'd values.
             for approximation in self._approx_schemes.values():
@@ -444,6 +540,12 @@ class ExplicitComponent(Component):
                 # We used to negate the jacobian here, and then re-negate after the hook.
                 self._compute_partials_wrapper()
 
+            if cache is not None:
+                cache.set(key, 'partials', {abs_key: meta['val'].copy()
+                                            for abs_key, meta in self._subjacs_info.items()})
+
+            self._jacobian._update(self)
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Compute outputs given inputs. The model is assumed to be in an unscaled state.
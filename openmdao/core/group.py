@@ -179,6 +179,9 @@ class Group(System):
         Dynamic shape dependency graph, or None.
     _shape_knowns : set
         Set of shape dependency graph nodes with known (non-dynamic) shapes.
+    _approx_prune_nonlinear : bool
+        If True, nonlinear runs used to approximate total derivatives only execute the
+        subsystems that are relevant to the perturbed design variables and requested responses.
     """
 
     def __init__(self, **kwargs):
@@ -212,6 +215,7 @@ class Group(System):
         self._order_set = False
         self._shapes_graph = None
         self._shape_knowns = None
+        self._approx_prune_nonlinear = False
 
         # TODO: we cannot set the solvers with property setters at the moment
         # because our lint check thinks that we are defining new attributes
@@ -2814,7 +2818,8 @@ class Group(System):
             elif self._approx_schemes:
                 self._setup_approx_partials()
 
-    def approx_totals(self, method='fd', step=None, form=None, step_calc=None):
+    def approx_totals(self, method='fd', step=None, form=None, step_calc=None,
+                      prune_nonlinear=False):
         """
         Approximate derivatives for a Group using the specified approximation method.
 
@@ -2833,8 +2838,14 @@ class Group(System):
             Step type for finite difference, can be 'abs' for absolute', or 'rel' for
             relative. Defaults to None, in which case, the approximation method
             provides its default value.
+        prune_nonlinear : bool
+            If True and this Group is the model, each nonlinear run used to approximate the
+            total derivatives skips subsystems that are not relevant to the perturbed design
+            variables and the requested responses.  Only subsystems under a NonlinearRunOnce
+            solver are skipped.
         """
         self._has_approx = True
+        self._approx_prune_nonlinear = prune_nonlinear
         self._approx_schemes = OrderedDict()
         approx_scheme = self._get_approx_scheme(method)
 
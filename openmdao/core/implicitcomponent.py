@@ -286,6 +286,8 @@ class ImplicitComponent(Component):
 
             self._linearize_wrapper()
 
+        self._jacobian._update(self)
+
         if (jac is None or jac is self._assembled_jac) and self._assembled_jac is not None:
             self._assembled_jac._update(self)
 
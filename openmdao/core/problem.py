@@ -22,6 +22,7 @@ from openmdao.core.driver import Driver, record_iteration
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.group import Group, System
 from openmdao.core.total_jac import _TotalJacInfo
+from openmdao.core.relevance import _VOIRelevance
 from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED
 from openmdao.approximation_schemes.complex_step import ComplexStep
 from openmdao.approximation_schemes.finite_difference import FiniteDifference
@@ -931,6 +932,11 @@ class Problem(object):
             'model_ref': weakref.ref(model),  # ref to the model (needed to get out-of-scope
                                               # src data for inputs)
             'using_par_deriv_color': False,  # True if parallel derivative coloring is being used
+            'nl_rel_systems': None,  # systems relevant to the current nonlinear run, or None if
+                                     # all systems are relevant
+            'voi_changed': False,  # True if design vars or responses were added after setup
+            'solvers_changed': set(),  # pathnames of systems whose solvers were replaced after
+                                       # final_setup
         }
         model._setup(model_comm, mode, self._metadata)
 
@@ -957,6 +963,9 @@ class Problem(object):
         """
         driver = self.driver
 
+        if self._metadata['voi_changed']:
+            self._update_relevance()
+
         response_size, desvar_size = driver._update_voi_meta(self.model)
 
         # update mode if it's been set to 'auto'
@@ -968,6 +977,13 @@ class Problem(object):
 
         if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
             self.model._final_setup(self.comm)
+        else:
+            # only set up solvers that were replaced since the last final_setup
+            for path in sorted(self._metadata['solvers_changed']):
+                system = self.model._get_subsystem(path) if path else self.model
+                if system is not None:
+                    system._update_solvers()
+        self._metadata['solvers_changed'].clear()
 
         driver._setup_driver(self)
 
@@ -1019,6 +1035,28 @@ class Problem(object):
                 logger = TestLogger()
             self.check_config(logger, checks=checks)
 
+    def _update_relevance(self):
+        """
+        Recompute relevance after design vars or responses were added following setup.
+
+        Variable data, connections and vectors are unaffected by a change in design vars or
+        responses, so they are not set up again.
+        """
+        model = self.model
+        self._metadata['voi_changed'] = False
+
+        # release the relevance memoized for the old design vars and responses
+        for rel in self._metadata['relevant'].values():
+            if isinstance(rel, _VOIRelevance):
+                rel._clear_memo()
+
+        self._metadata['relevant'] = model._init_relevance(self._orig_mode)
+
+        # any existing dynamic total coloring no longer matches the design vars and responses
+        for info in (self.driver._coloring_info, model._coloring_info):
+            if info['dynamic']:
+                info['coloring'] = None
+
     def check_partials(self, out_stream=_DEFAULT_OUT_STREAM, includes=None, excludes=None,
                        compact_print=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
                        method='fd', step=None, form='forward', step_calc='abs',
@@ -1718,7 +1756,8 @@ class Problem(object):
         derivs : object
             Derivatives in form requested by 'return_format'.
         """
-        if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+        if self._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP or \
+                self._metadata['voi_changed'] or self._metadata['solvers_changed']:
             self.final_setup()
 
         if wrt is None:
@@ -1967,6 +2006,26 @@ class Problem(object):
                                    "found in the model".format(self.msginfo, name))
                 self[name] = outputs[name]
 
+    def save_setup(self, filename):
+        """
+        Save the fully set up state of this Problem to a file.
+
+        The saved Problem can be restored using openmdao.api.load_setup, which is much faster than
+        calling setup and final_setup again.  Case recorders are not saved.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file to save to.
+
+        Returns
+        -------
+        str
+            The md5 hash of the model structure.
+        """
+        from openmdao.utils.setup_cache import save_setup
+        return save_setup(self, filename)
+
     def check_config(self, logger=None, checks=_default_checks, out_file='openmdao_checks.out'):
         """
         Perform optional error checks on a Problem.
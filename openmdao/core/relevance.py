@@ -0,0 +1,703 @@
+"""
+Compute variable and system relevance using integer ids and bitsets.
+"""
+
+from collections import defaultdict
+from collections.abc import Mapping, Set
+
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix, diags
+from scipy.sparse.csgraph import breadth_first_order
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.utils.general_utils import all_ancestors
+
+
+def _owner(name):
+    """
+    Return the pathname of the system owning the given variable.
+
+    Parameters
+    ----------
+    name : str
+        Absolute variable name.
+
+    Returns
+    -------
+    str
+        Pathname of the owning system, or '' if the variable has no parent.
+    """
+    parts = name.rsplit('.', 1)
+    return '' if len(parts) == 1 else parts[0]
+
+
+class _BitNameSet(Set):
+    """
+    Read-only set of names backed by a packed bit array.
+
+    Membership testing is O(1): a dict lookup of the name's integer id followed by a
+    single bit test.
+
+    Attributes
+    ----------
+    _bits : ndarray of uint8
+        Packed bits, one for each entry in _names.
+    _names : ndarray of str
+        Names corresponding to each bit.
+    _name2id : dict
+        Mapping of name to bit index.
+    """
+
+    __slots__ = ['_bits', '_names', '_name2id']
+
+    def __init__(self, bits, names, name2id):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        bits : ndarray of uint8
+            Packed bits, one for each entry in names.
+        names : ndarray of str
+            Names corresponding to each bit.
+        name2id : dict
+            Mapping of name to bit index.
+        """
+        self._bits = bits
+        self._names = names
+        self._name2id = name2id
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, name):
+        """
+        Return True if the given name is a member of this set.
+
+        Parameters
+        ----------
+        name : str
+            Name being checked.
+
+        Returns
+        -------
+        bool
+            True if the name is in this set.
+        """
+        i = self._name2id.get(name)
+        return i is not None and bool(self._bits[i >> 3] & (128 >> (i & 7)))
+
+    def __iter__(self):
+        """
+        Yield each name in this set.
+
+        Yields
+        ------
+        str
+            Name of a member of this set.
+        """
+        yield from self._names[self._ids()]
+
+    def __len__(self):
+        """
+        Return the number of names in this set.
+
+        Returns
+        -------
+        int
+            Number of members.
+        """
+        return int(np.unpackbits(self._bits, count=self._names.size).sum())
+
+    def _ids(self):
+        """
+        Return the integer ids of the members of this set.
+
+        Returns
+        -------
+        ndarray of int
+            Ids of set members.
+        """
+        return np.flatnonzero(np.unpackbits(self._bits, count=self._names.size))
+
+    def intersection(self, *others):
+        """
+        Return a new set containing names common to this set and all others.
+
+        Parameters
+        ----------
+        *others : iterables
+            Other collections of names.
+
+        Returns
+        -------
+        set
+            Intersection of this set with all others.
+        """
+        return set(self).intersection(*others)
+
+    def union(self, *others):
+        """
+        Return a new set containing names from this set and all others.
+
+        Parameters
+        ----------
+        *others : iterables
+            Other collections of names.
+
+        Returns
+        -------
+        set
+            Union of this set with all others.
+        """
+        return set(self).union(*others)
+
+    def __repr__(self):
+        """
+        Return a string representation of this set.
+
+        Returns
+        -------
+        str
+            String representation.
+        """
+        return repr(set(self))
+
+
+class _VOIRelevance(Mapping):
+    """
+    Mapping of the relevance of a single variable of interest to all of its partner vois.
+
+    Keys are the names of the relevant design variables (or responses) for this response
+    (or design variable), plus '@all'.  Values are computed on demand from the reachability
+    bitsets stored in the owning Relevance object, and memoized since relevance is fixed
+    after setup.
+
+    Attributes
+    ----------
+    _relevance : Relevance
+        The object holding reachability data.
+    _partners : dict
+        Mapping of partner name to (desvar, response, key) tuple of unmapped voi names and
+        the name of the voi owning this mapping.
+    _all : tuple
+        Combined relevance of this voi to all of its partners.
+    _memo : dict
+        Relevance tuples already computed, keyed by partner name.
+    """
+
+    def __init__(self, relevance, partners, all_rel):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        relevance : Relevance
+            The object holding reachability data.
+        partners : dict
+            Mapping of partner name to (desvar, response, key) tuple of unmapped voi names and
+        the name of the voi owning this mapping.
+        all_rel : tuple
+            Combined relevance of this voi to all of its partners.
+        """
+        self._relevance = relevance
+        self._partners = partners
+        self._all = all_rel
+        self._memo = {}
+
+    def __getitem__(self, key):
+        """
+        Return the ({'input': set, 'output': set}, systems) relevance tuple for key.
+
+        Parameters
+        ----------
+        key : str
+            Name of the partner voi or '@all'.
+
+        Returns
+        -------
+        tuple
+            Relevant inputs and outputs dict and relevant systems.
+        """
+        if key == '@all':
+            return self._all
+        try:
+            return self._memo[key]
+        except KeyError:
+            rel = self._memo[key] = self._relevance._pair_relevance(*self._partners[key])
+            return rel
+
+    def _clear_memo(self):
+        """
+        Discard the memoized relevance tuples.
+        """
+        self._memo = {}
+
+    def __contains__(self, key):
+        """
+        Return True if key is '@all' or a relevant partner voi.
+
+        Parameters
+        ----------
+        key : str
+            Name of the partner voi or '@all'.
+
+        Returns
+        -------
+        bool
+            True if key is present.
+        """
+        return key == '@all' or key in self._partners
+
+    def __iter__(self):
+        """
+        Yield partner voi names followed by '@all'.
+
+        Yields
+        ------
+        str
+            Partner voi name or '@all'.
+        """
+        yield from self._partners
+        yield '@all'
+
+    def __len__(self):
+        """
+        Return the number of partners plus one for '@all'.
+
+        Returns
+        -------
+        int
+            Number of keys.
+        """
+        return len(self._partners) + 1
+
+
+class Relevance(object):
+    """
+    Reachability data for design variables and responses based on integer ids and bitsets.
+
+    The graph contains a node for each connected variable and each component that owns one.
+    Forward reachability from each design variable and reverse reachability from each response
+    are stored as packed bitsets, so relevance between any design variable and response is
+    a bitwise AND rather than an intersection of sets of names.
+
+    Attributes
+    ----------
+    _names : ndarray of str
+        Name of each graph node.
+    _name2id : dict
+        Mapping of node name to node id.
+    _in_bits : ndarray of uint8
+        Packed bits marking input variable nodes.
+    _out_bits : ndarray of uint8
+        Packed bits marking output variable nodes.
+    _var_sys : ndarray of int
+        Id of the owning system for each node (-1 for non-variable nodes).
+    _sys_names : ndarray of str
+        Name of each system.
+    _sys_name2id : dict
+        Mapping of system pathname to system id.
+    _sys_levels : list of ndarray
+        Lists of system ids at each depth, excluding the top level system.
+    _sys_parent : ndarray of int
+        Id of the parent of each system.
+    _top_sys : int
+        Id of the top level system.
+    _graph : csr_matrix
+        Adjacency matrix of the graph.
+    _dv_reach : dict
+        Packed forward reachability bits keyed by design variable name.
+    _res_reach : dict
+        Packed reverse reachability bits keyed by response name.
+    _pd_local : dict
+        Packed bits of local reachable nodes keyed by (voi type, name) for vois with a
+        parallel_deriv_color.
+    _local_graphs : tuple or None
+        Local node mask and adjacency matrices restricted to local nodes, computed on demand.
+    _conns : dict
+        Mapping of absolute input names to the absolute names of their connected outputs.
+    """
+
+    def __init__(self, conns, desvars, responses):
+        """
+        Build the graph and compute reachability for all design variables and responses.
+
+        Parameters
+        ----------
+        conns : dict
+            Mapping of absolute input names to the absolute names of their connected outputs.
+        desvars : dict
+            Dictionary of design variable metadata.
+        responses : dict
+            Dictionary of response variable metadata.
+        """
+        self._conns = conns
+
+        name2id = {}
+        var_types = []
+        rows = []
+        cols = []
+
+        def get_id(name, typ):
+            i = name2id.get(name)
+            if i is None:
+                i = name2id[name] = len(var_types)
+                var_types.append(typ)
+            return i
+
+        # Create a hybrid graph with components and all connected vars.  If a var is connected,
+        # also connect it to its corresponding component.  This results in a smaller graph
+        # (fewer edges) than would be the case for a pure variable graph where all inputs
+        # to a particular component would have to be connected to all outputs from that
+        # component.
+        for tgt, src in conns.items():
+            src_id = get_id(src, 1)
+            tgt_id = get_id(tgt, -1)
+            src_sys = get_id(src.rsplit('.', 1)[0], 0)
+            tgt_sys = get_id(tgt.rsplit('.', 1)[0], 0)
+            rows.extend((src_sys, tgt_id, src_id))
+            cols.extend((src_id, tgt_sys, tgt_id))
+
+        for dv in desvars:
+            if dv not in name2id:
+                dv_id = get_id(dv, 1)
+                system = _owner(dv)
+                if system:
+                    rows.append(get_id(system, 0))
+                    cols.append(dv_id)
+                else:  # this happens when a component is the model
+                    rows.append(dv_id)
+                    cols.append(get_id(system, 0))
+
+        for res in responses:
+            if res not in name2id:
+                res_id = get_id(res, 1)
+                rows.append(get_id(_owner(res), 0))
+                cols.append(res_id)
+
+        nnodes = len(var_types)
+        self._names = names = np.empty(nnodes, dtype=object)
+        names[:] = list(name2id)
+        self._name2id = name2id
+
+        var_types = np.array(var_types, dtype=np.int8)
+        self._in_bits = np.packbits(var_types < 0)
+        self._out_bits = np.packbits(var_types > 0)
+
+        # system table containing all ancestors of variable owners
+        var_ids = np.flatnonzero(var_types)
+        owners = [_owner(n) for n in names[var_ids]]
+        sys_name2id = {'': 0}
+        for owner in owners:
+            if owner not in sys_name2id:
+                for s in all_ancestors(owner):
+                    if s in sys_name2id:
+                        break
+                    sys_name2id[s] = len(sys_name2id)
+
+        self._sys_name2id = sys_name2id
+        self._sys_names = np.empty(len(sys_name2id), dtype=object)
+        self._sys_names[:] = list(sys_name2id)
+        self._top_sys = 0
+        self._var_sys = np.full(nnodes, -1, dtype=INT_DTYPE)
+        self._var_sys[var_ids] = [sys_name2id[o] for o in owners]
+
+        self._sys_parent = parents = np.full(len(sys_name2id), -1, dtype=INT_DTYPE)
+        levels = defaultdict(list)
+        for s, i in sys_name2id.items():
+            if s:
+                parents[i] = sys_name2id[_owner(s)]
+                levels[s.count('.')].append(i)
+        self._sys_levels = [np.array(levels[lev], dtype=INT_DTYPE)
+                            for lev in sorted(levels, reverse=True)]
+
+        data = np.ones(len(rows), dtype=np.int8)
+        self._graph = coo_matrix((data, (rows, cols)), shape=(nnodes, nnodes)).tocsr()
+        grev = self._graph.T.tocsr()
+
+        self._dv_reach = {dv: self._reach(self._graph, dv) for dv in desvars}
+        self._res_reach = {res: self._reach(grev, res) for res in responses}
+        self._pd_local = {}
+        self._local_graphs = None
+
+    def _reach(self, graph, start, local=None):
+        """
+        Return packed bits for all nodes reachable from start, including start itself.
+
+        Parameters
+        ----------
+        graph : csr_matrix
+            Adjacency matrix.
+        start : str
+            Name of the starting node.
+        local : ndarray of bool or None
+            If not None, only nodes marked True here are traversed.
+
+        Returns
+        -------
+        ndarray of uint8
+            Packed reachability bits.
+        """
+        mask = np.zeros(self._names.size, dtype=bool)
+        i = self._name2id[start]
+        if local is None:
+            mask[breadth_first_order(graph, i, directed=True, return_predecessors=False)] = True
+        elif local[i]:
+            mask[breadth_first_order(graph, i, directed=True, return_predecessors=False)] = True
+        return np.packbits(mask)
+
+    def add_local_reach(self, typ, name, local_vars):
+        """
+        Compute and store reachability from a voi restricted to nodes local to this proc.
+
+        Parameters
+        ----------
+        typ : str
+            Either 'desvar' or 'response'.
+        name : str
+            Name of the voi.
+        local_vars : dict
+            Mapping containing the names of local variables.
+
+        Returns
+        -------
+        ndarray of uint8
+            Packed bits of the local nodes reachable from the voi.
+        """
+        if self._local_graphs is None:
+            is_var = np.unpackbits(self._in_bits | self._out_bits, count=self._names.size)
+            local = np.array([not v or n in local_vars for n, v in zip(self._names, is_var)],
+                             dtype=bool)
+            # drop all edges touching non-local nodes
+            keep = diags(local.astype(np.int8), format='csr')
+            graph = keep @ self._graph @ keep
+            self._local_graphs = (local, graph, graph.T.tocsr())
+
+        local, fwd_graph, rev_graph = self._local_graphs
+        graph = fwd_graph if typ == 'desvar' else rev_graph
+        bits = self._pd_local[typ, name] = self._reach(graph, name, local)
+        return bits
+
+    def node_names(self, bits):
+        """
+        Return a set view of the node names marked in the given bits.
+
+        Parameters
+        ----------
+        bits : ndarray of uint8
+            Packed node bits.
+
+        Returns
+        -------
+        _BitNameSet
+            Set of node names.
+        """
+        return _BitNameSet(bits, self._names, self._name2id)
+
+    def _sys_bits(self, bits):
+        """
+        Return packed bits of all systems owning or containing the nodes marked in bits.
+
+        Parameters
+        ----------
+        bits : ndarray of uint8
+            Packed node bits.
+
+        Returns
+        -------
+        ndarray of uint8
+            Packed system bits.
+        """
+        nodes = np.flatnonzero(np.unpackbits(bits, count=self._names.size))
+        owners = self._var_sys[nodes]
+        mask = np.zeros(self._sys_names.size, dtype=bool)
+        mask[owners[owners >= 0]] = True
+        parent = self._sys_parent
+        for ids in self._sys_levels:
+            mask[parent[ids[mask[ids]]]] = True
+        mask[self._top_sys] = True  # top level Group is always relevant
+        return np.packbits(mask)
+
+    def _restriction(self, dv, res):
+        """
+        Return the local reachability bits that restrict the given pair, if any.
+
+        Parameters
+        ----------
+        dv : str
+            Design variable name.
+        res : str
+            Response name.
+
+        Returns
+        -------
+        tuple
+            (restricted voi, bits) or (None, None).
+        """
+        pd = self._pd_local
+        dv_loc = pd.get(('desvar', dv))
+        if dv_loc is not None and dv_loc.any():
+            return dv, dv_loc & self._res_reach[res]
+        res_loc = pd.get(('response', res))
+        if res_loc is not None and res_loc.any():
+            return res, res_loc & self._dv_reach[dv]
+        return None, None
+
+    def _pair_bits(self, dv, res, restrict_for):
+        """
+        Return node bits relevant to the given design var and response pair.
+
+        Parameters
+        ----------
+        dv : str
+            Design variable name.
+        res : str
+            Response name.
+        restrict_for : str
+            Name of the voi that is the key of the relevance entry.  If that voi has local
+            parallel derivative restrictions, they are applied.
+
+        Returns
+        -------
+        tuple of ndarray of uint8
+            Bits of all common nodes and of the (possibly restricted) variable nodes.
+        """
+        common = self._dv_reach[dv] & self._res_reach[res]
+        restricted, pd_bits = self._restriction(dv, res)
+        if restricted is None or restricted != restrict_for:
+            return common, common
+
+        other = res if restricted == dv else dv
+        other = self._conns.get(other, other)
+        i = self._name2id[other]
+        if pd_bits[i >> 3] & (128 >> (i & 7)):
+            return common, pd_bits
+        return common, np.zeros_like(pd_bits)
+
+    def _pair_relevance(self, dv, res, key=None):
+        """
+        Return the relevance tuple for the given design var and response pair.
+
+        Parameters
+        ----------
+        dv : str
+            Design variable name.
+        res : str
+            Response name.
+        key : str or None
+            Name of the voi that is the key of the relevance entry.
+
+        Returns
+        -------
+        tuple
+            ({'input': inputs, 'output': outputs}, systems).
+        """
+        common, var_bits = self._pair_bits(dv, res, key)
+        return ({'input': self.node_names(var_bits & self._in_bits),
+                 'output': self.node_names(var_bits & self._out_bits)},
+                _BitNameSet(self._sys_bits(common), self._sys_names, self._sys_name2id))
+
+    def relevant_pairs(self, desvars, responses):
+        """
+        Yield each (desvar, response) pair whose reachability sets intersect.
+
+        Parameters
+        ----------
+        desvars : dict
+            Dictionary of design variable metadata.
+        responses : dict
+            Dictionary of response variable metadata.
+
+        Yields
+        ------
+        tuple
+            (desvar, response) names.
+        """
+        if not desvars or not responses:
+            return
+
+        nnodes = self._names.size
+
+        def reach_matrix(reach, names):
+            cols = [np.flatnonzero(np.unpackbits(reach[n], count=nnodes)) for n in names]
+            indptr = np.zeros(len(cols) + 1, dtype=INT_DTYPE)
+            indptr[1:] = np.cumsum([c.size for c in cols])
+            return csr_matrix((np.ones(indptr[-1]), np.concatenate(cols), indptr),
+                              shape=(len(cols), nnodes))
+
+        dvnames = list(desvars)
+        resnames = list(responses)
+        overlap = (reach_matrix(self._dv_reach, dvnames) @
+                   reach_matrix(self._res_reach, resnames).T).tocoo()
+        nz = overlap.data > 0
+        for i, j in sorted(zip(overlap.row[nz], overlap.col[nz])):
+            yield dvnames[i], resnames[j]
+
+    def build(self, desvars, responses, mode):
+        """
+        Return the relevance dictionary.
+
+        Parameters
+        ----------
+        desvars : dict
+            Dictionary of design variable metadata.
+        responses : dict
+            Dictionary of response variable metadata.
+        mode : str
+            Direction of derivatives, either 'fwd' or 'rev'.
+
+        Returns
+        -------
+        dict
+            Dict of ({'outputs': dep_outputs, 'inputs': dep_inputs}, dep_systems)
+            keyed by design vars and responses.
+        """
+        conns = self._conns
+        partners = defaultdict(dict)
+
+        for dv, res in self.relevant_pairs(desvars, responses):
+            mdv = conns.get(dv, dv)
+            mres = conns.get(res, res)
+            if mode != 'rev':  # fwd or auto
+                partners[mdv][mres] = (dv, res)
+            if mode != 'fwd':  # rev or auto
+                partners[mres][mdv] = (dv, res)
+
+        voi_lists = []
+        if mode != 'rev':
+            voi_lists.append(desvars)
+        if mode != 'fwd':
+            voi_lists.append(responses)
+
+        relevant = defaultdict(dict)
+        empty = np.zeros_like(self._in_bits)
+        for inputs in voi_lists:
+            for inp in inputs:
+                inp = conns.get(inp, inp)
+                if inp in relevant:
+                    continue
+                sub = partners.get(inp, {})
+                if sub:
+                    common = empty.copy()
+                    var_bits = empty.copy()
+                    for dv, res in sub.values():
+                        c, v = self._pair_bits(dv, res, inp)
+                        common |= c
+                        var_bits |= v
+                    sys_bits = self._sys_bits(common)
+                else:
+                    var_bits = sys_bits = None
+
+                if var_bits is None:
+                    all_rel = ({'input': set(), 'output': set()}, set())
+                else:
+                    all_rel = ({'input': self.node_names(var_bits & self._in_bits),
+                                'output': self.node_names(var_bits & self._out_bits)},
+                               _BitNameSet(sys_bits, self._sys_names, self._sys_name2id))
+
+                relevant[inp] = _VOIRelevance(self, {k: (dv, res, inp)
+                                                     for k, (dv, res) in sub.items()}, all_rel)
+
+        return relevant
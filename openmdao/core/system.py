@@ -5,7 +5,7 @@ import hashlib
 import time
 
 from contextlib import contextmanager
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, ChainMap
 from collections.abc import Iterable
 from itertools import chain
 from enum import IntEnum
@@ -16,10 +16,11 @@ from fnmatch import fnmatchcase
 from numbers import Integral
 
 import numpy as np
-import networkx as nx
 
 from openmdao.core.configinfo import _ConfigInfo
-from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED, INT_DTYPE, INF_BOUND
+from openmdao.core.relevance import Relevance
+from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED, INT_DTYPE, INF_BOUND, \
+    _SetupStatus
 from openmdao.jacobians.assembled_jacobian import DenseJacobian, CSCJacobian
 from openmdao.recorders.recording_manager import RecordingManager
 from openmdao.vectors.vector import _full_slice
@@ -37,7 +38,7 @@ from openmdao.utils.indexer import indexer
 from openmdao.utils.om_warnings import issue_warning, DerivativesWarning, PromotionWarning,\
     UnusedOptionWarning, warn_deprecation
 from openmdao.utils.general_utils import determine_adder_scaler, \
-    format_as_float_or_array, ContainsAll, all_ancestors, _slice_indices, \
+    format_as_float_or_array, ContainsAll, _slice_indices, \
     make_set, match_prom_or_abs, _is_slicer_op, shape_from_idx
 from openmdao.utils.notebook_utils import notebook, tabulate
 from openmdao.approximation_schemes.complex_step import ComplexStep
@@ -2206,6 +2207,7 @@ class System(object):
         Set this system's nonlinear solver.
         """
         self._nonlinear_solver = solver
+        self._solver_changed()
 
     @property
     def linear_solver(self):
@@ -2220,6 +2222,25 @@ class System(object):
         Set this system's linear solver.
         """
         self._linear_solver = solver
+        self._solver_changed()
+
+    def _solver_changed(self):
+        """
+        Record that a solver was replaced after final_setup so it can be set up separately.
+        """
+        if self._problem_meta is not None and \
+                self._problem_meta['setup_status'] >= _SetupStatus.POST_FINAL_SETUP:
+            self._problem_meta['solvers_changed'].add(self.pathname)
+
+    def _update_solvers(self):
+        """
+        Set up the solvers and jacobians of this system after its solvers were replaced.
+        """
+        self._setup_solvers()
+        self._setup_solver_print()
+        if self._use_derivatives:
+            self._assembled_jac = None
+            self._setup_jacobians()
 
     @property
     def _force_alloc_complex(self):
@@ -2555,6 +2576,25 @@ class System(object):
                                    ['ref', 'ref0', 'scaler', 'adder', 'upper', 'lower'])
 
         design_vars[name] = dv
+        self._voi_added(name, dv, self._design_vars)
+
+    def _voi_added(self, name, meta, vois):
+        """
+        Make a design var or response added after setup visible without another full setup.
+
+        Parameters
+        ----------
+        name : str
+            Name of the design var or response.
+        meta : dict
+            Metadata of the design var or response.
+        vois : dict
+            The dynamic design var or response dict of this system.
+        """
+        if self._problem_meta is not None and self._problem_meta['static_mode']:
+            vois[name] = meta
+            # relevance must be recomputed during the next final_setup
+            self._problem_meta['voi_changed'] = True
 
     def add_response(self, name, type_, lower=None, upper=None, equals=None,
                      ref=None, ref0=None, indices=None, index=None, units=None,
@@ -2735,6 +2775,7 @@ class System(object):
         self._check_voi_meta_sizes(resp_types[resp['type']], resp, resp_size_checks[resp['type']])
 
         responses[name] = resp
+        self._voi_added(name, resp, self._responses)
 
     def add_constraint(self, name, lower=None, upper=None, equals=None,
                        ref=None, ref0=None, adder=None, scaler=None, units=None,
@@ -4930,135 +4971,33 @@ class System(object):
             keyed by design vars and responses.
         """
         conns = self._conn_global_abs_in2out
-        relevant = defaultdict(dict)
-
-        # Create a hybrid graph with components and all connected vars.  If a var is connected,
-        # also connect it to its corresponding component.  This results in a smaller graph
-        # (fewer edges) than would be the case for a pure variable graph where all inputs
-        # to a particular component would have to be connected to all outputs from that component.
-        graph = nx.DiGraph()
-        for tgt, src in conns.items():
-            if src not in graph:
-                graph.add_node(src, type_='out')
-            graph.add_node(tgt, type_='in')
-
-            src_sys = src.rsplit('.', 1)[0]
-            graph.add_edge(src_sys, src)
-
-            tgt_sys = tgt.rsplit('.', 1)[0]
-            graph.add_edge(tgt, tgt_sys)
-
-            graph.add_edge(src, tgt)
-
-        for dv in desvars:
-            if dv not in graph:
-                graph.add_node(dv, type_='out')
-                parts = dv.rsplit('.', 1)
-                if len(parts) == 1:
-                    system = ''  # this happens when a component is the model
-                    graph.add_edge(dv, system)
-                else:
-                    system = parts[0]
-                    graph.add_edge(system, dv)
-
-        for res in responses:
-            if res not in graph:
-                graph.add_node(res, type_='out')
-                parts = res.rsplit('.', 1)
-                if len(parts) == 1:
-                    system = ''  # this happens when a component is the model
-                else:
-                    system = parts[0]
-                graph.add_edge(system, res)
-
-        nodes = graph.nodes
-        grev = graph.reverse(copy=False)
-        rescache = {}
-        pd_dv_locs = {}  # local nodes dependent on a par deriv desvar
-        pd_res_locs = {}  # local nodes dependent on a par deriv response
-        pd_common = defaultdict(dict)
-        # for each par deriv color, keep list of all local dep nodes for each var
-        pd_err_chk = defaultdict(dict)
+        relevance = Relevance(conns, desvars, responses)
 
-        for desvar, dvmeta in desvars.items():
-            dvset = set(self.all_connected_nodes(graph, desvar))
-            parallel_deriv_color = dvmeta.get('parallel_deriv_color')
-            if parallel_deriv_color:
-                pd_dv_locs[desvar] = set(self.all_connected_nodes(graph, desvar, local=True))
-                pd_err_chk[parallel_deriv_color][desvar] = pd_dv_locs[desvar]
-
-            for response, resmeta in responses.items():
-                if response not in rescache:
-                    rescache[response] = set(self.all_connected_nodes(grev, response))
-                    parallel_deriv_color = resmeta.get('parallel_deriv_color')
-                    if parallel_deriv_color:
-                        pd_res_locs[response] = set(self.all_connected_nodes(grev, response,
-                                                                             local=True))
-                        pd_err_chk[parallel_deriv_color][response] = pd_res_locs[response]
-
-                common = dvset.intersection(rescache[response])
-
-                if common:
-                    dv = conns[desvar] if desvar in conns else desvar
-                    r = conns[response] if response in conns else response
-                    if desvar in pd_dv_locs and pd_dv_locs[desvar]:
-                        pd_common[dv][r] = pd_dv_locs[desvar].intersection(rescache[response])
-                    elif response in pd_res_locs and pd_res_locs[response]:
-                        pd_common[r][dv] = pd_res_locs[response].intersection(dvset)
-
-                    input_deps = set()
-                    output_deps = set()
-                    sys_deps = set()
-                    for node in common:
-                        if 'type_' in nodes[node]:
-                            typ = nodes[node]['type_']
-                            parts = node.rsplit('.', 1)
-                            if len(parts) == 1:
-                                system = ''
-                            else:
-                                system = parts[0]
-                            if typ == 'in':  # input var
-                                input_deps.add(node)
-                                if system not in sys_deps:
-                                    sys_deps.update(all_ancestors(system))
-                            else:  # output var
-                                output_deps.add(node)
-                                if system not in sys_deps:
-                                    sys_deps.update(all_ancestors(system))
-
-                elif desvar == response:
-                    input_deps = set()
-                    output_deps = set([response])
-                    parts = desvar.rsplit('.', 1)
-                    sys_deps = set(all_ancestors('' if len(parts) == 1 else parts[0]))
-
-                if common or desvar == response:
-                    desvar = conns[desvar] if desvar in conns else desvar
-                    response = conns[response] if response in conns else response
-                    if mode != 'rev':  # fwd or auto
-                        relevant[desvar][response] = ({'input': input_deps,
-                                                       'output': output_deps}, sys_deps)
-                    if mode != 'fwd':  # rev or auto
-                        relevant[response][desvar] = ({'input': input_deps,
-                                                       'output': output_deps}, sys_deps)
-
-                    sys_deps.add('')  # top level Group is always relevant
-
-        dvcache = None
-        rescache = None
-
-        if pd_dv_locs or pd_res_locs:
+        pd_err_chk = defaultdict(dict)
+        for vois, typ in ((desvars, 'desvar'), (responses, 'response')):
+            for name, meta in vois.items():
+                parallel_deriv_color = meta.get('parallel_deriv_color')
+                if parallel_deriv_color:
+                    local_vars = ChainMap(self._var_abs2meta['input'],
+                                          self._var_abs2meta['output'])
+                    pd_err_chk[parallel_deriv_color][name] = \
+                        relevance.add_local_reach(typ, name, local_vars)
+
+        if pd_err_chk:
             # check to make sure we don't have any overlapping dependencies between vars of the
             # same color
             vtype = 'design variable' if mode == 'fwd' else 'response'
             err = (None, None)
             for pdcolor, dct in pd_err_chk.items():
-                seen = set()
-                for vname, nodes in dct.items():
-                    if seen.intersection(nodes):
+                seen = None
+                for vname, bits in dct.items():
+                    if seen is None:
+                        seen = bits.copy()
+                    elif np.any(seen & bits):
                         err = (vname, pdcolor)
                         break
-                    seen.update(nodes)
+                    else:
+                        seen |= bits
 
             all_errs = self.comm.allgather(err)
             for n, color in all_errs:
@@ -5067,57 +5006,7 @@ class System(object):
                                        f" on the same rank with other {vtype}s in "
                                        f"parallel_deriv_color '{color}'.")
 
-            # we have some parallel deriv colors, so update relevance entries to throw out
-            # any dependencies that aren't on the same rank.
-            if pd_common:
-                for inp, sub in relevant.items():
-                    for out, tup in sub.items():
-                        meta = tup[0]
-                        if inp in pd_common:
-                            meta['input'] = meta['input'].intersection(pd_common[inp][out])
-                            meta['output'] = meta['output'].intersection(pd_common[inp][out])
-                            if out not in meta['output']:
-                                meta['input'] = set()
-                                meta['output'] = set()
-
-        voi_lists = []
-        if mode != 'rev':
-            voi_lists.append((desvars, responses))
-        if mode != 'fwd':
-            voi_lists.append((responses, desvars))
-
-        # now calculate dependencies between each VOI and all other VOIs of the
-        # other type, e.g for each input VOI wrt all output VOIs.  This is only
-        # done for design vars in fwd mode or responses in rev mode. In auto mode,
-        # we combine the results for fwd and rev modes.
-        for inputs, outputs in voi_lists:
-            for inp in inputs:
-                if inp in conns:
-                    inp = conns[inp]
-                relinp = relevant[inp]
-                if relinp:
-                    if '@all' in relinp:
-                        dct, total_systems = relinp['@all']
-                        total_inps = dct['input']
-                        total_outs = dct['output']
-                    else:
-                        total_inps = set()
-                        total_outs = set()
-                        total_systems = set()
-
-                    for out in outputs:
-                        if out in relinp:
-                            dct, systems = relinp[out]
-                            total_inps.update(dct['input'])
-                            total_outs.update(dct['output'])
-                            total_systems.update(systems)
-
-                    relinp['@all'] = ({'input': total_inps, 'output': total_outs},
-                                      total_systems)
-                else:
-                    relinp['@all'] = ({'input': set(), 'output': set()}, set())
-
-        return relevant
+        return relevance.build(desvars, responses, mode)
 
     def all_connected_nodes(self, graph, start, local=False):
         """
@@ -67,6 +67,50 @@ class TestGroupFiniteDifference(unittest.TestCase):
         # 1 output x 2 inputs
         self.assertEqual(len(model._approx_schemes['fd']._wrt_meta), 2)
 
+    def test_prune_nonlinear(self):
+
+        class CountComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', val=0.0)
+                self.add_output('y', val=0.0)
+                self.count = 0
+
+            def compute(self, inputs, outputs):
+                outputs['y'] = 3.0 * inputs['x'] ** 2
+                self.count += 1
+
+        for prune in (False, True):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('p1', om.IndepVarComp('x1', 2.0))
+            model.add_subsystem('p2', om.IndepVarComp('x2', 5.0))
+            model.add_subsystem('c1', CountComp())
+            model.add_subsystem('c2', CountComp())
+            model.connect('p1.x1', 'c1.x')
+            model.connect('p2.x2', 'c2.x')
+            model.add_design_var('p1.x1')
+            model.add_design_var('p2.x2')
+            model.add_objective('c1.y')
+            model.add_constraint('c2.y', upper=0.0)
+
+            model.approx_totals(prune_nonlinear=prune)
+
+            prob.setup(mode='fwd')
+            prob.run_model()
+
+            model.c1.count = model.c2.count = 0
+            derivs = prob.compute_totals()
+
+            assert_near_equal(derivs['c1.y', 'p1.x1'], [[12.0]], 1e-5)
+            assert_near_equal(derivs['c2.y', 'p2.x2'], [[30.0]], 1e-5)
+            assert_near_equal(derivs['c1.y', 'p2.x2'], [[0.0]], 1e-5)
+            assert_near_equal(derivs['c2.y', 'p1.x1'], [[0.0]], 1e-5)
+
+            # each FD step only runs the component downstream of the perturbed design var
+            expected = 1 if prune else 2
+            self.assertEqual(model.c1.count, expected)
+            self.assertEqual(model.c2.count, expected)
+
     def test_fd_count(self):
         # Make sure we aren't doing extra FD steps.
 
@@ -11,6 +11,7 @@ from io import StringIO
 
 from numpy.testing import assert_almost_equal
 import scipy
+from scipy.sparse import issparse
 try:
     from scipy.sparse import load_npz
 except ImportError:
@@ -18,7 +19,8 @@ except ImportError:
 
 import openmdao.api as om
 from openmdao.utils.general_utils import set_pyoptsparse_opt
-from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz, compute_total_coloring
+from openmdao.utils.coloring import Coloring, _compute_coloring, array_viz, compute_total_coloring, \
+    dynamic_total_coloring
 from openmdao.utils.mpi import MPI
 from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.test_suite.tot_jac_builder import TotJacBuilder
@@ -1295,5 +1297,97 @@ class SimulColoringConfigCheckTestCase(unittest.TestCase):
         self.assertEqual(str(ctx.exception), "'comp' <class DumbComp>: Current coloring configuration does not match the configuration of the current model.\n   The following variables have changed sizes: ['y', 'y_in'].\nMake sure you don't have different problems that have the same coloring directory. Set the coloring directory by setting the value of problem.options['coloring_dir'].")
 
 
+class ArrowheadComp(om.ExplicitComponent):
+    """
+    Component with an arrowhead shaped total jacobian wrt x and w.
+    """
+
+    def initialize(self):
+        self.options.declare('n', types=int)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('x', np.ones(n))
+        self.add_input('w', 1.0)
+        self.add_output('f', 0.0)
+        self.add_output('c', np.ones(n))
+
+        ar = np.arange(n)
+        self.declare_partials('f', ['x', 'w'])
+        self.declare_partials('c', 'x', rows=ar, cols=ar)
+        self.declare_partials('c', 'w')
+
+    def compute(self, inputs, outputs):
+        x = inputs['x']
+        w = inputs['w']
+        outputs['f'] = np.sum(x ** 2) * w
+        outputs['c'] = x ** 3 + 2.0 * w ** 2
+
+    def compute_partials(self, inputs, partials):
+        x = inputs['x']
+        w = inputs['w']
+        partials['f', 'x'] = 2.0 * x * w
+        partials['f', 'w'] = np.sum(x ** 2)
+        partials['c', 'x'] = 3.0 * x ** 2
+        partials['c', 'w'] = 4.0 * w
+
+
+@use_tempdirs
+class SimulColoringCSRTestCase(unittest.TestCase):
+
+    def test_csr_totals(self):
+        n = 6
+        for mode, modes in [('fwd', ('fwd',)), ('rev', ('rev',)), ('auto', ('fwd', 'rev'))]:
+            with self.subTest(mode=mode):
+                prob = om.Problem()
+                model = prob.model
+                model.add_subsystem('arrow', ArrowheadComp(n=n), promotes=['*'])
+                model.add_design_var('x', ref=2.0)
+                model.add_design_var('w', scaler=3.0)
+                model.add_objective('f', ref=10.0)
+                model.add_constraint('c', upper=0.0, scaler=np.arange(1., n + 1))
+
+                prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP')
+                prob.driver.declare_coloring()
+                prob.setup(mode=mode)
+                prob.set_val('x', np.arange(1., n + 1))
+                prob.set_val('w', 1.5)
+                prob.run_model()
+
+                coloring = dynamic_total_coloring(prob.driver, run_model=False)
+                self.assertEqual(coloring.modes(), modes)
+
+                prob.driver._total_jac = None
+                J = prob.driver._compute_totals(return_format='array')
+
+                prob.driver._total_jac = None
+                for i in range(2):
+                    Jcsr = prob.driver._compute_totals(return_format='csr')
+
+                    # the nonzeros of the coloring are computed without a dense jacobian
+                    self.assertTrue(issparse(prob.driver._total_jac.J))
+                    self.assertEqual(Jcsr.format, 'csr')
+                    self.assertEqual(Jcsr.nnz, 3 * n + 1)
+                    assert_almost_equal(Jcsr.toarray(), J)
+
+    def test_csr_totals_no_coloring(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('arrow', ArrowheadComp(n=3), promotes=['*'])
+        model.add_design_var('x')
+        model.add_design_var('w')
+        model.add_objective('f')
+        model.add_constraint('c', upper=0.0)
+        prob.setup()
+        prob.run_model()
+
+        J = prob.driver._compute_totals(return_format='array')
+        prob.driver._total_jac = None
+        Jcsr = prob.driver._compute_totals(return_format='csr')
+
+        self.assertEqual(Jcsr.format, 'csr')
+        assert_almost_equal(Jcsr.toarray(), J)
+
+
 if __name__ == '__main__':
     unittest.main()
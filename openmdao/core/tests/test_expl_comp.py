@@ -16,6 +16,7 @@ from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
 from openmdao.utils.assert_utils import assert_warning, assert_near_equal
 from openmdao.utils.general_utils import printoptions, remove_whitespace
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 # Note: The following class definitions are used in feature docs
 
@@ -1146,6 +1147,135 @@ class ExplCompTestCase(unittest.TestCase):
         self.assertEqual(prob.model.cycle.d2.iter_count_apply, 10)
 
 
+class CountingParaboloid(om.ExplicitComponent):
+    """
+    Paraboloid that counts calls to compute and compute_partials.
+    """
+
+    def setup(self):
+        self.add_input('x', val=0.0)
+        self.add_input('y', val=0.0)
+        self.add_output('f_xy', val=0.0)
+        self.declare_partials('*', '*')
+        self.compute_count = 0
+        self.partials_count = 0
+
+    def compute(self, inputs, outputs):
+        self.compute_count += 1
+        x = inputs['x']
+        y = inputs['y']
+        outputs['f_xy'] = (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0
+
+    def compute_partials(self, inputs, partials):
+        self.partials_count += 1
+        partials['f_xy', 'x'] = 2.0 * inputs['x'] - 6.0 + inputs['y']
+        partials['f_xy', 'y'] = 2.0 * inputs['y'] + 8.0 + inputs['x']
+
+
+class ScaleComp(om.ExplicitComponent):
+    """
+    Computes y = scale * x and counts calls to compute.
+    """
+
+    def initialize(self):
+        self.options.declare('scale', default=2.0)
+
+    def setup(self):
+        self.add_input('x', val=1.0)
+        self.add_output('y', val=0.0)
+        self.compute_count = 0
+
+    def compute(self, inputs, outputs):
+        self.compute_count += 1
+        outputs['y'] = self.options['scale'] * inputs['x']
+
+
+@use_tempdirs
+class ExplCompCacheTestCase(unittest.TestCase):
+
+    def _build(self, **options):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', CountingParaboloid(**options), promotes=['*'])
+        prob.setup()
+        return prob, comp
+
+    def test_compute_cache(self):
+        prob, comp = self._build(cache_size=2)
+
+        for x, y in [(1., 2.), (3., 4.), (1., 2.), (5., 6.), (3., 4.), (1., 2.)]:
+            prob['x'] = x
+            prob['y'] = y
+            prob.run_model()
+            expected = (x - 3.0)**2 + x * y + (y + 4.0)**2 - 3.0
+            assert_near_equal(prob['f_xy'], expected)
+
+        # (1, 2) was a hit, (3, 4) was evicted by (5, 6), then (1, 2) was evicted by (3, 4)
+        self.assertEqual(comp.compute_count, 5)
+        self.assertEqual(comp._eval_cache.hits, 1)
+        self.assertEqual(len(comp._eval_cache), 2)
+
+    def test_partials_cache(self):
+        prob, comp = self._build(cache_size=10)
+
+        for x, y in [(1., 2.), (3., 4.), (1., 2.)]:
+            prob['x'] = x
+            prob['y'] = y
+            prob.run_model()
+            J = prob.compute_totals(of=['f_xy'], wrt=['x', 'y'])
+            assert_near_equal(J['f_xy', 'x'], [[2.0 * x - 6.0 + y]])
+            assert_near_equal(J['f_xy', 'y'], [[2.0 * y + 8.0 + x]])
+
+        self.assertEqual(comp.compute_count, 2)
+        self.assertEqual(comp.partials_count, 2)
+
+    def test_no_cache(self):
+        prob, comp = self._build()
+        self.assertIsNone(comp._eval_cache)
+
+        for i in range(3):
+            prob.run_model()
+
+        self.assertEqual(comp.compute_count, 3)
+
+    def test_cache_file(self):
+        prob, comp = self._build(cache_file='comp_cache')
+        prob['x'] = 2.
+        prob.run_model()
+        self.assertEqual(comp.compute_count, 1)
+
+        # a new problem picks up the results persisted by the first one
+        prob, comp = self._build(cache_file='comp_cache')
+        prob['x'] = 2.
+        prob.run_model()
+        self.assertEqual(comp.compute_count, 0)
+        assert_near_equal(prob['f_xy'], 14.0)
+
+    def test_cache_file_shared(self):
+        # components sharing a cache file must not see each other's results
+        prob = om.Problem()
+        prob.model.add_subsystem('a', ScaleComp(scale=2.0, cache_file='comp_cache'),
+                                 promotes_inputs=['x'])
+        prob.model.add_subsystem('b', ScaleComp(scale=3.0, cache_file='comp_cache'),
+                                 promotes_inputs=['x'])
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob['a.y'], 2.0)
+        assert_near_equal(prob['b.y'], 3.0)
+        self.assertEqual(prob.model.b.compute_count, 1)
+
+    def test_cache_file_options_changed(self):
+        # persisted results are not reused if the options of the component change
+        for scale in (2.0, 3.0):
+            prob = om.Problem()
+            comp = prob.model.add_subsystem('comp', ScaleComp(scale=scale,
+                                                              cache_file='comp_cache'))
+            prob.setup()
+            prob.run_model()
+            assert_near_equal(prob['comp.y'], scale)
+            self.assertEqual(comp.compute_count, 1)
+
+
 @unittest.skipUnless(MPI, "MPI is required.")
 class TestMPIExplComp(unittest.TestCase):
     N_PROCS = 3
@@ -1240,5 +1370,33 @@ class TestMPIExplComp(unittest.TestCase):
                 if line and not line.startswith('-'):
                     self.assertEqual(remove_whitespace(text[i]), remove_whitespace(line))
 
+    def test_cache_hit_on_some_procs(self):
+        class AllSumComp(om.ExplicitComponent):
+
+            def setup(self):
+                self.add_input('x', val=1.0)
+                self.add_output('y', val=0.0)
+                self.compute_count = 0
+
+            def compute(self, inputs, outputs):
+                self.compute_count += 1
+                outputs['y'] = self.comm.allreduce(inputs['x'][0])
+
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', AllSumComp(cache_size=2, cache_file='cache'))
+        prob.setup()
+        prob.run_model()
+
+        # a cache file is not used under MPI
+        self.assertIsNone(comp._eval_cache._filename)
+
+        # a miss on any proc means every proc must compute, or the allreduce would hang
+        if self.comm.rank > 0:
+            comp._eval_cache.clear()
+        prob.run_model()
+
+        self.assertEqual(comp.compute_count, 2)
+        assert_near_equal(prob['comp.y'], self.N_PROCS)
+
 if __name__ == '__main__':
     unittest.main()
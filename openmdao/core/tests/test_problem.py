@@ -10,7 +10,8 @@ import numpy as np
 import openmdao.api as om
 from openmdao.core.driver import Driver
 from openmdao.test_suite.components.paraboloid import Paraboloid
-from openmdao.test_suite.components.sellar import SellarDerivatives, SellarDerivativesConnected
+from openmdao.test_suite.components.sellar import SellarDerivatives, SellarDerivativesConnected, \
+    SellarDerivativesGrouped
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 import openmdao.utils.hooks as hooks
 from openmdao.utils.units import convert_units
@@ -1541,6 +1542,21 @@ class TestProblem(unittest.TestCase):
         self.assertEqual(outputs, indep1_outs | indep2_outs)
         self.assertEqual(systems, indep1_sys | indep2_sys)
 
+        # entries are computed once
+        self.assertIs(relevant['C8.y']['indep1.x'], relevant['C8.y']['indep1.x'])
+
+        # membership checks on the relevance entries
+        self.assertIn('G2.C5', systems)
+        self.assertNotIn('C4', systems)
+        self.assertNotIn('Unconnected', systems)
+        self.assertIn('indep1.x', relevant['C8.y'])
+        self.assertNotIn('indep1.x', relevant['Unconnected.y'])
+
+        dct, systems = relevant['Unconnected.y']['@all']
+        self.assertEqual(dct['input'], set())
+        self.assertEqual(dct['output'], set())
+        self.assertEqual(systems, set())
+
     def test_relevance_with_component_model(self):
         # Test relevance when model is a Component
         SOLVE_Y1 = False
@@ -2198,5 +2214,93 @@ class SystemInTwoProblemsTestCase(unittest.TestCase):
         np.testing.assert_allclose(prob['C2.y'], 3.0)
 
 
+class IncrementalSetupTestCase(unittest.TestCase):
+
+    def _check_totals(self, prob, expected_prob):
+        totals = prob.compute_totals()
+        expected = expected_prob.compute_totals()
+        self.assertEqual(list(totals), list(expected))
+        for key, val in expected.items():
+            assert_near_equal(totals[key], val, 1e-6)
+
+    def test_add_vois_after_setup(self):
+        prob = om.Problem(SellarDerivatives())
+        prob.model.add_design_var('x', lower=0, upper=10)
+        prob.model.add_objective('obj')
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals()
+
+        outputs = prob.model._outputs
+        relevant = prob._metadata['relevant']
+        rel = relevant[next(iter(relevant))]
+        partner = next(iter(rel._partners))
+        self.assertIs(rel[partner], rel[partner])
+
+        prob.model.add_design_var('z', lower=-10, upper=10)
+        prob.model.add_constraint('con1', upper=0)
+        prob.model.add_constraint('con2', upper=0)
+
+        expected = om.Problem(SellarDerivatives())
+        expected.model.add_design_var('x', lower=0, upper=10)
+        expected.model.add_design_var('z', lower=-10, upper=10)
+        expected.model.add_objective('obj')
+        expected.model.add_constraint('con1', upper=0)
+        expected.model.add_constraint('con2', upper=0)
+        expected.set_solver_print(level=0)
+        expected.setup()
+        expected.run_model()
+
+        self._check_totals(prob, expected)
+        self.assertEqual(list(prob.driver._designvars), ['x', 'z'])
+        self.assertEqual(list(prob.driver._cons), ['con_cmp1.con1', 'con_cmp2.con2'])
+
+        # vectors were not set up again
+        self.assertIs(prob.model._outputs, outputs)
+
+        # the relevance of the old vois was replaced
+        self.assertIsNot(prob._metadata['relevant'], relevant)
+        self.assertEqual(rel._memo, {})
+
+    def test_swap_solvers_after_final_setup(self):
+        prob = om.Problem(SellarDerivativesGrouped())
+        prob.model.add_design_var('x', lower=0, upper=10)
+        prob.model.add_design_var('z', lower=-10, upper=10)
+        prob.model.add_objective('obj')
+        prob.model.add_constraint('con1', upper=0)
+        prob.set_solver_print(level=0)
+        prob.setup()
+        prob.run_model()
+        prob.compute_totals()
+
+        outputs = prob.model._outputs
+
+        prob.model.linear_solver = om.DirectSolver()
+        prob.model.mda.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        prob.model.mda.linear_solver = om.DirectSolver(assemble_jac=True)
+        self.assertEqual(prob._metadata['solvers_changed'], {'', 'mda'})
+
+        prob['x'] = 2.0
+        prob.run_model()
+        self.assertEqual(prob._metadata['solvers_changed'], set())
+        self.assertIs(prob.model._outputs, outputs)
+        self.assertIsNotNone(prob.model.mda._assembled_jac)
+        self.assertIs(prob.model.mda.nonlinear_solver._system(), prob.model.mda)
+
+        expected = om.Problem(SellarDerivativesGrouped())
+        expected.model.add_design_var('x', lower=0, upper=10)
+        expected.model.add_design_var('z', lower=-10, upper=10)
+        expected.model.add_objective('obj')
+        expected.model.add_constraint('con1', upper=0)
+        expected.set_solver_print(level=0)
+        expected.setup()
+        expected['x'] = 2.0
+        expected.run_model()
+
+        assert_near_equal(prob['obj'], expected['obj'], 1e-6)
+        self._check_totals(prob, expected)
+
+
 if __name__ == "__main__":
     unittest.main()
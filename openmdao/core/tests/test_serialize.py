@@ -1,10 +1,17 @@
 import unittest
+import weakref
 
 import openmdao.api as om
 
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
 
+class Referent(object):
+    pass
+
+
 class BadOptionComp(om.ExplicitComponent):
 
     def initialize(self):
@@ -28,5 +35,99 @@ class SerializeTestCase(unittest.TestCase):
         om.n2(p, show_browser=False)
 
 
+@use_tempdirs
+class SaveSetupTestCase(unittest.TestCase):
+
+    def _build_problem(self):
+        prob = om.Problem(SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.DirectSolver()
+
+        model.add_design_var('x', lower=0, upper=10)
+        model.add_design_var('z', lower=[-10.0, 0.0], upper=[10.0, 10.0])
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0)
+        model.add_constraint('con2', upper=0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+        prob.set_solver_print(level=0)
+
+        return prob
+
+    def test_save_load(self):
+        prob = self._build_problem()
+        prob.setup()
+        md5_hash = prob.save_setup('sellar_setup.pkl')
+
+        loaded = om.load_setup('sellar_setup.pkl', md5_hash=md5_hash)
+
+        # values set on the loaded problem must reach the model
+        loaded['x'] = 2.0
+        loaded.run_model()
+        prob['x'] = 2.0
+        prob.run_model()
+        assert_near_equal(loaded['obj'], prob['obj'], 1e-10)
+
+        loaded.run_driver()
+        prob.run_driver()
+        assert_near_equal(loaded['obj'], 3.18339395, 1e-6)
+        assert_near_equal(loaded['z'], prob['z'], 1e-6)
+
+        totals = loaded.compute_totals()
+        expected = prob.compute_totals()
+        for key, val in expected.items():
+            assert_near_equal(totals[key], val, 1e-8)
+
+        self.assertIs(loaded.model._problem_meta['model_ref'](), loaded.model)
+        self.assertIs(loaded.driver._problem(), loaded)
+
+    def test_weakrefs(self):
+        prob = self._build_problem()
+        prob.setup()
+
+        referent = Referent()
+        referent.val = 3
+        prob.model.only_ref = weakref.ref(referent)
+        prob.model.dead_ref = weakref.ref(Referent())
+        self.assertIsNone(prob.model.dead_ref())
+
+        prob.save_setup('sellar_setup.pkl')
+        del referent
+
+        loaded = om.load_setup('sellar_setup.pkl')
+
+        self.assertIsNone(loaded.model.dead_ref())
+        # the referent was alive when saved, so it is kept alive with the loaded problem
+        self.assertEqual(loaded.model.only_ref().val, 3)
+
+    def test_recorders_not_saved(self):
+        prob = self._build_problem()
+        prob.driver.add_recorder(om.SqliteRecorder('orig.sql'))
+        prob.setup()
+        prob.save_setup('sellar_setup.pkl')
+
+        loaded = om.load_setup('sellar_setup.pkl')
+        self.assertEqual(list(loaded.driver._rec_mgr), [])
+
+        loaded.driver.add_recorder(om.SqliteRecorder('loaded.sql'))
+        loaded.run_driver()
+        loaded.cleanup()
+
+        cases = om.CaseReader('loaded.sql').list_cases('driver', out_stream=None)
+        self.assertTrue(len(cases) > 0)
+
+    def test_hash_mismatch(self):
+        prob = self._build_problem()
+        prob.setup()
+        prob.save_setup('sellar_setup.pkl')
+
+        with self.assertRaises(RuntimeError) as cm:
+            om.load_setup('sellar_setup.pkl', md5_hash='bad_hash')
+
+        self.assertTrue(str(cm.exception).startswith("Model structure hash of setup file "
+                                                     "'sellar_setup.pkl'"))
+
+
 if __name__ == '__main__':
     unittest.main()
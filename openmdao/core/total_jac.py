@@ -10,6 +10,7 @@ import sys
 import time
 
 import numpy as np
+from scipy.sparse import csr_matrix, issparse
 
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.general_utils import ContainsAll, _prom2ivc_src_dict
@@ -48,14 +49,15 @@ class _TotalJacInfo(object):
         If True, this total jacobian contains linear constraints.
     idx_iter_dict : dict
         A dict containing an entry for each outer iteration of the total jacobian computation.
-    J : ndarray
-        The dense array form of the total jacobian.
+    J : ndarray or csr_matrix
+        The dense array form of the total jacobian, or a csr_matrix with the nonzero structure
+        of the total coloring if return_format is 'csr' and the sparse path is active.
     J_dict : dict
         Nested or flat dict with views of the jacobian.
     J_final : ndarray or dict
-        If return_format is 'array', Jfinal is J.  Otherwise it's either a nested dict (if
-        return_format is 'dict') or a flat dict (return_format 'flat_dict') with views into
-        the array jacobian.
+        If return_format is 'array' or 'csr', Jfinal is J.  Otherwise it's either a nested
+        dict (if return_format is 'dict') or a flat dict (return_format 'flat_dict') with views
+        into the array jacobian.
     lin_sol_cache : dict
         Dict of indices keyed to solution vectors.
     mode : str
@@ -84,9 +86,15 @@ class _TotalJacInfo(object):
         This is used for debug printing.
     return_format : str
         Indicates the desired return format of the total jacobian. Can have value of
-        'array', 'dict', or 'flat_dict'.
+        'array', 'csr', 'dict', or 'flat_dict'.
     simul_coloring : Coloring or None
         Contains all data necessary to simultaneously solve for groups of total derivatives.
+    csr_data_map : dict or None
+        If J is a csr_matrix, a mapping of mode to a list giving, for each column (fwd) or
+        row (rev) solved with the coloring, the positions of its nonzeros in J.data.
+        Otherwise None.
+    csr_scaler : ndarray or None
+        Driver scaling factor for each entry of J.data, if J is a csr_matrix with scaling.
     _dist_driver_vars : dict
         Dict of constraints that are distributed outputs. Key is abs variable name, values are
         (local indices, local sizes).
@@ -109,7 +117,8 @@ class _TotalJacInfo(object):
             If True, names in of and wrt are absolute names.
         return_format : str
             Indicates the desired return format of the total jacobian. Can have value of
-            'array', 'dict', or 'flat_dict'.
+            'array', 'csr', 'dict', or 'flat_dict'.  For 'csr', the jacobian is computed
+            directly into the nonzero structure of the total coloring if possible.
         approx : bool
             If True, the object will compute approx total jacobians.
         debug_print : bool
@@ -277,9 +286,15 @@ class _TotalJacInfo(object):
         self.of_meta, self.of_size = self._get_tuple_map(of, responses, abs2meta_out)
         self.wrt_meta, self.wrt_size = self._get_tuple_map(wrt, design_vars, abs2meta_out)
 
-        # always allocate a 2D dense array and we can assign views to dict keys later if
-        # return format is 'dict' or 'flat_dict'.
-        self.J = J = np.zeros((self.of_size, self.wrt_size))
+        self.csr_data_map = self.csr_scaler = None
+        if return_format == 'csr' and not approx and self.simul_coloring is not None and \
+                self.comm.size == 1:
+            # only the nonzeros of the coloring are ever set, so the dense array is not needed.
+            self.J = J = self._get_csr_J(modes)
+        else:
+            # always allocate a 2D dense array and we can assign views to dict keys later if
+            # return format is 'dict' or 'flat_dict'.
+            self.J = J = np.zeros((self.of_size, self.wrt_size))
 
         if not self.get_remote:
             abs2meta = model._var_allprocs_abs2meta['output']
@@ -333,9 +348,11 @@ class _TotalJacInfo(object):
                 self._compute_jac_scatters('rev', J.shape[1], get_remote)
 
         # for dict type return formats, map var names to views of the Jacobian array.
-        if return_format == 'array':
+        if return_format in ('array', 'csr'):
             self.J_final = J
-            if self.has_scaling or approx:
+            if self.csr_data_map is not None:
+                self.J_dict = None
+            elif self.has_scaling or approx:
                 # for array return format, create a 'dict' view for scaling or FD, since
                 # our scaling and FD data is by variable.
                 self.J_dict = self._get_dict_J(J, wrt, prom_wrt, of, prom_of,
@@ -351,6 +368,9 @@ class _TotalJacInfo(object):
             self.prom_design_vars = {prom_wrt[i]: design_vars[dv] for i, dv in enumerate(wrt)}
             self.prom_responses = {prom_of[i]: responses[r] for i, r in enumerate(of)}
 
+            if self.csr_data_map is not None:
+                self.csr_scaler = self._get_csr_scaler()
+
     def _compute_jac_scatters(self, mode, rowcol_size, get_remote):
         model = self.model
         nproc = self.comm.size
@@ -515,6 +535,78 @@ class _TotalJacInfo(object):
 
         return J_dict
 
+    def _get_csr_J(self, modes):
+        """
+        Create a csr_matrix with the nonzero structure of the total coloring.
+
+        Also set up the mapping from the coloring's nonzero rows (fwd) or columns (rev) to
+        positions in the data array of the matrix.
+
+        Parameters
+        ----------
+        modes : list of str
+            Derivative directions used by the coloring.
+
+        Returns
+        -------
+        csr_matrix
+            The total jacobian, with all nonzero entries initialized to zero.
+        """
+        coloring = self.simul_coloring
+        nrows, ncols = self.of_size, self.wrt_size
+
+        rows = np.asarray(coloring._nzrows, dtype=INT_DTYPE)
+        cols = np.asarray(coloring._nzcols, dtype=INT_DTYPE)
+
+        # nonzeros sorted into row major (CSR) order, identified by their flat index
+        flat = rows * ncols + cols
+        order = np.argsort(flat)
+        flat = flat[order]
+        rows = rows[order]
+        cols = cols[order]
+
+        indptr = np.zeros(nrows + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(rows, minlength=nrows), out=indptr[1:])
+
+        empty = np.zeros(0, dtype=INT_DTYPE)
+        self.csr_data_map = {}
+        for mode in modes:
+            data_map = []
+            for i, nzs in enumerate(coloring.get_row_col_map(mode)):
+                if nzs is None:
+                    data_map.append(empty)
+                else:
+                    nzs = np.asarray(nzs, dtype=INT_DTYPE)
+                    idxs = nzs * ncols + i if mode == 'fwd' else i * ncols + nzs
+                    data_map.append(np.searchsorted(flat, idxs))
+            self.csr_data_map[mode] = data_map
+
+        return csr_matrix((np.zeros(flat.size), cols, indptr), shape=(nrows, ncols))
+
+    def _get_csr_scaler(self):
+        """
+        Return the driver scaling factor for each nonzero of the csr total jacobian.
+
+        Returns
+        -------
+        ndarray
+            Scaling factor for each entry of the data array of J.
+        """
+        row_scaler = np.ones(self.of_size)
+        for name, prom in zip(self.of, self.prom_of):
+            oscaler = self.prom_responses[prom]['total_scaler']
+            if oscaler is not None:
+                row_scaler[self.of_meta[name][0]] = oscaler
+
+        col_scaler = np.ones(self.wrt_size)
+        for name, prom in zip(self.wrt, self.prom_wrt):
+            iscaler = self.prom_design_vars[prom]['total_scaler']
+            if iscaler is not None:
+                col_scaler[self.wrt_meta[name][0]] = iscaler
+
+        coo = self.J.tocoo()
+        return row_scaler[coo.row] / col_scaler[coo.col]
+
     def _create_in_idx_map(self, mode):
         """
         Create a list that maps a global index to a name, col/row range, and other data.
@@ -1231,7 +1323,13 @@ class _TotalJacInfo(object):
             reduced_derivs[:] = 0.0
             reduced_derivs[jac_idxs] = deriv_val[deriv_idxs]
 
-        if fwd:
+        if self.csr_data_map is not None:
+            data = J.data
+            data_map = self.csr_data_map[mode]
+            for i in inds:
+                if row_col_map[i] is not None:
+                    data[data_map[i]] = reduced_derivs[row_col_map[i]]
+        elif fwd:
             for i in inds:
                 J[row_col_map[i], i] = reduced_derivs[row_col_map[i]]
                 if dist:
@@ -1276,7 +1374,10 @@ class _TotalJacInfo(object):
            ln_solver._assembled_jac._under_complex_step:
             model.linear_solver._assembled_jac._update(model)
         ln_solver._linearize()
-        self.J[:] = 0.0
+        if self.csr_data_map is None:
+            self.J[:] = 0.0
+        else:
+            self.J.data[:] = 0.0
 
         # Main loop over columns (fwd) or rows (rev) of the jacobian
         for mode in self.idx_iter_dict:
@@ -1319,14 +1420,52 @@ class _TotalJacInfo(object):
 
         # Driver scaling.
         if self.has_scaling:
-            self._do_driver_scaling(self.J_dict)
+            if self.csr_data_map is None:
+                self._do_driver_scaling(self.J_dict)
+            else:
+                self.J.data *= self.csr_scaler
 
         if debug_print:
             # Debug outputs scaled derivatives.
             self._print_derivatives()
 
+        if self.return_format == 'csr' and self.csr_data_map is None:
+            return csr_matrix(self.J)
+
         return self.J_final
 
+    def _get_approx_rel_systems(self):
+        """
+        Return the systems relevant to each wrt variable and any of the requested 'of' variables.
+
+        Returns
+        -------
+        dict
+            Set of relevant system pathnames keyed by wrt name.  The set is None if the relevance
+            is unknown because a variable is not a driver design variable or response.
+        """
+        relevant = self.model._relevant
+        design_vars = self.input_meta['fwd']
+        responses = self.output_meta['fwd']
+
+        known_of = all(of in responses for of in self.of)
+
+        wrt_rel_systems = {}
+        for wrt in self.wrt:
+            if known_of and wrt in design_vars:
+                systems = set()
+                for of in self.of:
+                    if wrt in relevant and of in relevant[wrt]:
+                        systems.update(relevant[wrt][of][1])
+                    elif of in relevant and wrt in relevant[of]:
+                        systems.update(relevant[of][wrt][1])
+            else:
+                systems = None
+
+            wrt_rel_systems[wrt] = systems
+
+        return wrt_rel_systems
+
     def compute_totals_approx(self, initialize=False, progress_out_stream=None):
         """
         Compute derivatives of desired quantities with respect to desired inputs.
@@ -1371,7 +1510,8 @@ class _TotalJacInfo(object):
             if model._approx_schemes:
                 method = list(model._approx_schemes)[0]
                 kwargs = model._owns_approx_jac_meta
-                model.approx_totals(method=method, **kwargs)
+                model.approx_totals(method=method, prune_nonlinear=model._approx_prune_nonlinear,
+                                    **kwargs)
                 if progress_out_stream is not None:
                     model._approx_schemes[method]._progress_out = progress_out_stream
             else:
@@ -1384,6 +1524,14 @@ class _TotalJacInfo(object):
             if model._coloring_info['coloring'] is not None:
                 model._update_wrt_matches(model._coloring_info)
 
+        if model._approx_prune_nonlinear:
+            wrt_rel_systems = self._get_approx_rel_systems()
+        else:
+            wrt_rel_systems = None
+
+        for scheme in model._approx_schemes.values():
+            scheme._wrt_rel_systems = wrt_rel_systems
+
         # Linearize Model
         model._linearize(model._assembled_jac,
                          sub_do_ln=model._linear_solver._linearize_children())
@@ -1421,7 +1569,7 @@ class _TotalJacInfo(object):
                                                                       prom_out, prom_in, ofidx,
                                                                       wrtidx, dist_resp, comm)
 
-        elif return_format in ('dict', 'array'):
+        elif return_format in ('dict', 'array', 'csr'):
             for prom_out, output_name in zip(self.prom_of, of):
                 if output_name in self.remote_vois:
                     continue
@@ -1464,6 +1612,8 @@ class _TotalJacInfo(object):
 
         if return_format == 'array':
             totals = self.J  # change back to array version
+        elif return_format == 'csr':
+            totals = csr_matrix(self.J)
 
         if debug_print:
             # Debug outputs scaled derivatives.
@@ -1521,7 +1671,12 @@ class _TotalJacInfo(object):
         raise_error : bool
             If True, raise an exception if a zero row or column is found.
         """
-        nzrows, nzcols = np.nonzero(np.abs(self.J) > tol)
+        if issparse(self.J):
+            coo = self.J.tocoo()
+            nonzero = np.abs(coo.data) > tol
+            nzrows, nzcols = coo.row[nonzero], coo.col[nonzero]
+        else:
+            nzrows, nzcols = np.nonzero(np.abs(self.J) > tol)
 
         # Check for zero rows, which correspond to constraints unaffected by any design vars.
         col = np.ones(self.J.shape[0], dtype=bool)
@@ -1617,7 +1772,7 @@ class _TotalJacInfo(object):
         desvars = self.prom_design_vars
         responses = self.prom_responses
 
-        if self.return_format in ('dict', 'array'):
+        if self.return_format in ('dict', 'array', 'csr'):
             for prom_out, odict in J.items():
                 oscaler = responses[prom_out]['total_scaler']
 
@@ -1661,7 +1816,7 @@ class _TotalJacInfo(object):
                         wrt = self.ivc_print_names[wrt]
                     pprint.pprint({(of, wrt): J_sub})
         else:
-            J = self.J
+            J = self.J.toarray() if issparse(self.J) else self.J
             for i, of in enumerate(self.of):
                 if of in self.remote_vois:
                     continue
@@ -1690,7 +1845,8 @@ class _TotalJacInfo(object):
         self.model._recording_iter.push((requester._get_name(), requester.iter_count))
 
         try:
-            totals = self._get_dict_J(self.J, self.wrt, self.prom_wrt, self.of, self.prom_of,
+            J = self.J.toarray() if issparse(self.J) else self.J
+            totals = self._get_dict_J(J, self.wrt, self.prom_wrt, self.of, self.prom_of,
                                       self.wrt_meta, self.of_meta, 'flat_dict_structured_key')
             requester._rec_mgr.record_derivatives(requester, totals, metadata)
 
@@ -20,9 +20,11 @@ import numpy as np
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
+from openmdao.drivers.genetic_algorithm_driver import _save_checkpoint, _load_checkpoint, \
+    _check_steady_state
 
 
 class DifferentialEvolutionDriver(Driver):
@@ -112,6 +114,23 @@ class DifferentialEvolutionDriver(Driver):
                              'if not given.')
         self.options.declare('multi_obj_exponent', default=1., lower=0.,
                              desc='Multi-objective weighting exponent.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, an asynchronous steady-state variant is used instead '
+                             'of generations.  A new trial point is created and evaluated as '
+                             'soon as a processor is free, and it replaces its target member of '
+                             'the population if it is better.  The number of evaluations is the '
+                             'same as for max_gen generations.  When run in parallel, rank 0 '
+                             'creates the trial points and the other ranks evaluate them.  Not '
+                             'supported with checkpoint_file or procs_per_model greater than 1.')
+        self.options.declare('checkpoint_file', types=str, default=None, allow_none=True,
+                             desc='Name of a file where the state of the algorithm is saved '
+                             'every checkpoint_interval generations.  If None, no checkpoints '
+                             'are saved.')
+        self.options.declare('checkpoint_interval', types=int, default=1, lower=1,
+                             desc='Number of generations between checkpoints.')
+        self.options.declare('resume', types=bool, default=False,
+                             desc='If True and checkpoint_file exists, continue from the '
+                             'generation saved in it instead of starting a new population.')
 
     def _setup_driver(self, problem):
         """
@@ -203,7 +222,13 @@ class DifferentialEvolutionDriver(Driver):
         F = self.options['F']
         Pc = self.options['Pc']
 
+        ga.checkpoint_file = self.options['checkpoint_file']
+        ga.checkpoint_interval = self.options['checkpoint_interval']
+        ga.resume = self.options['resume']
+        ga.steady_state = self.options['steady_state']
+
         self._check_for_missing_objective()
+        _check_steady_state(self)
 
         # Size design variables.
         desvars = self._designvars
@@ -418,6 +443,10 @@ class DifferentialEvolution(object):
 
     Attributes
     ----------
+    checkpoint_file : str or None
+        Name of the file where the state is saved every checkpoint_interval generations.
+    checkpoint_interval : int
+        Number of generations between checkpoints.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     lchrom : int
@@ -430,6 +459,11 @@ class DifferentialEvolution(object):
         Population size.
     objfun : function
         Objective function callback.
+    resume : bool
+        If True and checkpoint_file exists, continue from the generation saved in it.
+    steady_state : bool
+        If True, each trial point is evaluated as soon as a processor is free and replaces its
+        target member of the population if it is better.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -453,6 +487,10 @@ class DifferentialEvolution(object):
         self.lchrom = 0
         self.npop = 0
         self.model_mpi = model_mpi
+        self.checkpoint_file = None
+        self.checkpoint_interval = 1
+        self.resume = False
+        self.steady_state = False
 
     def execute_ga(self, x0, vlb, vub, pop_size, max_gen, random_state, F=0.5, Pc=0.5):
         """
@@ -503,9 +541,23 @@ class DifferentialEvolution(object):
         population = rng.random([self.npop, self.lchrom]) * (vub - vlb) + vlb  # scale to bounds
         fitness = np.ones(self.npop) * np.inf  # initialize fitness to infinitely bad
 
-        # Main Loop
+        if self.steady_state:
+            return self._execute_steady_state(population, fitness, vlb, vub, max_gen, rng, F, Pc)
+
         nfit = 0
-        for generation in range(max_gen + 1):
+        start = 0
+
+        state = _load_checkpoint(self.checkpoint_file, self.npop, self.lchrom) \
+            if self.resume else None
+        if state is not None:
+            start = state['generation']
+            population = state['population']
+            parentPop, parentFitness = state['parentPop'], state['parentFitness']
+            xopt, fopt, nfit = state['xopt'], state['fopt'], state['nfit']
+            rng.bit_generator.state = state['random_state']
+
+        # Main Loop
+        for generation in range(start, max_gen + 1):
             # Evaluate fitness of points in this generation
             if comm is not None:  # Parallel
                 # Since GA is random, ranks generate different new populations, so just take one
@@ -592,4 +644,125 @@ class DifferentialEvolution(object):
                 population[ii][idx] = mutant[idx]
                 population[ii][r] = mutant[r]  # always replace at least one with mutant's
 
+            if self.checkpoint_file and (generation + 1) % self.checkpoint_interval == 0 and \
+                    (comm is None or comm.rank == 0):
+                _save_checkpoint(self.checkpoint_file, {
+                    'generation': generation + 1,
+                    'npop': self.npop,
+                    'lchrom': self.lchrom,
+                    'population': population,
+                    'parentPop': parentPop,
+                    'parentFitness': parentFitness,
+                    'xopt': xopt,
+                    'fopt': fopt,
+                    'nfit': nfit,
+                    'random_state': rng.bit_generator.state,
+                })
+
+        return xopt, fopt, nfit
+
+    def _execute_steady_state(self, population, fitness, vlb, vub, max_gen, rng, F, Pc):
+        """
+        Perform an asynchronous steady-state differential evolution.
+
+        Trial points are created one at a time from the current population and evaluated as soon
+        as a processor is free, so no processor waits for the slowest point of a generation.
+
+        Parameters
+        ----------
+        population : ndarray
+            Initial population.
+        fitness : ndarray
+            Array where the fitness of each member of the population is stored.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        max_gen : int
+            Number of generations worth of trial points to evaluate.
+        rng : np.random.Generator
+            Random number generator.
+        F : float
+            Differential rate
+        Pc : float
+            Crossover rate
+
+        Returns
+        -------
+        ndarray
+            Best design point
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        npop = self.npop
+        evaluated = np.zeros(npop, dtype=bool)
+        pending = {}
+
+        xopt = copy.deepcopy(vlb)
+        fopt = np.inf
+        nfit = 0
+
+        def callback(result):
+            nonlocal xopt, fopt, nfit
+            returns, traceback = result
+
+            if not returns:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+                return
+
+            val, success, icase = returns
+            x, ii = pending.pop(icase)
+            if success:
+                nfit += 1
+                val = np.asarray(val).item()
+            else:
+                val = np.inf
+
+            # trial points replace their target if better (implied elitism). A trial can only
+            # be compared with a target whose initial evaluation has returned.
+            if icase < npop or (evaluated[ii] and val < fitness[ii]):
+                population[ii] = x
+                fitness[ii] = val
+                evaluated[ii] = True
+
+            if val < fopt:
+                fopt = val
+                xopt = x
+
+        def cases():
+            for icase in range(npop * (max_gen + 1)):
+                ii = icase % npop
+                if icase < npop:
+                    x = population[ii].copy()
+                else:
+                    if not evaluated[ii] and np.any(evaluated):
+                        # target the next member whose initial evaluation has returned
+                        ii = (ii + np.argmax(np.roll(evaluated, -ii))) % npop
+
+                    # randomly select 3 different population members other than the target
+                    a, b, c = rng.choice(np.delete(np.arange(npop), ii), 3, replace=False)
+
+                    # clip mutant so that it cannot be outside the bounds
+                    mutant = np.clip(population[a] + F * (population[b] - population[c]),
+                                     vlb, vub)
+
+                    # crossover with the target, always taking at least one of mutant's
+                    x = population[ii].copy()
+                    idx = rng.random(self.lchrom) < Pc
+                    idx[rng.integers(0, self.lchrom)] = True
+                    x[idx] = mutant[idx]
+
+                pending[icase] = (x, ii)
+                yield (x, icase), None
+
+        concurrent_eval_lb(self.objfun, cases(), comm, callback=callback)
+
+        if comm is not None:
+            xopt, fopt, nfit = comm.bcast((xopt, fopt, nfit), root=0)
+
         return xopt, fopt, nfit
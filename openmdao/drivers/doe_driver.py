@@ -4,6 +4,13 @@ Design-of-Experiments Driver.
 
 import traceback
 import inspect
+import multiprocessing
+import queue
+import signal
+from collections import deque
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
+from itertools import islice
 
 import numpy as np
 
@@ -16,6 +23,39 @@ from openmdao.utils.mpi import MPI
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 
 
+@contextmanager
+def _case_timeout(timeout):
+    """
+    Raise an AnalysisError if the enclosed block takes longer than the given time.
+
+    The error is raised from a SIGALRM handler, which Python only runs between bytecodes, so a
+    long call into compiled code isn't stopped until it returns.
+
+    Parameters
+    ----------
+    timeout : float or None
+        Maximum run time in seconds.  If None, no timeout is applied.
+
+    Yields
+    ------
+    None
+    """
+    if timeout is None:
+        yield
+        return
+
+    def _handler(signum, frame):
+        raise AnalysisError(f"Case exceeded the case_timeout of {timeout} seconds.")
+
+    old_handler = signal.signal(signal.SIGALRM, _handler)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+
 class DOEDriver(Driver):
     """
     Design-of-Experiments Driver.
@@ -30,6 +70,14 @@ class DOEDriver(Driver):
         The MPI communicator for the Problem.
     _color : int or None
         In MPI, the cached color is used to determine which cases to run on this proc.
+    _done_cases : set
+        Generator indices of cases found in attached recorders when resuming a run.
+    _batch_index : int or None
+        Position of the case being recorded within the current batch when batch_size is
+        greater than 1.
+    _batched_names : set
+        Absolute names of the variables that are recorded one slice per case when batch_size
+        is greater than 1.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -74,6 +122,9 @@ class DOEDriver(Driver):
         self._recorders = []
         self._problem_comm = None
         self._color = None
+        self._done_cases = set()
+        self._batch_index = None
+        self._batched_names = set()
 
     def _declare_options(self):
         """
@@ -85,6 +136,47 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='If True and run_parallel is True, cases are sent from the '
+                             'root proc to each model instance as soon as it finishes its '
+                             'previous case instead of being assigned statically.  The model '
+                             'instance containing the root proc only dispatches cases.')
+        self.options.declare('prefetch', types=int, default=1, lower=1,
+                             desc='Number of cases kept queued on each model instance when '
+                             'load_balance is True, or on each local worker process.')
+        self.options.declare('local_workers', types=int, default=0, lower=0,
+                             desc='Number of forked local worker processes used to run cases '
+                             'when not running in parallel under MPI.  If 0, cases are run '
+                             'serially.  Only driver iterations are recorded when using local '
+                             'workers, and they are recorded in the order they were generated.')
+        self.options.declare('case_timeout', types=(int, float), default=None, allow_none=True,
+                             lower=0.0,
+                             desc='Maximum time in seconds allowed for a single case.  A case '
+                             'that takes longer is stopped and recorded as a failure.  The case '
+                             'is stopped by a signal handler, which only runs between Python '
+                             'bytecodes, so a long call into compiled code is only stopped once '
+                             'it returns.  Only supported on platforms with SIGALRM and when '
+                             'procs_per_model is 1.')
+        self.options.declare('resume', types=bool, default=False,
+                             desc='If True, cases already found in an attached SqliteRecorder '
+                             'are skipped.  The recorder must be created with append=True so '
+                             'that the cases of the interrupted run are kept.  The generator '
+                             'must produce the same cases in the same order as the interrupted '
+                             'run.')
+        self.options.declare('batch_size', types=int, default=1, lower=1,
+                             desc='Number of cases evaluated by each run of the model.  If '
+                             'greater than 1, the model must be vectorized so that the first '
+                             'dimension of every design variable, and of every other variable '
+                             'that differs between cases, is batch_size.  Design variables are '
+                             'sized per case when generating cases, and each case is recorded '
+                             'separately using its slice of the design variables, the variables '
+                             'in batched_vars, and the inputs connected to them.  Not supported '
+                             'with load_balance or local_workers.')
+        self.options.declare('batched_vars', types=list, default=[],
+                             desc='Names or glob patterns of the variables, other than the design '
+                             'variables, whose first dimension is batch_size.  Promoted or '
+                             'absolute names can be used.  Each case is recorded with its slice '
+                             'of these variables, while all other variables are recorded whole.')
 
     def _setup_comm(self, comm):
         """
@@ -164,17 +256,295 @@ class DOEDriver(Driver):
         # set driver name with current generator
         self._set_name()
 
+        self._done_cases = self._get_recorded_cases() if self.options['resume'] else set()
+
+        if self.options['case_timeout'] is not None:
+            if not hasattr(signal, 'setitimer'):
+                raise RuntimeError(f"{self.msginfo}: case_timeout is not supported on this "
+                                   "platform.")
+            if self.options['procs_per_model'] > 1:
+                raise RuntimeError(f"{self.msginfo}: case_timeout is not supported when "
+                                   "procs_per_model is greater than 1.")
+
+        batched = self.options['batch_size'] > 1
+        if batched and (self.options['local_workers'] > 0 or
+                        (MPI and self.options['run_parallel'] and self.options['load_balance'])):
+            raise RuntimeError(f"{self.msginfo}: batch_size greater than 1 is not supported "
+                               "with load_balance or local_workers.")
+
         if MPI and self.options['run_parallel']:
+            if self.options['load_balance']:
+                self._run_load_balanced()
+                return False
             case_gen = self._parallel_generator
+        elif self.options['local_workers'] > 0:
+            if 'fork' not in multiprocessing.get_all_start_methods():
+                raise RuntimeError(f"{self.msginfo}: local_workers requires the 'fork' process "
+                                   "start method, which is not available on this platform.")
+            self._run_local_workers()
+            return False
         else:
-            case_gen = self.options['generator']
+            case_gen = self._case_generator
+
+        if batched:
+            self._run_batches(case_gen)
+            return False
 
-        for case in case_gen(self._designvars, self._problem().model):
+        # case names use the generator index, so they are the same for any number of procs
+        for idx, case in case_gen(self._designvars, self._problem().model):
+            self.iter_count = idx
             self._run_case(case)
             self.iter_count += 1
 
         return False
 
+    def _case_generator(self, design_vars, model=None, rank=0, size=1):
+        """
+        Generate cases along with their generator index, skipping cases that are already done.
+
+        Parameters
+        ----------
+        design_vars : dict
+            Dictionary of design variables for which to generate values.
+
+        model : Group
+            The model containing the design variables (used by some generators).
+
+        rank : int
+            Only cases whose index modulo size is rank are generated.
+
+        size : int
+            Number of shards of the cases.
+
+        Yields
+        ------
+        int
+            Index of the case in the generator.
+        list
+            list of name, value tuples for the design variables.
+        """
+        done = self._done_cases
+        for i, case in self.options['generator'].iter_cases(design_vars, model, rank, size):
+            if i not in done:
+                yield i, case
+
+    def _get_recorded_cases(self):
+        """
+        Return the generator indices of the cases found in attached SqliteRecorders.
+
+        Returns
+        -------
+        set
+            Generator indices of the recorded cases of this driver.
+        """
+        name = self._get_name()
+        done = set()
+
+        for recorder in self._rec_mgr._recorders:
+            if not isinstance(recorder, SqliteRecorder) or recorder.connection is None:
+                continue
+            cur = recorder.connection.execute("SELECT iteration_coordinate FROM "
+                                              "driver_iterations")
+            for coord, in cur:
+                # coord is of the form 'rank<n>:<driver name>|<case index>'
+                case_name, _, idx = coord.rpartition('|')
+                if case_name.partition(':')[2] == name:
+                    done.add(int(idx))
+
+        if MPI and self._problem_comm.size > 1:
+            # under MPI each proc records to its own file
+            done = set().union(*self._problem_comm.allgather(done))
+
+        return done
+
+    def _run_load_balanced(self):
+        """
+        Run cases under MPI, dispatching each case to the next available model instance.
+        """
+        comm = self._problem_comm
+        size = comm.size // self.options['procs_per_model']
+
+        if size < 2:
+            raise RuntimeError(f"{self.msginfo}: load_balance requires at least 2 model "
+                               "instances, one to dispatch cases and one to run them.")
+
+        if self._color == 0:
+            # the root of the first model instance dispatches cases.  The other procs in that
+            # model instance (if any) have nothing to do.
+            if comm.rank == 0:
+                self._dispatch_cases(size)
+        else:
+            self._run_dispatched_cases()
+
+    def _dispatch_cases(self, size):
+        """
+        Send cases to the root proc of each worker model instance and collect completions.
+
+        Parameters
+        ----------
+        size : int
+            Number of model instances, including the dispatching one.
+        """
+        comm = self._problem_comm
+        prefetch = self.options['prefetch']
+        case_iter = self._case_generator(self._designvars, self._problem().model)
+
+        # the root proc of model instance i is problem rank i
+        requests = []
+        outstanding = 0
+        for _ in range(prefetch):
+            for worker in range(1, size):
+                case = next(case_iter, None)
+                if case is None:
+                    break
+                requests.append(comm.isend(case, worker, tag=1))
+                outstanding += 1
+
+        while outstanding > 0:
+            worker = comm.recv(source=MPI.ANY_SOURCE, tag=2)
+            outstanding -= 1
+            self.iter_count += 1
+
+            case = next(case_iter, None)
+            if case is not None:
+                requests.append(comm.isend(case, worker, tag=1))
+                outstanding += 1
+
+        # tell all workers to stop
+        for worker in range(1, size):
+            requests.append(comm.isend(None, worker, tag=1))
+
+        MPI.Request.Waitall(requests)
+
+    def _run_dispatched_cases(self):
+        """
+        Run cases received from the dispatching proc until told to stop.
+        """
+        comm = self._problem_comm
+        model_comm = self._problem().model.comm
+
+        while True:
+            if model_comm.rank == 0:
+                case = comm.recv(source=0, tag=1)
+            else:
+                case = None
+            if model_comm.size > 1:
+                case = model_comm.bcast(case, root=0)
+
+            if case is None:
+                break
+
+            # use the generator's case index so that case names are unique across procs
+            self.iter_count, case = case
+            self._run_case(case)
+
+            if model_comm.rank == 0:
+                comm.send(comm.rank, 0, tag=2)
+
+    def _run_batches(self, case_gen):
+        """
+        Run the generated cases in batches, with one model evaluation per batch.
+
+        Parameters
+        ----------
+        case_gen : function
+            Function that generates (index, case) tuples for the given design variables.
+        """
+        batch_size = self.options['batch_size']
+
+        # cases are generated for the design variables of a single member of the batch
+        design_vars = {}
+        for name, meta in self._designvars.items():
+            size = meta['size']
+            if size % batch_size:
+                raise ValueError(f"{self.msginfo}: Size of design variable '{name}' ({size}) is "
+                                 f"not divisible by batch_size ({batch_size}).")
+            size //= batch_size
+            case_meta = meta.copy()
+            case_meta['size'] = case_meta['global_size'] = size
+            for bound in ('lower', 'upper'):
+                if isinstance(meta[bound], np.ndarray):
+                    case_meta[bound] = meta[bound].reshape((batch_size, size))[0]
+            design_vars[name] = case_meta
+
+        model = self._problem().model
+        self._batched_names = self._get_batched_names(model)
+
+        cases = case_gen(design_vars, model)
+
+        while True:
+            batch = list(islice(cases, batch_size))
+            if not batch:
+                break
+            self._run_batch(batch)
+
+    def _get_batched_names(self, model):
+        """
+        Return the absolute names of the variables whose first dimension is batch_size.
+
+        Parameters
+        ----------
+        model : <Group>
+            The model.
+
+        Returns
+        -------
+        set
+            Absolute names of the design variables, the variables matching batched_vars, and
+            the inputs connected to any of them.
+        """
+        batch_size = self.options['batch_size']
+        patterns = self.options['batched_vars']
+
+        names = {meta['ivc_source'] for meta in self._designvars.values()}
+        for io in ('input', 'output'):
+            for abs_name, prom in model._var_allprocs_abs2prom[io].items():
+                if any(fnmatchcase(prom, p) or fnmatchcase(abs_name, p) for p in patterns):
+                    size = model._var_allprocs_abs2meta[io][abs_name]['global_size']
+                    if size % batch_size:
+                        raise ValueError(f"{self.msginfo}: Size of batched variable '{prom}' "
+                                         f"({size}) is not divisible by batch_size "
+                                         f"({batch_size}).")
+                    names.add(abs_name)
+
+        names.update(tgt for tgt, src in model._conn_global_abs_in2out.items() if src in names)
+
+        return names
+
+    def _run_batch(self, batch):
+        """
+        Run a batch of cases using a single model evaluation and record each case.
+
+        Parameters
+        ----------
+        batch : list
+            List of (index, case) tuples.  If there are fewer than batch_size cases, the last
+            case is repeated to fill the batch.
+        """
+        batch_size = self.options['batch_size']
+        padded = batch + [batch[-1]] * (batch_size - len(batch))
+
+        values = {}
+        for _, case in padded:
+            for dv_name, dv_val in case:
+                values.setdefault(dv_name, []).append(np.ravel(dv_val))
+        self._set_case([(dv_name, np.concatenate(vals)) for dv_name, vals in values.items()])
+
+        # the model runs while recording the first case of the batch, so that solver and system
+        # cases are recorded under it
+        for i, (idx, _) in enumerate(batch):
+            self.iter_count = idx
+            self._batch_index = i
+            try:
+                with RecordingDebugging(self._get_name(), self.iter_count, self):
+                    if i == 0:
+                        metadata = self._eval_case()
+                    self._metadata = metadata.copy()
+            finally:
+                self._batch_index = None
+
+        self.iter_count += 1
+
     def _run_case(self, case):
         """
         Run case, save exception info and mark the metadata if the case fails.
@@ -184,8 +554,21 @@ class DOEDriver(Driver):
         case : list
             list of name, value tuples for the design variables.
         """
-        metadata = {}
+        self._set_case(case)
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+            # save reference to metadata for use in record_iteration
+            self._metadata = self._eval_case()
+
+    def _set_case(self, case):
+        """
+        Set the design variables of the given case.
 
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
         for dv_name, dv_val in case:
             try:
                 msg = None
@@ -199,21 +582,196 @@ class DOEDriver(Driver):
                 if msg:
                     raise(ValueError(msg))
 
-        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+    def _eval_case(self):
+        """
+        Run the model for the current design variable values.
+
+        Returns
+        -------
+        dict
+            Metadata containing the success flag and any error message.
+        """
+        metadata = {}
+        model = self._problem().model
+
+        # A case can be stopped anywhere, e.g. by the case_timeout, including between the push
+        # and pop of the solver print or recording iteration stacks, so they are restored if
+        # it fails.
+        solver_info = model._problem_meta['solver_info']
+        rec_iter = model._problem_meta['recording_iter']
+        stacks = (solver_info.prefix, list(solver_info.stack), list(rec_iter.stack),
+                  rec_iter._norec_refcount)
+
+        try:
+            with _case_timeout(self.options['case_timeout']):
+                model.run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            self._restore_stacks(solver_info, rec_iter, stacks)
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+            self._restore_stacks(solver_info, rec_iter, stacks)
+
+        return metadata
+
+    def _restore_stacks(self, solver_info, rec_iter, stacks):
+        """
+        Restore the solver print and recording iteration stacks saved before a case.
+
+        Parameters
+        ----------
+        solver_info : SolverInfo
+            The solver print stack.
+        rec_iter : _RecIteration
+            The recording iteration stack.
+        stacks : tuple
+            The saved solver print prefix and stack, and the recording iteration stack and
+            refcount.
+        """
+        prefix, info_stack, rec_stack, norec_refcount = stacks
+        solver_info.restore_cache((prefix, info_stack))
+        rec_iter.stack = rec_stack
+        rec_iter._norec_refcount = norec_refcount
+
+    def _run_local_workers(self):
+        """
+        Run cases in a pool of forked worker processes and record them in generator order.
+
+        Each worker holds a copy of the set up Problem.  Input, output and residual values of a
+        finished case are written to a shared memory slot so that only the case metadata and any
+        discrete values are pickled.
+        """
+        num_workers = self.options['local_workers']
+        model = self._problem().model
+        outputs, inputs, residuals = model._outputs, model._inputs, model._residuals
+
+        vecs = (outputs, inputs, residuals)
+        offsets = np.cumsum([0] + [len(v.asarray()) for v in vecs])
+        nslots = num_workers * (self.options['prefetch'] + 1)
+
+        ctx = multiprocessing.get_context('fork')
+        shared = ctx.RawArray('d', max(int(offsets[-1]) * nslots, 1))
+        slots = np.frombuffer(shared, dtype=float)[:offsets[-1] * nslots].reshape((nslots,
+                                                                                   offsets[-1]))
+
+        tasks = ctx.Queue()
+        results = ctx.Queue()
+        workers = [ctx.Process(target=self._local_worker, args=(tasks, results, slots, offsets),
+                               daemon=True) for _ in range(num_workers)]
+        for w in workers:
+            w.start()
+
+        case_iter = self._case_generator(self._designvars, model)
+        free_slots = list(range(nslots))
+        done = {}
+        pending = deque()
+        finished = False
+
+        try:
+            while True:
+                while free_slots:
+                    case = next(case_iter, None)
+                    if case is None:
+                        break
+                    tasks.put((case[0], free_slots.pop(), case[1]))
+                    pending.append(case[0])
+
+                if not pending:
+                    break
+
+                try:
+                    idx, slot, metadata, discrete = results.get(timeout=1.0)
+                except queue.Empty:
+                    if any(w.exitcode not in (None, 0) for w in workers):
+                        raise RuntimeError(f"{self.msginfo}: A local worker process exited "
+                                           "unexpectedly.")
+                    continue
+
+                if idx is None:
+                    raise RuntimeError(f"{self.msginfo}: Error running case in a local worker "
+                                       f"process:\n{metadata}")
+
+                done[idx] = (slot, metadata, discrete)
+
+                # record finished cases in the order they were generated
+                while pending and pending[0] in done:
+                    idx = pending.popleft()
+                    slot, metadata, discrete = done.pop(idx)
+                    for i, vec in enumerate(vecs):
+                        vec.set_val(slots[slot, offsets[i]:offsets[i + 1]])
+                    for name, val in discrete[0]:
+                        model._discrete_outputs[name] = val
+                    for name, val in discrete[1]:
+                        model._discrete_inputs[name] = val
+                    free_slots.append(slot)
+
+                    self.iter_count = idx
+                    with RecordingDebugging(self._get_name(), self.iter_count, self):
+                        self._metadata = metadata
+                    self.iter_count += 1
+
+            finished = True
+        finally:
+            for w in workers:
+                if finished:
+                    tasks.put(None)
+                else:
+                    w.terminate()
+            for w in workers:
+                w.join()
+
+    def _local_worker(self, tasks, results, slots, offsets):
+        """
+        Run cases from the task queue in a forked worker process.
+
+        Parameters
+        ----------
+        tasks : multiprocessing.Queue
+            Queue of (case index, slot, case) tuples, terminated by None.
+        results : multiprocessing.Queue
+            Queue where (case index, slot, metadata, discrete values) tuples are placed.
+        slots : ndarray
+            Shared memory array holding one row of vector values per slot.
+        offsets : ndarray
+            Start and end of the outputs, inputs and residuals within a slot.
+        """
+        model = self._problem().model
+
+        # recording is done only by the parent process
+        for system in model.system_iter(include_self=True, recurse=True):
+            system._rec_mgr._recorders = []
+            for solver in (system.nonlinear_solver, system.linear_solver,
+                           getattr(system.nonlinear_solver, 'linesearch', None)):
+                if solver is not None:
+                    solver._rec_mgr._recorders = []
+        self._rec_mgr._recorders = []
+
+        vecs = (model._outputs, model._inputs, model._residuals)
+
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+
+            idx, slot, case = task
             try:
-                self._problem().model.run_solve_nonlinear()
-                metadata['success'] = 1
-                metadata['msg'] = ''
-            except AnalysisError:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
+                self._set_case(case)
+                metadata = self._eval_case()
             except Exception:
-                metadata['success'] = 0
-                metadata['msg'] = traceback.format_exc()
-                print(metadata['msg'])
+                results.put((None, None, traceback.format_exc(), None))
+                break
 
-            # save reference to metadata for use in record_iteration
-            self._metadata = metadata
+            for i, vec in enumerate(vecs):
+                slots[slot, offsets[i]:offsets[i + 1]] = vec.asarray()
+
+            discrete = (model._discrete_outputs.items() if model._discrete_outputs else [],
+                        model._discrete_inputs.items() if model._discrete_inputs else [])
+            results.put((idx, slot, metadata, discrete))
 
     def _parallel_generator(self, design_vars, model=None):
         """
@@ -229,16 +787,15 @@ class DOEDriver(Driver):
 
         Yields
         ------
+        int
+            Index of the case in the generator.
         list
             list of name, value tuples for the design variables.
         """
         size = self._problem_comm.size // self.options['procs_per_model']
-        color = self._color
 
-        generator = self.options['generator']
-        for i, case in enumerate(generator(design_vars, model)):
-            if i % size == color:
-                yield case
+        # only the cases for this model instance are generated
+        yield from self._case_generator(design_vars, model, self._color, size)
 
     def add_recorder(self, recorder):
         """
@@ -295,3 +852,37 @@ class DOEDriver(Driver):
         """
         self._metadata['name'] = case_name
         return self._metadata
+
+    def _get_recorder_data(self, data):
+        """
+        Return the data to be recorded for the latest iteration.
+
+        When running a batch of cases, values of the design variables, the variables in
+        batched_vars and the inputs connected to them are replaced by the slice of the case
+        being recorded.
+
+        Parameters
+        ----------
+        data : dict
+            Dictionary containing input, output and residual values keyed on absolute name.
+
+        Returns
+        -------
+        dict
+            Data dictionary for the recorder.
+        """
+        if self._batch_index is None:
+            return data
+
+        batch_size = self.options['batch_size']
+        batched = self._batched_names
+        case_data = {}
+
+        for kind, vals in data.items():
+            case_vals = case_data[kind] = {}
+            for name, val in vals.items():
+                if name in batched:
+                    val = np.reshape(val, (batch_size, -1))[self._batch_index]
+                case_vals[name] = val
+
+        return case_data
@@ -5,6 +5,8 @@ import csv
 import os.path
 import re
 from collections import OrderedDict
+from functools import reduce
+from operator import mul
 
 import numpy as np
 import pyDOE2
@@ -12,6 +14,7 @@ import pyDOE2
 from openmdao.utils.name_maps import prom_name2abs_name
 
 _LEVELS = 2  # default number of levels for pyDOE generators
+_CHUNK = 1024  # number of full factorial cases decoded at a time
 
 
 class DOEGenerator(object):
@@ -38,6 +41,35 @@ class DOEGenerator(object):
         """
         return []
 
+    def iter_cases(self, design_vars, model=None, rank=0, size=1):
+        """
+        Generate the cases whose index modulo size is rank, along with their index.
+
+        Generators that can produce a case without producing the cases before it override this
+        so that cases belonging to other ranks are never created.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (used by some subclasses).
+        rank : int
+            Index of this shard of the cases.
+        size : int
+            Number of shards.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
+        for i, case in enumerate(self(design_vars, model)):
+            if i % size == rank:
+                yield i, case
+
 
 class ListGenerator(DOEGenerator):
     """
@@ -171,6 +203,33 @@ class CSVGenerator(DOEGenerator):
         list
             list of name, value tuples for the design variables.
         """
+        for _, case in self.iter_cases(design_vars, model):
+            yield case
+
+    def iter_cases(self, design_vars, model=None, rank=0, size=1):
+        """
+        Generate the cases whose index modulo size is rank, along with their index.
+
+        The file is read one row at a time, and rows belonging to other ranks are not parsed.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables.
+        rank : int
+            Index of this shard of the cases.
+        size : int
+            Number of shards.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
         name_map = {}
 
         with open(self._filename, 'r') as f:
@@ -196,12 +255,16 @@ class CSVGenerator(DOEGenerator):
 
         # read cases from file, parse values into numpy arrays
         with open(self._filename, 'r') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            names = [name_map[name.strip()] for name in next(reader)]
+            i = 0
             for row in reader:
-                case = [(name_map[name.strip()],
-                         np.fromstring(re.sub(r'[\[\]]', '', row[name]), sep=' '))
-                        for name in reader.fieldnames]
-                yield case
+                if not row:
+                    continue  # skip blank lines
+                if i % size == rank:
+                    yield i, [(name, np.fromstring(re.sub(r'[\[\]]', '', val), sep=' '))
+                              for name, val in zip(names, row)]
+                i += 1
 
 
 class UniformGenerator(DOEGenerator):
@@ -349,10 +412,35 @@ class _pyDOE_Generator(DOEGenerator):
         list
             list of name, value tuples for the design variables.
         """
+        for _, case in self.iter_cases(design_vars, model):
+            yield case
+
+    def iter_cases(self, design_vars, model=None, rank=0, size=1):
+        """
+        Generate the cases whose index modulo size is rank, along with their index.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+        model : Group
+            The model containing the design variables (not used).
+        rank : int
+            Index of this shard of the cases.
+        size : int
+            Number of shards.
+
+        Yields
+        ------
+        int
+            Index of the case.
+        list
+            list of name, value tuples for the design variables.
+        """
+        nshards = size
         self._sizes = OrderedDict([(name, _get_size(meta))
                                    for name, meta in design_vars.items()])
-        size = sum(self._sizes.values())
-        doe = self._generate_design(size).astype('int')
+        nfactors = sum(self._sizes.values())
 
         # Maximum number of levels, or the default if the maximum is smaller than the default.
         # This is to ensure that the array will be big enough even if some keys are missing
@@ -364,8 +452,9 @@ class _pyDOE_Generator(DOEGenerator):
         # over the range of that variable's lower to upper bound
 
         # rows = vars (# rows/var = var size), cols = levels
-        values = np.empty((size, levels_max))  # Initialize array for the largest number of levels
-        values[:] = np.nan  # and fill with NaNs.
+        # Initialize array for the largest number of levels and fill with NaNs.
+        values = np.empty((nfactors, levels_max))
+        values[:] = np.nan
 
         row = 0
         for name, meta in design_vars.items():
@@ -385,19 +474,41 @@ class _pyDOE_Generator(DOEGenerator):
 
                 row += 1
 
+        rows = np.arange(nfactors)
+
         # yield values for doe generated indices
-        for idxs in doe:
+        for i, idxs in self._iter_design(nfactors, rank, nshards):
+            vals = values[rows, idxs]
             retval = []
             row = 0
-            for name, meta in design_vars.items():
-                size_i = _get_size(meta)
-                val = np.empty(size_i)
-                for k in range(size_i):
-                    idx = idxs[row + k]
-                    val[k] = values[row + k][idx]
-                retval.append((name, val))
+            for name, size_i in self._sizes.items():
+                retval.append((name, vals[row:row + size_i]))
                 row += size_i
-            yield retval
+            yield i, retval
+
+    def _iter_design(self, size, rank=0, nshards=1):
+        """
+        Generate the rows of the DOE design whose index modulo nshards is rank.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        rank : int
+            Index of this shard of the design.
+        nshards : int
+            Number of shards.
+
+        Yields
+        ------
+        int
+            Index of the row.
+        ndarray
+            Row of the design matrix containing the level index of each factor.
+        """
+        doe = self._generate_design(size).astype('int')
+        for i in range(rank, len(doe), nshards):
+            yield i, doe[i]
 
     def _generate_design(self, size):
         """
@@ -437,6 +548,41 @@ class FullFactorialGenerator(_pyDOE_Generator):
         """
         return pyDOE2.fullfact(self._get_all_levels())
 
+    def _iter_design(self, size, rank=0, nshards=1):
+        """
+        Generate the rows of the full factorial design whose index modulo nshards is rank.
+
+        The design matrix is never built.  Row i holds the digits of i in a mixed radix number
+        system with the number of levels of each factor as the radices, with the first factor
+        varying fastest as in pyDOE2.fullfact.
+
+        Parameters
+        ----------
+        size : int
+            The number of factors for the design.
+        rank : int
+            Index of this shard of the design.
+        nshards : int
+            Number of shards.
+
+        Yields
+        ------
+        int
+            Index of the row.
+        ndarray
+            Row of the design matrix containing the level index of each factor.
+        """
+        levels = np.array(self._get_all_levels(), dtype=np.int64)
+        strides = np.cumprod(np.concatenate(([1], levels[:-1]))).astype(np.int64)
+        ncases = reduce(mul, levels.tolist(), 1)
+
+        for start in range(rank, ncases, nshards * _CHUNK):
+            idxs = np.arange(start, min(start + nshards * _CHUNK, ncases), nshards,
+                             dtype=np.int64)
+            design = (idxs[:, np.newaxis] // strides) % levels
+            for i, row in zip(idxs.tolist(), design):
+                yield i, row
+
 
 class GeneralizedSubsetGenerator(_pyDOE_Generator):
     """
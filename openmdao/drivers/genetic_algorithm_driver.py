@@ -22,13 +22,14 @@ John Wiley & Sons, Ltd.
 """
 import os
 import copy
+import pickle
 
 import numpy as np
 from pyDOE2 import lhs
 
 from openmdao.core.constants import INF_BOUND
 from openmdao.core.driver import Driver, RecordingDebugging
-from openmdao.utils.concurrent import concurrent_eval
+from openmdao.utils.concurrent import concurrent_eval, concurrent_eval_lb
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
@@ -137,6 +138,30 @@ class SimpleGADriver(Driver):
                              'given objectives and update it each generation. The multi-objective '
                              'weight and exponents are ignored because the algorithm uses all '
                              'objective values instead of a composite.')
+        self.options.declare('steady_state', types=bool, default=False,
+                             desc='If True, a steady-state GA is used instead of a generational '
+                             'one.  A new offspring is created and evaluated as soon as a '
+                             'processor is free, and it replaces the worst member of the '
+                             'population if it is better.  The number of evaluations is the same '
+                             'as for max_gen generations.  When run in parallel, rank 0 creates '
+                             'the offspring and the other ranks evaluate them.  Not supported '
+                             'with compute_pareto, checkpoint_file or procs_per_model greater '
+                             'than 1.')
+        self.options.declare('max_pareto_points', types=int, default=None, allow_none=True,
+                             lower=1,
+                             desc='Maximum number of non-dominated points kept when '
+                             'compute_pareto is True.  When there are more, the points with the '
+                             'smallest crowding distance are discarded.  If None, all '
+                             'non-dominated points are kept.')
+        self.options.declare('checkpoint_file', types=str, default=None, allow_none=True,
+                             desc='Name of a file where the state of the GA is saved every '
+                             'checkpoint_interval generations.  If None, no checkpoints are '
+                             'saved.')
+        self.options.declare('checkpoint_interval', types=int, default=1, lower=1,
+                             desc='Number of generations between checkpoints.')
+        self.options.declare('resume', types=bool, default=False,
+                             desc='If True and checkpoint_file exists, continue from the '
+                             'generation saved in it instead of starting a new population.')
 
     def _setup_driver(self, problem):
         """
@@ -226,6 +251,11 @@ class SimpleGADriver(Driver):
         ga.elite = self.options['elitism']
         ga.gray_code = self.options['gray']
         ga.cross_bits = self.options['cross_bits']
+        ga.max_pareto_points = self.options['max_pareto_points']
+        ga.steady_state = self.options['steady_state']
+        ga.checkpoint_file = self.options['checkpoint_file']
+        ga.checkpoint_interval = self.options['checkpoint_interval']
+        ga.resume = self.options['resume']
         pop_size = self.options['pop_size']
         max_gen = self.options['max_gen']
         user_bits = self.options['bits']
@@ -235,6 +265,7 @@ class SimpleGADriver(Driver):
         Pc = self.options['Pc']
 
         self._check_for_missing_objective()
+        _check_steady_state(self)
 
         if compute_pareto:
             self._ga.nobj = len(self._objs)
@@ -505,6 +536,10 @@ class GeneticAlgorithm(object):
 
     Attributes
     ----------
+    checkpoint_file : str or None
+        Name of the file where the state is saved every checkpoint_interval generations.
+    checkpoint_interval : int
+        Number of generations between checkpoints.
     comm : MPI communicator or None
         The MPI communicator that will be used objective evaluation for each generation.
     elite : bool
@@ -516,6 +551,8 @@ class GeneticAlgorithm(object):
         so when used Pc should be increased and Pm reduced.
     lchrom : int
         Chromosome length.
+    max_pareto_points : int or None
+        Maximum number of non-dominated points kept.  If None, all are kept.
     model_mpi : None or tuple
         If the model in objfun is also parallel, then this will contain a tuple with the the
         total number of population points to evaluate concurrently, and the color of the point
@@ -526,6 +563,11 @@ class GeneticAlgorithm(object):
         Population size.
     objfun : function
         Objective function callback.
+    resume : bool
+        If True and checkpoint_file exists, continue from the generation saved in it.
+    steady_state : bool
+        If True, each offspring is evaluated as soon as a processor is free and replaces the
+        worst member of the population if it is better.
     """
 
     def __init__(self, objfun, comm=None, model_mpi=None):
@@ -552,7 +594,12 @@ class GeneticAlgorithm(object):
         self.elite = True
         self.gray_code = False
         self.cross_bits = False
+        self.max_pareto_points = None
         self.model_mpi = model_mpi
+        self.checkpoint_file = None
+        self.checkpoint_interval = 1
+        self.resume = False
+        self.steady_state = False
 
     def execute_ga(self, x0, vlb, vub, vob, bits, pop_size, max_gen, random_state, Pm=None, Pc=0.5):
         """
@@ -621,12 +668,27 @@ class GeneticAlgorithm(object):
         elite = self.elite
 
         new_gen = np.round(lhs(self.lchrom, self.npop, criterion='center',
-                               random_state=random_state))
+                               random_state=random_state)).astype(np.uint8)
         new_gen[0] = self.encode(x0, vlb, vub, bits)
 
-        # Main Loop
+        if self.steady_state:
+            return self._execute_steady_state(new_gen, vlb, vub, vob, bits, max_gen, Pm, Pc)
+
         nfit = 0
-        for generation in range(max_gen + 1):
+        start = 0
+        min_gen = min_x = min_fit = None
+
+        state = _load_checkpoint(self.checkpoint_file, self.npop, self.lchrom) \
+            if self.resume else None
+        if state is not None:
+            start = state['generation']
+            new_gen = state['new_gen']
+            xopt, fopt, nfit = state['xopt'], state['fopt'], state['nfit']
+            min_gen, min_x, min_fit = state['min_gen'], state['min_x'], state['min_fit']
+            np.random.set_state(state['random_state'])
+
+        # Main Loop
+        for generation in range(start, max_gen + 1):
             old_gen = copy.deepcopy(new_gen)
             x_pop = self.decode(old_gen, vlb, vub, bits)
 
@@ -716,8 +778,175 @@ class GeneticAlgorithm(object):
             new_gen = self.crossover(new_gen, Pc)
             new_gen = self.mutate(new_gen, Pm)
 
+            if self.checkpoint_file and generation < max_gen and \
+                    (generation + 1) % self.checkpoint_interval == 0 and \
+                    (comm is None or comm.rank == 0):
+                _save_checkpoint(self.checkpoint_file, {
+                    'generation': generation + 1,
+                    'npop': self.npop,
+                    'lchrom': self.lchrom,
+                    'new_gen': new_gen,
+                    'xopt': xopt,
+                    'fopt': fopt,
+                    'nfit': nfit,
+                    'min_gen': min_gen,
+                    'min_x': min_x,
+                    'min_fit': min_fit,
+                    'random_state': np.random.get_state(),
+                })
+
         return xopt, fopt, nfit
 
+    def _execute_steady_state(self, population, vlb, vub, vob, bits, max_gen, Pm, Pc):
+        """
+        Perform a steady-state genetic algorithm.
+
+        Offspring are created one at a time from the current population and evaluated as soon
+        as a processor is free, so no processor waits for the slowest point of a generation.
+
+        Parameters
+        ----------
+        population : ndarray
+            Initial population, encoded.
+        vlb : ndarray
+            Lower bounds array.
+        vub : ndarray
+            Upper bounds array.
+        vob : ndarray
+            Outer bounds array.
+        bits : ndarray
+            Number of bits to encode the design space for each element of the design vector.
+        max_gen : int
+            Number of generations worth of offspring to evaluate.
+        Pm : float
+            Mutation rate
+        Pc : float
+            Crossover rate
+
+        Returns
+        -------
+        ndarray
+            Best design point
+        float
+            Objective value at best design point.
+        int
+            Number of successful function evaluations.
+        """
+        comm = self.comm
+        npop = self.npop
+        fitness = np.full(npop, np.inf)
+        evaluated = np.zeros(npop, dtype=bool)
+        pending = {}
+
+        xopt = copy.deepcopy(vlb)
+        fopt = np.inf
+        nfit = 0
+
+        def update(icase, val):
+            nonlocal xopt, fopt
+            gen, x = pending.pop(icase)
+
+            if val < fopt:
+                fopt = val
+                xopt = x
+
+            if icase < npop:
+                slot = icase
+            else:
+                # replace the worst evaluated member of the population if the offspring is
+                # better. Members whose initial evaluation is still running can't be compared.
+                slots = np.nonzero(evaluated)[0]
+                if slots.size == 0:
+                    return
+                slot = slots[np.argmax(fitness[slots])]
+                if not val < fitness[slot]:
+                    return
+
+            population[slot] = gen
+            fitness[slot] = val
+            evaluated[slot] = True
+
+        def callback(result):
+            nonlocal nfit
+            returns, traceback = result
+
+            if returns:
+                val, success, icase = returns
+                if success:
+                    nfit += 1
+                    update(icase, np.asarray(val).item())
+                else:
+                    update(icase, np.inf)
+            else:
+                # Print the traceback if it fails
+                print('A case failed:')
+                print(traceback)
+
+        def cases():
+            for icase in range(npop * (max_gen + 1)):
+                if icase < npop:
+                    gen = population[icase]
+                elif np.all(evaluated) or not np.any(evaluated):
+                    gen = self._breed(population, fitness, Pm, Pc)
+                else:
+                    # only breed from members whose initial evaluation has returned.
+                    gen = self._breed(population[evaluated], fitness[evaluated], Pm, Pc)
+                x = self.decode(gen[np.newaxis, :], vlb, vub, bits)[0]
+                pending[icase] = (gen.copy(), x)
+
+                if np.any(x - vob > 0):
+                    # Exceeded bounds for integer variables that are over-allocated.
+                    update(icase, np.inf)
+                else:
+                    yield (x, icase), None
+
+        concurrent_eval_lb(self.objfun, cases(), comm, callback=callback)
+
+        if comm is not None:
+            xopt, fopt, nfit = comm.bcast((xopt, fopt, nfit), root=0)
+
+        return xopt, fopt, nfit
+
+    def _breed(self, population, fitness, Pm, Pc):
+        """
+        Create one offspring from the current population.
+
+        Each parent is the winner of a tournament between two random points.  Crossover and
+        mutation are applied in the same way as for a whole generation.
+
+        Parameters
+        ----------
+        population : ndarray
+            Points in the current population that can be parents, encoded.
+        fitness : ndarray
+            Objective value of each point.
+        Pm : float
+            Mutation rate
+        Pc : float
+            Crossover rate
+
+        Returns
+        -------
+        ndarray
+            The offspring, encoded.
+        """
+        pairs = np.random.randint(len(population), size=(2, 2))
+        winners = pairs[np.arange(2), np.argmin(fitness[pairs], axis=1)]
+        child = population[winners[0]].copy()
+        other = population[winners[1]]
+
+        sites = np.where(np.random.rand(self.lchrom) < Pc)[0]
+        if sites.size > 0:
+            if self.cross_bits:  # swap single bits
+                child[sites] = other[sites]
+            else:               # swap remainder
+                child[sites[0]:] = other[sites[0]:]
+
+        flip = np.random.rand(self.lchrom) < Pm
+        child[flip] = 1 - child[flip]
+
+        return child
+
     def eval_pareto(self, x, obj, x_nd, obj_nd):
         """
         Produce a set of non dominated designs.
@@ -747,19 +976,15 @@ class GeneticAlgorithm(object):
             ypop = obj
             xpop = x
 
-        n_pts = ypop.shape[0]
-        i = 0
-        pot_idx = np.arange(n_pts)
-        while i < len(ypop):
-            nd_point_mask = np.any(ypop < ypop[i, :], axis=1)
-            nd_point_mask[i] = True
+        pot_idx = _non_dominated(ypop)
 
-            # Remove dominated points
-            pot_idx = pot_idx[nd_point_mask]
-            ypop = ypop[nd_point_mask]
-            i = np.sum(nd_point_mask[:i]) + 1
+        if self.max_pareto_points is not None and len(pot_idx) > self.max_pareto_points:
+            # keep the most isolated points so that the front stays evenly covered
+            dist = _crowding_distance(ypop[pot_idx])
+            keep = np.argsort(-dist, kind='stable')[:self.max_pareto_points]
+            pot_idx = pot_idx[np.sort(keep)]
 
-        return xpop[pot_idx, :], ypop
+        return xpop[pot_idx, :], ypop[pot_idx]
 
     def tournament(self, old_gen, fitness):
         """
@@ -778,17 +1003,16 @@ class GeneticAlgorithm(object):
             New generation with best points.
         """
         new_gen = []
-        idx = np.array(range(0, self.npop - 1, 2))
+        idx = np.arange(0, self.npop - 1, 2)
         for j in range(2):
             old_gen, i_shuffled = self.shuffle(old_gen)
             fitness = fitness[i_shuffled]
 
             # Each point competes with its neighbor; save the best.
-            i_min = np.argmin(np.array([[fitness[idx]], [fitness[idx + 1]]]), axis=0)
-            selected = i_min + idx
-            new_gen.append(old_gen[selected])
+            i_min = np.argmin(np.vstack((fitness[idx], fitness[idx + 1])), axis=0)
+            new_gen.append(old_gen[i_min + idx])
 
-        return np.concatenate(np.array(new_gen), axis=1).reshape(old_gen.shape)
+        return np.concatenate(new_gen)
 
     def tournament_multi_obj(self, old_gen, obj_val):
         """
@@ -850,19 +1074,19 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with crossovers applied.
         """
-        new_gen = copy.deepcopy(old_gen)
         num_sites = self.npop // 2
-        sites = np.random.rand(num_sites, self.lchrom)
-        idx, idy = np.where(sites < Pc)
-        for ii, jj in zip(idx, idy):
-            i = 2 * ii
-            j = i + 1
-            if self.cross_bits:  # swap single bit
-                new_gen[i][jj] = old_gen[j][jj]
-                new_gen[j][jj] = old_gen[i][jj]
-            else:               # swap remainder
-                new_gen[i][jj:] = old_gen[j][jj:]
-                new_gen[j][jj:] = old_gen[i][jj:]
+        swap = np.random.rand(num_sites, self.lchrom) < Pc
+        if not self.cross_bits:
+            # Swapping the remainder at every site means that every bit after the first site in
+            # the chromosome is swapped.
+            swap = np.logical_or.accumulate(swap, axis=1)
+
+        even = old_gen[0:2 * num_sites:2]
+        odd = old_gen[1:2 * num_sites:2]
+
+        new_gen = old_gen.copy()
+        new_gen[0:2 * num_sites:2] = np.where(swap, odd, even)
+        new_gen[1:2 * num_sites:2] = np.where(swap, even, odd)
         return new_gen
 
     def mutate(self, current_gen, Pm):
@@ -884,9 +1108,8 @@ class GeneticAlgorithm(object):
         ndarray
             Current generation with mutations applied.
         """
-        temp = np.random.rand(self.npop, self.lchrom)
-        idx, idy = np.where(temp < Pm)
-        current_gen[idx, idy] = 1 - current_gen[idx, idy]
+        flip = np.random.rand(self.npop, self.lchrom) < Pm
+        current_gen[flip] = 1 - current_gen[flip]
         return current_gen
 
     def shuffle(self, old_gen):
@@ -931,33 +1154,23 @@ class GeneticAlgorithm(object):
         ndarray
             Decoded design variable values.
         """
-        pts = gen.copy()
-        if self.gray_code:
-            for i in range(np.shape(gen)[0]):
-                pts[i] = self.from_gray(gen[i])
-        num_desvar = len(bits)
+        pts = self.from_gray(gen) if self.gray_code else gen
         interval = (vub - vlb) / (2**bits - 1)
-        x = np.empty((self.npop, num_desvar))
-        sbit = 0
-        ebit = 0
-        for jj in range(num_desvar):
-            exponents = 2**np.array(range(bits[jj] - 1, -1, -1))
-            ebit += bits[jj]
-            fact = exponents * (pts[:, sbit:ebit])
-            x[:, jj] = np.einsum('ij->i', fact) * interval[jj] + vlb[jj]
-            sbit = ebit
-        return x
+
+        # Each design variable is the sum of its weighted bits.
+        weights = 2**np.concatenate([np.arange(b - 1, -1, -1, dtype=np.int64) for b in bits])
+        starts = np.concatenate(([0], np.cumsum(bits)[:-1]))
+        return np.add.reduceat(pts * weights, starts, axis=1) * interval + vlb
 
     def encode(self, x, vlb, vub, bits):
         """
         Encode array of real values to array of binary arrays.
 
-        The array of arrays represents a single population member.
-
         Parameters
         ----------
         x : ndarray
-            Design variable values.
+            Design variable values for a single population member, or a 2-D array with one row
+            per population member.
         vlb : ndarray
             Lower bound array.
         vub : ndarray
@@ -968,14 +1181,16 @@ class GeneticAlgorithm(object):
         Returns
         -------
         ndarray
-            Single population member, encoded.
+            Population member(s), encoded.
         """
         interval = (vub - vlb) / (2**bits - 1)
         x = np.maximum(x, vlb)
         x = np.minimum(x, vub)
-        x = np.round((x - vlb) / interval).astype(np.int)
-        byte_str = [("0" * b + bin(i)[2:])[-b:] for i, b in zip(x, bits)]
-        result = np.array([int(c) for s in byte_str for c in s])
+        x = np.round((x - vlb) / interval).astype(np.int64)
+
+        # Shift each bit of each design variable into the lowest position.
+        shifts = np.concatenate([np.arange(b - 1, -1, -1, dtype=np.int64) for b in bits])
+        result = (x[..., np.repeat(np.arange(len(bits)), bits)] >> shifts) & 1
         if self.gray_code:
             result = self.to_gray(result)
         return result
@@ -983,7 +1198,10 @@ class GeneticAlgorithm(object):
     @staticmethod
     def to_gray(g):
         """
-        Convert a binary array representing a single population member to Gray code.
+        Convert a binary array to Gray code.
+
+        The input and output arrays represent a single population member, or a population with
+        one member per row.
 
         Parameters
         ----------
@@ -995,18 +1213,18 @@ class GeneticAlgorithm(object):
         ndarray
             Binary array using Gray code, e.g. np.array([0, 0, 1, 1]).
         """
-        s = ''.join([str(x) for x in g])                     # convert to binary string: '0010'
-        i = int(s, 2)                                        # convert to Integer: 2
-        gi = i ^ (i >> 1)                                    # compute gray code Integer: 3
-        gs = np.binary_repr(gi, len(g))                      # convert to binary string: '0011'
-        return np.array([0 if q == '0' else 1 for q in gs])  # convert to np.array: [0, 0, 1, 1]
+        # Each Gray bit is the exclusive or of a bit and the bit before it.
+        gray = np.array(g)
+        gray[..., 1:] = gray[..., 1:] != gray[..., :-1]
+        return gray
 
     @staticmethod
     def from_gray(g):
         """
         Convert a Gray coded binary array to normal binary coding.
 
-        The input and output arrays represent a single population member.
+        The input and output arrays represent a single population member, or a population with
+        one member per row.
 
         Parameters
         ----------
@@ -1018,8 +1236,156 @@ class GeneticAlgorithm(object):
         ndarray
             Binary array using normal coding, e.g. np.array([0, 0, 1, 0]).
         """
-        b = g.copy()
-        for i in range(1, len(g)):
-            prev = 1 if b[i - 1] == 0 else 0
-            b[i] = b[i - 1] if g[i] == 0 else prev
-        return b
+        # Each binary bit is the exclusive or of all Gray bits up to and including it.
+        return np.cumsum(g, axis=-1) % 2
+
+
+def _check_steady_state(driver):
+    """
+    Raise an error if the steady_state option of the driver is used with unsupported options.
+
+    Parameters
+    ----------
+    driver : <Driver>
+        A SimpleGADriver or DifferentialEvolutionDriver.
+    """
+    if not driver.options['steady_state']:
+        return
+
+    if 'compute_pareto' in driver.options and driver.options['compute_pareto']:
+        unsupported = 'compute_pareto is True'
+    elif driver.options['checkpoint_file'] is not None:
+        unsupported = 'checkpoint_file is set'
+    elif MPI and driver.options['run_parallel'] and driver.options['procs_per_model'] > 1:
+        unsupported = 'procs_per_model is greater than 1'
+    else:
+        return
+
+    raise RuntimeError(f"{driver.msginfo}: steady_state is not supported when {unsupported}.")
+
+
+def _non_dominated(obj):
+    """
+    Return the indices of the non-dominated rows of an objective array.
+
+    Rows are sorted lexicographically so that a row can only be dominated by rows that precede
+    it.  With two objectives, a single sweep finds the front in O(N log N) time.  Of a set of
+    identical rows, only the first is kept.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values, with one row per point.
+
+    Returns
+    -------
+    ndarray
+        Indices of the non-dominated rows in ascending order.
+    """
+    n_pts, nobj = obj.shape
+    order = np.lexsort(obj.T[::-1])
+    srt = obj[order]
+
+    if nobj == 2:
+        # a point is non-dominated if its second objective is lower than that of every point
+        # before it.
+        f2 = srt[:, 1]
+        prev_min = np.minimum.accumulate(np.concatenate(([np.inf], f2[:-1])))
+        return np.sort(order[f2 < prev_min])
+
+    front = np.empty((n_pts, nobj))
+    n_front = 0
+    keep = []
+    for k in range(n_pts):
+        pt = srt[k]
+        if n_front and np.any(np.all(front[:n_front] <= pt, axis=1)):
+            continue
+        front[n_front] = pt
+        n_front += 1
+        keep.append(k)
+
+    return np.sort(order[keep])
+
+
+def _crowding_distance(obj):
+    """
+    Return the crowding distance of each row of an objective array.
+
+    Parameters
+    ----------
+    obj : ndarray
+        Objective values, with one row per point.
+
+    Returns
+    -------
+    ndarray
+        Crowding distance of each point.  Points at the ends of the front have infinite distance.
+    """
+    n_pts, nobj = obj.shape
+    dist = np.zeros(n_pts)
+    if n_pts < 3:
+        dist[:] = np.inf
+        return dist
+
+    for j in range(nobj):
+        order = np.argsort(obj[:, j], kind='stable')
+        f = obj[order, j]
+        dist[order[0]] = dist[order[-1]] = np.inf
+        span = f[-1] - f[0]
+        if span > 0:
+            dist[order[1:-1]] += (f[2:] - f[:-2]) / span
+
+    return dist
+
+
+def _save_checkpoint(filename, state):
+    """
+    Save the state of a genetic algorithm to a file.
+
+    The state is written to a temporary file that then replaces the checkpoint file, so an
+    interruption while saving never leaves a partial checkpoint behind.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the checkpoint file.
+    state : dict
+        The state to be saved.
+    """
+    tmpname = filename + '.tmp'
+    with open(tmpname, 'wb') as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpname, filename)
+
+
+def _load_checkpoint(filename, npop, lchrom):
+    """
+    Load the state of a genetic algorithm saved by _save_checkpoint.
+
+    Parameters
+    ----------
+    filename : str or None
+        Name of the checkpoint file.
+    npop : int
+        Population size of the current run.
+    lchrom : int
+        Chromosome length of the current run.
+
+    Returns
+    -------
+    dict or None
+        The saved state, or None if there is no checkpoint file.
+    """
+    if filename is None or not os.path.isfile(filename):
+        return None
+
+    with open(filename, 'rb') as f:
+        state = pickle.load(f)
+
+    if state['npop'] != npop or state['lchrom'] != lchrom:
+        raise RuntimeError(f"Checkpoint file '{filename}' has a population size of "
+                           f"{state['npop']} and a chromosome length of {state['lchrom']}, "
+                           f"but the current run has a population size of {npop} and a "
+                           f"chromosome length of {lchrom}.")
+
+    return state
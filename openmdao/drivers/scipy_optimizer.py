@@ -9,6 +9,7 @@ from distutils.version import LooseVersion
 import numpy as np
 from scipy import __version__ as scipy_version
 from scipy.optimize import minimize
+from scipy.sparse import csr_matrix, issparse
 
 from openmdao.core.constants import INF_BOUND
 import openmdao.utils.coloring as coloring_mod
@@ -87,6 +88,9 @@ class ScipyOptimizeDriver(Driver):
         Flag that indicates failure of most recent optimization.
     iter_count : int
         Counter for function evaluations.
+    model_runs : list of int
+        Number of model runs performed during each iteration of the most recent optimization.
+        Only available for the optimizers in scipy.optimize.minimize.
     result : OptimizeResult
         Result returned from scipy.optimize call.
     opt_settings : dict
@@ -97,9 +101,18 @@ class ScipyOptimizeDriver(Driver):
         Cached result of constraint evaluations because scipy asks for them in a separate function.
     _con_idx : dict
         Used for constraint bookkeeping in the presence of 2-sided constraints.
-    _grad_cache : OrderedDict
-        Cached result of nonlinear constraint derivatives because scipy asks for them in a separate
-        function.
+    _grad_cache : ndarray, csr_matrix or None
+        Cached result of objective and nonlinear constraint derivatives because scipy asks for
+        them in separate functions. None if the model has been run since they were computed.
+    _grad_format : str
+        Return format of the total jacobian in _grad_cache, 'csr' if trust-constr can use the
+        sparsity of the total coloring, 'array' otherwise.
+    _iter_runs : int
+        Number of model runs performed so far during the current optimizer iteration.
+    _model_x : ndarray or None
+        Design point of the most recent successful model run.
+    _obj_cache : ndarray
+        Cached value of the objective at _model_x.
     _exc_info : 3 item tuple
         Storage for exception and traceback information.
     _obj_and_nlcons : list
@@ -142,7 +155,12 @@ class ScipyOptimizeDriver(Driver):
         self.result = None
         self._grad_cache = None
         self._con_cache = None
+        self._obj_cache = None
+        self._model_x = None
+        self._iter_runs = 0
+        self.model_runs = []
         self._con_idx = {}
+        self._grad_format = 'array'
         self._obj_and_nlcons = None
         self._dvlist = None
         self._lincongrad_cache = None
@@ -240,6 +258,10 @@ class ScipyOptimizeDriver(Driver):
         model = problem.model
         self.iter_count = 0
         self._total_jac = None
+        self._grad_cache = None
+        self._model_x = None
+        self._iter_runs = 0
+        self.model_runs = []
 
         self._check_for_missing_objective()
 
@@ -316,6 +338,7 @@ class ScipyOptimizeDriver(Driver):
         i = 1  # start at 1 since row 0 is the objective.  Constraints start at row 1.
         lin_i = 0  # counter for linear constraint jacobian
         lincons = []  # list of linear constraints
+        lincon_bounds = {}  # bounds of linear constraints passed to trust-constr
         self._obj_and_nlcons = list(self._objs)
 
         if opt in _constraint_optimizers:
@@ -352,18 +375,20 @@ class ScipyOptimizeDriver(Driver):
                     else:
                         lb = lower
                         ub = upper
-                    # Loop over every index separately,
-                    # because scipy calls each constraint by index.
-                    for j in range(size):
-                        # Double-sided constraints are accepted by the algorithm
-                        args = [name, False, j]
-                        # TODO linear constraint if meta['linear']
+
+                    if name in lincons:
+                        # Linear constraints are added once their jacobian is known.
+                        lincon_bounds[name] = (lb, ub)
+                    else:
+                        # Double-sided constraints are accepted by the algorithm, so the whole
+                        # constraint is passed at once.
                         # TODO add option for Hessian
                         con = NonlinearConstraint(
                             fun=signature_extender(weak_method_wrapper(self, '_con_val_func'),
-                                                   args),
+                                                   [name, False, slice(None)]),
                             lb=lb, ub=ub,
-                            jac=signature_extender(weak_method_wrapper(self, '_congradfunc'), args))
+                            jac=signature_extender(weak_method_wrapper(self, '_con_jac_func'),
+                                                   [name]))
                         constraints.append(con)
                 else:  # Type of constraints is list of dict
                     # Loop over every index separately,
@@ -405,6 +430,20 @@ class ScipyOptimizeDriver(Driver):
             else:
                 self._lincongrad_cache = None
 
+            if lincon_bounds:
+                from scipy.optimize import LinearConstraint
+
+                for name, (lb, ub) in lincon_bounds.items():
+                    start = self._con_idx[name]
+                    A = csr_matrix(self._lincongrad_cache[start:start + self._cons[name]['size']])
+
+                    # scipy bounds A * x, so the constant part of the constraint is moved to the
+                    # bounds.
+                    offset = self._con_cache[name] - A.dot(x_init)
+                    constraints.append(LinearConstraint(A, lb - offset, ub - offset))
+
+        self._setup_tot_jac_sparsity()
+
         # Provide gradients for optimizers that support it
         if opt in _gradient_optimizers:
             jac = self._gradfunc
@@ -438,6 +477,11 @@ class ScipyOptimizeDriver(Driver):
                               f"than min allowed ({info['min_improve_pct']:.1f}%)."
                         issue_warning(msg, prefix=self.msginfo, category=DerivativesWarning)
 
+        def callback(xk, *args):
+            # Called by scipy at the end of each iteration.
+            self.model_runs.append(self._iter_runs)
+            self._iter_runs = 0
+
         # optimize
         try:
             if opt in _optimizers:
@@ -453,7 +497,7 @@ class ScipyOptimizeDriver(Driver):
                                   bounds=bounds,
                                   constraints=constraints,
                                   tol=self.options['tol'],
-                                  # callback=None,
+                                  callback=callback,
                                   options=self.opt_settings)
             elif opt == 'basinhopping':
                 from scipy.optimize import basinhopping
@@ -557,11 +601,57 @@ class ScipyOptimizeDriver(Driver):
 
         return self.fail
 
-    def _objfunc(self, x_new):
+    def _run_model(self, x_new):
         """
-        Evaluate and return the objective function.
+        Run the model at the new design point, unless it was the point of the most recent run.
 
-        Model is executed here.
+        The objective and constraint values are cached, so a single model run serves the
+        objective and all of the constraints.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        """
+        model = self._problem().model
+
+        if MPI:
+            model.comm.Bcast(x_new, root=0)
+
+        if self._model_x is not None and np.array_equal(x_new, self._model_x):
+            return
+
+        # Invalidate the caches first so that a failed run is never used.
+        self._model_x = None
+        self._grad_cache = None
+
+        # Pass in new inputs
+        i = 0
+        for name, meta in self._designvars.items():
+            size = meta['size']
+            self.set_design_var(name, x_new[i:i + size])
+            i += size
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
+            self.iter_count += 1
+            model.run_solve_nonlinear()
+
+        self._iter_runs += 1
+
+        # Get the objective function evaluations
+        for obj in self.get_objective_values().values():
+            self._obj_cache = obj
+            break
+
+        self._con_cache = self.get_constraint_values()
+        self._model_x = x_new.copy()
+
+    def _compute_grad(self, x_new):
+        """
+        Compute the derivatives of the objective and nonlinear constraints at the new point.
+
+        The derivatives are cached, so a single computation serves the objective and all of the
+        constraints.
 
         Parameters
         ----------
@@ -570,42 +660,47 @@ class ScipyOptimizeDriver(Driver):
 
         Returns
         -------
-        float
-            Value of the objective function evaluated at the new design point.
+        ndarray or csr_matrix
+            Derivatives of the objective and nonlinear constraints.
         """
-        model = self._problem().model
+        self._run_model(x_new)
 
-        try:
+        if self._grad_cache is None:
+            self._grad_cache = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
+                                                    return_format=self._grad_format)
 
-            # Pass in new inputs
-            i = 0
-            if MPI:
-                model.comm.Bcast(x_new, root=0)
-            for name, meta in self._designvars.items():
-                size = meta['size']
-                self.set_design_var(name, x_new[i:i + size])
-                i += size
+            # First time through, check for zero row/col.
+            if self._check_jac:
+                raise_error = self.options['singular_jac_behavior'] == 'error'
+                self._total_jac.check_total_jac(raise_error=raise_error,
+                                                tol=self.options['singular_jac_tol'])
+                self._check_jac = False
 
-            with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
-                self.iter_count += 1
-                model.run_solve_nonlinear()
+        return self._grad_cache
 
-            # Get the objective function evaluations
-            for obj in self.get_objective_values().values():
-                f_new = obj
-                break
+    def _objfunc(self, x_new):
+        """
+        Evaluate and return the objective function.
 
-            self._con_cache = self.get_constraint_values()
+        Model is executed here, unless it was already run at this design point.
 
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+
+        Returns
+        -------
+        float
+            Value of the objective function evaluated at the new design point.
+        """
+        try:
+            self._run_model(x_new)
         except Exception as msg:
             self._exc_info = msg
             return 0
 
-        # print("Functions calculated")
-        # print('   xnew', x_new)
-        # print('   fnew', f_new)
-
-        return f_new
+        return self._obj_cache
 
     def _con_val_func(self, x_new, name, dbl, idx):
         """
@@ -622,22 +717,53 @@ class ScipyOptimizeDriver(Driver):
             Name of the constraint to be evaluated.
         dbl : bool
             True if double sided constraint.
-        idx : float
+        idx : int or slice
             Contains index into the constraint array.
 
         Returns
         -------
-        float
+        float or ndarray
             Value of the constraint function.
         """
+        if self._exc_info is not None:
+            self._reraise()
+
+        self._run_model(x_new)
         return self._con_cache[name][idx]
 
+    def _con_jac_func(self, x_new, name):
+        """
+        Return the jacobian of a whole nonlinear constraint.
+
+        Used for optimizers which take each constraint as a single vector function
+        (e.g. trust-constr).  The jacobian is sparse if the total jacobian sparsity is known.
+
+        Parameters
+        ----------
+        x_new : ndarray
+            Array containing input values at new design point.
+        name : string
+            Name of the constraint.
+
+        Returns
+        -------
+        ndarray or csr_matrix
+            Jacobian of the constraint function wrt all inputs.
+        """
+        if self._exc_info is not None:
+            self._reraise()
+
+        grad = self._compute_grad(x_new)
+
+        start = self._con_idx[name]
+        return grad[start:start + self._cons[name]['size']]
+
     def _confunc(self, x_new, name, dbl, idx):
         """
         Return the value of the constraint function requested in args.
 
-        Note that this function is called for each constraint, so the model is only run when the
-        objective is evaluated.
+        Note that this function is called for each constraint, so the model is only run if it
+        hasn't already been run at this design point.
 
         Parameters
         ----------
@@ -658,6 +784,7 @@ class ScipyOptimizeDriver(Driver):
         if self._exc_info is not None:
             self._reraise()
 
+        self._run_model(x_new)
         cons = self._con_cache
         meta = self._cons[name]
 
@@ -687,7 +814,8 @@ class ScipyOptimizeDriver(Driver):
         """
         Evaluate and return the gradient for the objective.
 
-        Gradients for the constraints are also calculated and cached here.
+        Gradients for the constraints are also calculated and cached here.  The model is run
+        first if it hasn't already been run at this design point.
 
         Parameters
         ----------
@@ -700,16 +828,7 @@ class ScipyOptimizeDriver(Driver):
             Gradient of objective with respect to input array.
         """
         try:
-            grad = self._compute_totals(of=self._obj_and_nlcons, wrt=self._dvlist,
-                                        return_format='array')
-            self._grad_cache = grad
-
-            # First time through, check for zero row/col.
-            if self._check_jac:
-                raise_error = self.options['singular_jac_behavior'] == 'error'
-                self._total_jac.check_total_jac(raise_error=raise_error,
-                                                tol=self.options['singular_jac_tol'])
-                self._check_jac = False
+            grad = self._compute_grad(x_new)
 
         except Exception as msg:
             self._exc_info = msg
@@ -719,14 +838,17 @@ class ScipyOptimizeDriver(Driver):
         # print('   xnew', x_new)
         # print('   grad', grad[0, :])
 
+        if issparse(grad):
+            return grad.getrow(0).toarray()[0]
+
         return grad[0, :]
 
     def _congradfunc(self, x_new, name, dbl, idx):
         """
         Return the cached gradient of the constraint function.
 
-        Note, scipy calls the constraints one at a time, so the gradient is cached when the
-        objective gradient is called.
+        Note, scipy calls the constraints one at a time, so the gradients of the objective and all
+        nonlinear constraints are computed once per design point and cached.
 
         Parameters
         ----------
@@ -752,7 +874,7 @@ class ScipyOptimizeDriver(Driver):
         if meta['linear']:
             grad = self._lincongrad_cache
         else:
-            grad = self._grad_cache
+            grad = self._compute_grad(x_new)
         grad_idx = self._con_idx[name] + idx
 
         # print("Constraint Gradient returned")
@@ -774,6 +896,27 @@ class ScipyOptimizeDriver(Driver):
         else:
             return grad[grad_idx, :]
 
+    def _setup_tot_jac_sparsity(self, coloring=None):
+        """
+        Choose the format of the total jacobian based on the sparsity of the total coloring.
+
+        trust-constr takes sparse constraint jacobians, so if a total coloring is available the
+        total jacobian is computed directly in CSR format.
+
+        Parameters
+        ----------
+        coloring : Coloring or None
+            Current coloring.
+        """
+        self._grad_format = 'array'
+
+        if self.options['optimizer'] not in _supports_new_style or not _use_new_style:
+            return
+
+        coloring = coloring if coloring is not None else self._get_static_coloring()
+        if coloring is not None:
+            self._grad_format = 'csr'
+
     def _reraise(self):
         """
         Reraise any exception encountered when scipy calls back into our method.
@@ -1,11 +1,14 @@
 """ Unit tests for the DifferentialEvolutionDriver Driver."""
 
 import unittest
+from unittest import mock
 import os
 
 import numpy as np
 
 import openmdao.api as om
+from openmdao.drivers.differential_evolution_driver import DifferentialEvolution
+from openmdao.drivers.tests.test_genetic_algorithm_driver import _slow_initial_eval_lb
 from openmdao.test_suite.components.branin import Branin
 from openmdao.test_suite.components.paraboloid import Paraboloid
 from openmdao.test_suite.components.paraboloid_distributed import DistParab
@@ -14,6 +17,7 @@ from openmdao.test_suite.components.three_bar_truss import ThreeBarTruss
 
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -309,6 +313,103 @@ class TestDriverOptionsDifferentialEvolution(unittest.TestCase):
         self.assertEqual(prob.driver.options['Pc'], 0.0123)
 
 
+@use_tempdirs
+class TestDifferentialEvolutionCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['DifferentialEvolutionDriver_seed'] = '11'
+
+    def run_de(self, max_gen, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(pop_size=20, max_gen=max_gen)
+        prob.driver.options.update(options)
+
+        prob.setup()
+        prob.run_driver()
+
+        return prob
+
+    def test_resume(self):
+        expected = self.run_de(10)
+
+        # interrupted run, with checkpoints every 2 generations
+        self.run_de(4, checkpoint_file='de.pkl', checkpoint_interval=2)
+
+        prob = self.run_de(10, checkpoint_file='de.pkl', resume=True)
+
+        assert_near_equal(prob['xI'], expected['xI'], 1e-12)
+        assert_near_equal(prob['xC'], expected['xC'], 1e-12)
+        assert_near_equal(prob['comp.f'], expected['comp.f'], 1e-12)
+
+        # generations 4 through 10 plus the final run
+        self.assertEqual(prob.model.comp.iter_count, 20 * 7 + 1)
+
+
+class TestDifferentialEvolutionSteadyState(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['DifferentialEvolutionDriver_seed'] = '11'
+
+    def test_branin(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.DifferentialEvolutionDriver(pop_size=20, max_gen=50, steady_state=True)
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.397887, 1e-3)
+
+        # the same number of evaluations as the generational algorithm, plus the final run
+        self.assertEqual(prob.model.comp.iter_count, 20 * 51 + 1)
+
+    def test_slow_initial_population(self):
+        # trial points that finish before their targets must not be compared with them, or be
+        # overwritten by them.
+        def objfun(x, icase):
+            return np.sum((x - 0.3) ** 2), True, icase
+
+        de = DifferentialEvolution(objfun)
+        de.npop = 8
+        de.lchrom = 3
+        vlb = np.zeros(3)
+        vub = np.ones(3)
+        rng = np.random.default_rng(11)
+        population = rng.random((de.npop, de.lchrom))
+        fitness = np.full(de.npop, np.inf)
+        initial = population.copy()
+
+        def on_initial(icase):
+            assert_near_equal(population[icase], initial[icase])
+
+        with mock.patch('openmdao.drivers.differential_evolution_driver.concurrent_eval_lb',
+                        _slow_initial_eval_lb(de.npop, on_initial)):
+            xopt, fopt, nfit = de._execute_steady_state(population, fitness, vlb, vub, 10, rng,
+                                                        0.9, 0.9)
+
+        self.assertEqual(nfit, 8 * 11)
+
+        # the fitness matches the population, and the best point found is still in it
+        assert_near_equal(fitness, [objfun(x, 0)[0] for x in population], 1e-15)
+        self.assertEqual(np.min(fitness), fopt)
+
+
 class TestMultiObjectiveDifferentialEvolution(unittest.TestCase):
 
     def setUp(self):
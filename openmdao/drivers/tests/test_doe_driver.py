@@ -6,8 +6,12 @@ import unittest
 import os
 import csv
 import json
+import multiprocessing
+import signal
+import time
 
 import numpy as np
+import pyDOE2
 
 import openmdao.api as om
 
@@ -649,6 +653,66 @@ class TestDOEDriver(unittest.TestCase):
             self.assertEqual(outputs['y'], expected_case['y'])
             self.assertEqual(outputs['f_xy'], expected_case['f_xy'])
 
+    def test_iter_cases_sharding(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', ParaboloidArray(), promotes=['xy', 'f_xy'])
+        model.add_subsystem('comp2', Paraboloid(), promotes=['x'])
+        model.add_design_var('xy', lower=np.array([-10., -50.]), upper=np.array([10., 50.]))
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.setup()
+
+        design_vars = model.get_design_vars(recurse=True)
+
+        generators = [om.FullFactorialGenerator(levels={'xy': 3, 'x': 4}),
+                      om.BoxBehnkenGenerator()]
+
+        for gen in generators:
+            cases = list(gen(design_vars, model))
+
+            # the full factorial design is decoded case by case, and must match pyDOE2
+            if isinstance(gen, om.FullFactorialGenerator):
+                self.assertEqual(len(cases), 36)
+                full = pyDOE2.fullfact([3, 3, 4])
+                levels = [np.linspace(-10., 10., 3), np.linspace(-50., 50., 3),
+                          np.linspace(0., 1., 4)]
+                for case, row in zip(cases, full.astype(int)):
+                    assert_near_equal(case[0][1], [levels[0][row[0]], levels[1][row[1]]], 1e-12)
+                    assert_near_equal(case[1][1], [levels[2][row[2]]], 1e-12)
+
+            # generate the same cases in 3 shards
+            sharded = {}
+            for rank in range(3):
+                for i, case in gen.iter_cases(design_vars, model, rank, 3):
+                    self.assertEqual(i % 3, rank)
+                    sharded[i] = case
+
+            self.assertEqual(sorted(sharded), list(range(len(cases))))
+            for i, case in enumerate(cases):
+                for (name, val), (sname, sval) in zip(case, sharded[i]):
+                    self.assertEqual(name, sname)
+                    assert_near_equal(sval, val, 1e-12)
+
+        # CSV rows are read lazily and only the rows of each shard are parsed
+        with open('cases.csv', 'w') as f:
+            writer = csv.writer(f)
+            writer.writerow(['xy', 'x'])
+            for case in generators[0](design_vars, model):
+                writer.writerow([val for _, val in case])
+
+        gen = om.CSVGenerator('cases.csv')
+        cases = list(gen(design_vars, model))
+        self.assertEqual(len(cases), 36)
+
+        shard = list(gen.iter_cases(design_vars, model, 1, 4))
+        self.assertEqual([i for i, _ in shard], list(range(1, 36, 4)))
+        for i, case in shard:
+            assert_near_equal(case[0][1], cases[i][0][1], 1e-12)
+            assert_near_equal(case[1][1], cases[i][1][1], 1e-12)
+
     def test_generalized_subset(self):
         # All DVs have the same number of levels
         prob = om.Problem()
@@ -1379,6 +1443,213 @@ class TestDOEDriver(unittest.TestCase):
         for name in ('x', 'y', 'z'):
             assert_near_equal(outputs[name], prob[name])
 
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), "requires signal.setitimer")
+    def test_case_timeout(self):
+        class SlowComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 0.0)
+                self.add_output('y', 0.0)
+
+            def compute(self, inputs, outputs):
+                if inputs['x'] > 1.5:
+                    time.sleep(5.0)
+                outputs['y'] = 2.0 * inputs['x']
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', SlowComp(), promotes=['*'])
+        prob.model.add_design_var('x', lower=0.0, upper=3.0)
+        prob.model.add_objective('y')
+
+        prob.driver = om.DOEDriver([[('x', 1.0)], [('x', 2.0)], [('x', 3.0)]], case_timeout=0.2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.setup()
+
+        start = time.time()
+        prob.run_driver()
+        prob.cleanup()
+        self.assertTrue(time.time() - start < 4.0)
+
+        cr = om.CaseReader("cases.sql")
+        cases = [cr.get_case(c) for c in cr.list_cases('driver', out_stream=None)]
+
+        self.assertEqual([c.success for c in cases], [True, False, False])
+        self.assertTrue("exceeded the case_timeout of 0.2 seconds" in cases[1].msg)
+        assert_near_equal(cases[0].outputs['y'], 2.0)
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), "requires signal.setitimer")
+    def test_case_timeout_stacks(self):
+        # the timeout stops the case between the push and pop of the stacks
+        class SlowComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 0.0)
+                self.add_output('y', 0.0)
+
+            def compute(self, inputs, outputs):
+                solver_info = self._problem_meta['solver_info']
+                rec_iter = self._problem_meta['recording_iter']
+                solver_info.append_solver()
+                rec_iter.push(('slow', 0))
+                if inputs['x'] > 1.5:
+                    time.sleep(5.0)
+                rec_iter.pop()
+                solver_info.pop()
+                outputs['y'] = 2.0 * inputs['x']
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', SlowComp(), promotes=['*'])
+        prob.model.add_design_var('x', lower=0.0, upper=3.0)
+        prob.model.add_objective('y')
+
+        prob.driver = om.DOEDriver([[('x', 2.0)], [('x', 1.0)]], case_timeout=0.2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        self.assertEqual(prob.model._problem_meta['solver_info'].prefix, '')
+        self.assertEqual(prob.model._problem_meta['recording_iter'].stack, [])
+
+        cr = om.CaseReader("cases.sql")
+        self.assertEqual(cr.list_cases('driver', out_stream=None),
+                         ['rank0:DOEDriver_List|0', 'rank0:DOEDriver_List|1'])
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                         "requires the 'fork' start method")
+    def test_local_workers(self):
+        results = {}
+
+        for local_workers in (0, 3):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+            model.add_subsystem('disc', ParaboloidDiscrete())
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_design_var('disc.x')
+            model.add_objective('f_xy')
+
+            cases = [[('x', x), ('y', y), ('disc.x', int(10 * x))]
+                     for x in np.linspace(0.0, 1.0, 4) for y in np.linspace(0.0, 1.0, 4)]
+
+            prob.driver = om.DOEDriver(cases, local_workers=local_workers)
+            prob.driver.recording_options['includes'] = ['*']
+            prob.driver.add_recorder(om.SqliteRecorder("cases%d.sql" % local_workers))
+
+            prob.setup()
+            prob.run_driver()
+            prob.cleanup()
+
+            cr = om.CaseReader("cases%d.sql" % local_workers)
+            case_names = cr.list_cases('driver', out_stream=None)
+            results[local_workers] = [(name, cr.get_case(name)) for name in case_names]
+
+        self.assertEqual(len(results[3]), 16)
+
+        # cases are recorded in the order they were generated
+        for (name0, case0), (name3, case3) in zip(results[0], results[3]):
+            self.assertEqual(name0, name3)
+            for name in ('x', 'y', 'f_xy', 'disc.x', 'disc.f_xy'):
+                assert_near_equal(case3[name], case0[name], 1e-12)
+
+    def test_resume(self):
+        cases = [[('x', x), ('y', y)] for x in (0.0, 0.5, 1.0) for y in (0.0, 0.5, 1.0)]
+
+        # the first run is interrupted after 4 cases
+        for ncases, resume in ((4, False), (9, True)):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(cases[:ncases], resume=resume)
+            prob.driver.add_recorder(om.SqliteRecorder("cases.sql", append=resume))
+
+            prob.setup()
+            prob.run_driver()
+            prob.cleanup()
+
+            self.assertEqual(model.comp.iter_count, 5 if resume else ncases)
+
+        cr = om.CaseReader("cases.sql")
+        case_names = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(case_names, ['rank0:DOEDriver_List|%d' % i for i in range(9)])
+
+        for name, case in zip(case_names, cases):
+            case_out = cr.get_case(name)
+            assert_near_equal(case_out['x'], case[0][1], 1e-12)
+            assert_near_equal(case_out['y'], case[1][1], 1e-12)
+
+    def test_batch_size(self):
+        results = {}
+
+        for batch_size in (1, 4):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('comp', om.ExecComp('f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                    shape=(batch_size,), has_diag_partials=True),
+                                promotes=['*'])
+            # not batched, though its size happens to be the batch size
+            model.add_subsystem('offset', om.ExecComp('z = a + 1.0', a=np.arange(4.0),
+                                                      z=np.zeros(4)), promotes=['*'])
+            model.add_design_var('x', lower=0.0, upper=1.0)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy', index=0)
+
+            prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), batch_size=batch_size,
+                                       batched_vars=['f_xy'])
+            prob.driver.recording_options['includes'] = ['*']
+            prob.driver.add_recorder(om.SqliteRecorder("cases%d.sql" % batch_size))
+
+            prob.setup()
+            prob.run_driver()
+            prob.cleanup()
+
+            # 9 cases in batches of 4
+            self.assertEqual(model.comp.iter_count, 9 if batch_size == 1 else 3)
+
+            cr = om.CaseReader("cases%d.sql" % batch_size)
+            case_names = cr.list_cases('driver', out_stream=None)
+            results[batch_size] = [(name, cr.get_case(name)) for name in case_names]
+
+        self.assertEqual(len(results[4]), 9)
+
+        for (name1, case1), (name4, case4) in zip(results[1], results[4]):
+            self.assertEqual(name1, name4)
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case4[name].shape, (1,))
+                assert_near_equal(case4[name], case1[name], 1e-12)
+            # variables that aren't batched are recorded whole
+            for name in ('a', 'z'):
+                assert_near_equal(case4[name], case1[name], 1e-12)
+            assert_near_equal(case4['z'], np.arange(1.0, 5.0), 1e-12)
+
+    def test_batched_vars_indivisible(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f = 2.0 * x', shape=(4,),
+                                                has_diag_partials=True), promotes=['*'])
+        model.add_subsystem('other', om.ExecComp('z = 2.0 * a', shape=(3,)), promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_objective('f', index=0)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=2), batch_size=4,
+                                   batched_vars=['f', 'z'])
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.run_driver()
+
+        self.assertEqual(str(cm.exception),
+                         "DOEDriver: Size of batched variable 'z' (3) is not divisible by "
+                         "batch_size (4).")
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 @use_tempdirs
@@ -1488,6 +1759,53 @@ class TestParallelDOE4Proc(unittest.TestCase):
         num_cases = prob.comm.allgather(num_cases)
         self.assertEqual(sum(num_cases), len(expected))
 
+    def test_full_factorial_load_balance(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', 0.0), promotes=['x'])
+        model.add_subsystem('p2', om.IndepVarComp('y', 0.0), promotes=['y'])
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), procs_per_model=1,
+                                   run_parallel=True, load_balance=True, prefetch=2)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+
+        failed, output = run_driver(prob)
+        self.assertFalse(failed)
+
+        prob.cleanup()
+
+        expected = self.expected_fullfact3
+        rank = prob.comm.rank
+
+        cr = om.CaseReader("cases.sql_%d" % rank)
+        cases = cr.list_cases('driver', out_stream=None)
+
+        # rank 0 only dispatches cases
+        if rank == 0:
+            self.assertEqual(len(cases), 0)
+
+        # case names contain the index of the case in the generator
+        found = []
+        for case_name in cases:
+            idx = int(case_name.rsplit('|', 1)[-1])
+            outputs = cr.get_case(case_name).outputs
+            self.assertEqual(outputs['x'], expected[idx]['x'])
+            self.assertEqual(outputs['y'], expected[idx]['y'])
+            self.assertEqual(outputs['f_xy'], expected[idx]['f_xy'])
+            found.append(idx)
+
+        # every case was run exactly once across all procs
+        found = sorted(i for idxs in prob.comm.allgather(found) for i in idxs)
+        self.assertEqual(found, list(range(len(expected))))
+
     def test_fan_in_grouped_parallel_2x2(self):
         # run cases in parallel with 2 procs per model
         # (cases will be split between the 2 parallel model instances)
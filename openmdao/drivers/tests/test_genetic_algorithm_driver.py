@@ -1,6 +1,7 @@
 """ Unit tests for the SimpleGADriver Driver."""
 
 import unittest
+from unittest import mock
 import os
 
 import numpy as np
@@ -15,6 +16,7 @@ from openmdao.test_suite.components.three_bar_truss import ThreeBarTruss
 
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -23,6 +25,40 @@ except ImportError:
 
 extra_prints = False  # enable printing results
 
+
+def _slow_initial_eval_lb(npop, on_initial, nworkers=6, delay=50):
+    """
+    Mimic load balanced evaluation on several workers, where half of the initial population is slow.
+
+    on_initial is called with the case index just before each result for the initial
+    population is returned.
+    """
+    def eval_lb(func, cases, comm, broadcast=False, callback=None):
+        case_iter = iter(cases)
+        running = []
+        clock = 0
+        while True:
+            while len(running) < nworkers:
+                case = next(case_iter, None)
+                if case is None:
+                    break
+                args = case[0]
+                slow = args[1] < npop and args[1] % 2 == 0
+                running.append((clock + (delay if slow else 1), args))
+
+            if not running:
+                break
+
+            # results come back in order of finishing time
+            running.sort(key=lambda r: r[0])
+            clock, args = running.pop(0)
+            if args[1] < npop:
+                on_initial(args[1])
+            callback((func(*args), None))
+
+    return eval_lb
+
+
 class TestSimpleGA(unittest.TestCase):
 
     def setUp(self):
@@ -360,6 +396,60 @@ class TestSimpleGA(unittest.TestCase):
         np.testing.assert_array_almost_equal(gen[0], enc0)  # decode followed by encode gives original array
         np.testing.assert_array_almost_equal(gen[1], enc1)
 
+    def test_gray_code(self):
+        np.testing.assert_array_equal(GeneticAlgorithm.to_gray(np.array([0, 0, 1, 0])),
+                                      [0, 0, 1, 1])
+        np.testing.assert_array_equal(GeneticAlgorithm.from_gray(np.array([0, 0, 1, 1])),
+                                      [0, 0, 1, 0])
+
+        # whole populations are converted one member per row
+        np.random.seed(1)
+        gen = np.random.randint(2, size=(20, 27)).astype(np.uint8)
+        gray = GeneticAlgorithm.to_gray(gen)
+        for i in range(len(gen)):
+            np.testing.assert_array_equal(gray[i], GeneticAlgorithm.to_gray(gen[i]))
+        np.testing.assert_array_equal(GeneticAlgorithm.from_gray(gray), gen)
+
+        # population encoding matches encoding of each member
+        ga = GeneticAlgorithm(None)
+        ga.gray_code = True
+        vlb = np.array([-5.0, 0.0, 1.0])
+        vub = np.array([10.0, 15.0, 2.0])
+        bits = np.array([9, 16, 2])
+        x = ga.decode(gen, vlb, vub, bits)
+        np.testing.assert_array_equal(ga.encode(x, vlb, vub, bits), gen)
+        for i in range(len(gen)):
+            np.testing.assert_array_equal(ga.encode(x[i], vlb, vub, bits), gen[i])
+
+    def test_crossover(self):
+        ga = GeneticAlgorithm(None)
+        ga.npop = 10
+        ga.lchrom = 12
+        old_gen = np.arange(ga.npop * ga.lchrom).reshape((ga.npop, ga.lchrom))
+
+        for cross_bits in (False, True):
+            ga.cross_bits = cross_bits
+
+            np.random.seed(3)
+            new_gen = ga.crossover(old_gen, 0.1)
+
+            np.random.seed(3)
+            sites = np.random.rand(ga.npop // 2, ga.lchrom)
+
+            # swap each site of each pair one at a time
+            expected = old_gen.copy()
+            for ii, jj in zip(*np.where(sites < 0.1)):
+                i = 2 * ii
+                j = i + 1
+                if cross_bits:
+                    expected[i, jj] = old_gen[j, jj]
+                    expected[j, jj] = old_gen[i, jj]
+                else:
+                    expected[i, jj:] = old_gen[j, jj:]
+                    expected[j, jj:] = old_gen[i, jj:]
+
+            np.testing.assert_array_equal(new_gen, expected)
+
     def test_vector_desvars_multiobj(self):
         prob = om.Problem()
 
@@ -466,6 +556,144 @@ class TestDriverOptionsSimpleGA(unittest.TestCase):
         self.assertEqual(driver.options['Pc'], 0.0123)
 
 
+@use_tempdirs
+class TestSimpleGACheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def run_ga(self, max_gen, seed, **options):
+        np.random.seed(seed)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(bits={'xC': 8}, pop_size=20, max_gen=max_gen)
+        prob.driver.options.update(options)
+
+        prob.setup()
+        prob.run_driver()
+
+        return prob
+
+    def test_resume(self):
+        expected = self.run_ga(10, seed=1)
+
+        # interrupted run, with checkpoints every 2 generations
+        self.run_ga(4, seed=1, checkpoint_file='ga.pkl', checkpoint_interval=2)
+
+        # continue from generation 4 using a different seed, which is replaced by the saved
+        # random state
+        prob = self.run_ga(10, seed=7, checkpoint_file='ga.pkl', resume=True)
+
+        assert_near_equal(prob['xI'], expected['xI'], 1e-12)
+        assert_near_equal(prob['xC'], expected['xC'], 1e-12)
+        assert_near_equal(prob['comp.f'], expected['comp.f'], 1e-12)
+
+        # generations 4 through 10 plus the final run
+        self.assertEqual(prob.model.comp.iter_count, 20 * 7 + 1)
+
+    def test_resume_wrong_size(self):
+        self.run_ga(2, seed=1, checkpoint_file='ga.pkl')
+
+        with self.assertRaises(RuntimeError) as cm:
+            self.run_ga(4, seed=1, checkpoint_file='ga.pkl', resume=True, pop_size=30)
+
+        self.assertEqual(str(cm.exception),
+                         "Checkpoint file 'ga.pkl' has a population size of 20 and a chromosome "
+                         "length of 12, but the current run has a population size of 30 and a "
+                         "chromosome length of 12.")
+
+
+class TestSimpleGASteadyState(unittest.TestCase):
+
+    def setUp(self):
+        os.environ['SimpleGADriver_seed'] = '11'
+
+    def test_branin(self):
+        np.random.seed(1)
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(bits={'xC': 8}, pop_size=20, max_gen=50,
+                                        steady_state=True)
+
+        prob.setup()
+        prob.run_driver()
+
+        # Optimal solution
+        assert_near_equal(prob['comp.f'], 0.49398, 0.2)
+        self.assertTrue(int(prob['xI']) in [3, -3])
+
+        # the same number of evaluations as the generational GA, plus the final run
+        self.assertEqual(prob.model.comp.iter_count, 20 * 51 + 1)
+
+    def test_slow_initial_population(self):
+        # offspring that finish before the initial members must not replace them, or be
+        # overwritten by them.
+        np.random.seed(11)
+
+        def objfun(x, icase):
+            return np.sum((x - 0.3) ** 2), True, icase
+
+        ga = GeneticAlgorithm(objfun)
+        ga.npop = 8
+        ga.lchrom = 3 * 8
+        bits = np.full(3, 8)
+        vlb = np.zeros(3)
+        vub = np.ones(3)
+        population = np.random.randint(2, size=(ga.npop, ga.lchrom)).astype(np.uint8)
+        initial = population.copy()
+
+        def on_initial(icase):
+            assert_near_equal(population[icase], initial[icase])
+
+        with mock.patch('openmdao.drivers.genetic_algorithm_driver.concurrent_eval_lb',
+                        _slow_initial_eval_lb(ga.npop, on_initial)):
+            xopt, fopt, nfit = ga._execute_steady_state(population, vlb, vub, vub, bits, 10,
+                                                        0.05, 0.5)
+
+        self.assertEqual(nfit, 8 * 11)
+
+        # the best point found is still in the population
+        fitness = [objfun(x, 0)[0] for x in ga.decode(population, vlb, vub, bits)]
+        self.assertEqual(np.min(fitness), fopt)
+
+    def test_unsupported(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Branin(), promotes_inputs=[('x0', 'xI'), ('x1', 'xC')])
+
+        model.add_design_var('xI', lower=-5.0, upper=10.0)
+        model.add_design_var('xC', lower=0.0, upper=15.0)
+        model.add_objective('comp.f')
+
+        prob.driver = om.SimpleGADriver(bits={'xC': 8}, steady_state=True, compute_pareto=True)
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_driver()
+
+        self.assertEqual(str(cm.exception),
+                         "SimpleGADriver: steady_state is not supported when compute_pareto "
+                         "is True.")
+
+
 class Box(om.ExplicitComponent):
 
     def setup(self):
@@ -619,6 +847,66 @@ class TestMultiObjectiveSimpleGA(unittest.TestCase):
         self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
         self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
 
+    def test_pareto_max_points(self):
+        np.random.seed(11)
+
+        prob = om.Problem()
+
+        indeps = prob.model.add_subsystem('indeps', om.IndepVarComp(), promotes=['*'])
+        indeps.add_output('length', 1.5)
+        indeps.add_output('width', 1.5)
+        indeps.add_output('height', 1.5)
+
+        prob.model.add_subsystem('box', Box(), promotes=['*'])
+
+        prob.driver = om.SimpleGADriver()
+        prob.driver.options['max_gen'] = 20
+        prob.driver.options['bits'] = {'length': 8, 'width': 8, 'height': 8}
+        prob.driver.options['penalty_parameter'] = 10.
+        prob.driver.options['compute_pareto'] = True
+        prob.driver.options['max_pareto_points'] = 5
+
+        prob.driver._randomstate = 11
+
+        prob.model.add_design_var('length', lower=0.1, upper=2.)
+        prob.model.add_design_var('width', lower=0.1, upper=2.)
+        prob.model.add_design_var('height', lower=0.1, upper=2.)
+        prob.model.add_objective('front_area', scaler=-1)  # maximize
+        prob.model.add_objective('top_area', scaler=-1)  # maximize
+        prob.model.add_constraint('volume', upper=1.)
+
+        prob.setup()
+        prob.run_driver()
+
+        nd_obj = prob.driver.obj_nd
+        self.assertEqual(nd_obj.shape, (5, 2))
+        self.assertEqual(prob.driver.desvar_nd.shape, (5, 3))
+
+        sorted_obj = nd_obj[nd_obj[:, 0].argsort()]
+        self.assertTrue(np.all(sorted_obj[:-1, 0] <= sorted_obj[1:, 0]))
+        self.assertTrue(np.all(sorted_obj[:-1, 1] >= sorted_obj[1:, 1]))
+
+    def test_non_dominated(self):
+        from openmdao.drivers.genetic_algorithm_driver import _non_dominated, _crowding_distance
+
+        rng = np.random.default_rng(7)
+
+        for nobj in (2, 3):
+            obj = rng.integers(0, 6, (60, nobj)).astype(float)
+            obj[5] = np.inf
+
+            # brute force: keep points not weakly dominated by another point, and only the
+            # first of any identical points.
+            expected = [i for i in range(len(obj))
+                        if not any(np.all(obj[j] <= obj[i]) and
+                                   (j < i or np.any(obj[j] < obj[i]))
+                                   for j in range(len(obj)) if j != i)]
+
+            np.testing.assert_array_equal(_non_dominated(obj), expected)
+
+        dist = _crowding_distance(np.array([[0., 4.], [1., 2.], [3., 1.], [4., 0.]]))
+        np.testing.assert_allclose(dist, [np.inf, 1.5, 1.25, np.inf])
+
 
 class TestConstrainedSimpleGA(unittest.TestCase):
 
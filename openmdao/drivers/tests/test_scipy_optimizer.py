@@ -8,6 +8,7 @@ from distutils.version import LooseVersion
 
 import numpy as np
 from scipy import __version__ as scipy_version
+from scipy.sparse import issparse
 
 import openmdao.api as om
 from openmdao.test_suite.components.expl_comp_array import TestExplCompArrayDense, TestExplCompArraySparse, TestExplCompArrayJacVec
@@ -20,6 +21,7 @@ from openmdao.test_suite.groups.sin_fitter import SineFitter
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.general_utils import run_driver
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.parallel_api import PETScVector
@@ -434,6 +436,57 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(prob['x'], 7.16667, 1e-6)
         assert_near_equal(prob['y'], -7.833334, 1e-6)
 
+    def test_model_run_cache(self):
+
+        class LoggedParaboloid(Paraboloid):
+
+            def initialize(self):
+                self.run_points = []
+                self.deriv_points = []
+
+            def compute(self, inputs, outputs):
+                self.run_points.append((inputs['x'][0], inputs['y'][0]))
+                super().compute(inputs, outputs)
+
+            def compute_partials(self, inputs, partials):
+                self.deriv_points.append((inputs['x'][0], inputs['y'][0]))
+                super().compute_partials(inputs, partials)
+
+        for optimizer in ['SLSQP', 'trust-constr']:
+            with self.subTest(optimizer=optimizer):
+                prob = om.Problem()
+                model = prob.model
+
+                model.set_input_defaults('x', val=40.)
+                model.set_input_defaults('y', val=45.)
+
+                comp = model.add_subsystem('comp', LoggedParaboloid(), promotes=['*'])
+                model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+                model.add_subsystem('con2', om.ExecComp('d = x * y'), promotes=['*'])
+
+                prob.set_solver_print(level=0)
+
+                prob.driver = om.ScipyOptimizeDriver(optimizer=optimizer, tol=1e-9, disp=False,
+                                                     maxiter=20)
+
+                model.add_design_var('x', lower=-50.0, upper=50.0)
+                model.add_design_var('y', lower=-50.0, upper=50.0)
+                model.add_objective('f_xy')
+                model.add_constraint('c', upper=-15.0)
+                model.add_constraint('d', lower=-500.0)
+
+                prob.setup()
+                prob.run_driver()
+
+                # Objective and constraints at a point share one model run, and objective and
+                # constraint gradients at a point share one derivative computation.
+                for points in (comp.run_points[1:], comp.deriv_points):
+                    for p1, p2 in zip(points[:-1], points[1:]):
+                        self.assertNotEqual(p1, p2)
+
+                self.assertEqual(len(prob.driver.model_runs), prob.driver.result.nit)
+                self.assertTrue(sum(prob.driver.model_runs) <= prob.driver.iter_count - 1)
+
     def test_simple_paraboloid_lower(self):
 
         prob = om.Problem()
@@ -1319,6 +1372,33 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(prob['x'][0], -1., 1e-2)
         assert_near_equal(prob['x'][1], -1.2, 1e-2)
 
+    @unittest.skipUnless(LooseVersion(scipy_version) >= LooseVersion("1.1"),
+                         "scipy >= 1.1 is required.")
+    def test_trust_constr_upper_con(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.set_input_defaults('x', val=40.)
+        model.set_input_defaults('y', val=45.)
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = - x + y'), promotes=['*'])
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='trust-constr', tol=1e-9, maxiter=2000,
+                                             disp=False)
+
+        model.add_design_var('x', lower=-50.0, upper=50.0)
+        model.add_design_var('y', lower=-50.0, upper=50.0)
+        model.add_objective('f_xy')
+        model.add_constraint('c', upper=-15.0)
+
+        prob.setup()
+        prob.run_driver()
+
+        # Minimum should be at (7.166667, -7.833334)
+        assert_near_equal(prob['x'], 7.16667, 1e-3)
+        assert_near_equal(prob['y'], -7.833334, 1e-3)
+
     def test_simple_paraboloid_lower_linear(self):
 
         prob = om.Problem()
@@ -2053,5 +2133,48 @@ class TestScipyOptimizeDriver(unittest.TestCase):
         assert_near_equal(prob.get_val('f'), 0.0, 1e-6)
 
 
+@use_tempdirs
+class TestScipyOptimizeDriverColoring(unittest.TestCase):
+
+    @unittest.skipUnless(LooseVersion(scipy_version) >= LooseVersion("1.1"),
+                         "scipy >= 1.1 is required.")
+    def test_trust_constr_sparse_jac(self):
+        n = 10
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('indeps', om.IndepVarComp('x', np.ones(n)), promotes=['*'])
+        model.add_subsystem('obj', om.ExecComp('f = sum((x - 3.0)**2)', x=np.ones(n)),
+                            promotes=['*'])
+        model.add_subsystem('con', om.ExecComp('c = x**2', x=np.ones(n), c=np.ones(n),
+                                               has_diag_partials=True), promotes=['*'])
+        model.add_subsystem('lin', om.ExecComp('l = 2.0 * x + 1.0', x=np.ones(n), l=np.ones(n),
+                                               has_diag_partials=True), promotes=['*'])
+
+        model.add_design_var('x', lower=-10.0, upper=10.0)
+        model.add_objective('f')
+        model.add_constraint('c', upper=2.0)
+        model.add_constraint('l', upper=3.6, linear=True)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='trust-constr', tol=1e-9, maxiter=500,
+                                             disp=False)
+        prob.driver.declare_coloring()
+
+        prob.setup()
+        prob.run_driver()
+
+        # the linear constraint is active
+        assert_near_equal(prob['x'], 1.3 * np.ones(n), 1e-3)
+        assert_near_equal(prob['f'], 28.9, 1e-3)
+
+        # the total jacobian is computed directly into the coloring sparsity
+        self.assertTrue(issparse(prob.driver._total_jac.J))
+        jac = prob.driver._con_jac_func(prob['x'].copy(), 'con.c')
+        self.assertEqual(jac.format, 'csr')
+        self.assertEqual(jac.nnz, n)
+        assert_near_equal(jac.toarray(), np.diag(2.0 * prob['x']), 1e-10)
+
+
 if __name__ == "__main__":
     unittest.main()
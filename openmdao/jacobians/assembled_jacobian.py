@@ -356,6 +356,7 @@ class AssembledJacobian(Jacobian):
 
         if ext_mtx is not None:
             ext_mtx._post_update()
+            ext_mtx._update_masked_mats()
 
         if self._under_complex_step:
             # If we create a new _int_mtx while under complex step, we need to convert it to a
@@ -1,5 +1,6 @@
 """Define the DictionaryJacobian class."""
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from openmdao.jacobians.jacobian import Jacobian
 from openmdao.core.constants import INT_DTYPE
@@ -9,10 +10,19 @@ class DictionaryJacobian(Jacobian):
     """
     No global <Jacobian>; use dictionary of user-supplied sub-Jacobians.
 
+    For components, the sub-Jacobians are compiled into one sparse operator over the flat output
+    vector and one over the flat input vector, so a matrix-vector product doesn't have to loop
+    over the sub-Jacobians.
+
     Attributes
     ----------
     _iter_keys : list of (vname, vname) tuples
         List of tuples of variable names that match subjacs in the this Jacobian.
+    _ops : dict
+        Compiled operator info keyed on (system pathname, vec_name).  Value is None if the
+        subjacs can't be compiled.
+    _ops_stale : bool
+        If True, the data of the compiled operators must be refreshed from the subjacs.
     """
 
     def __init__(self, system, **kwargs):
@@ -28,6 +38,45 @@ class DictionaryJacobian(Jacobian):
         """
         super().__init__(system, **kwargs)
         self._iter_keys = {}
+        self._ops = {}
+        self._ops_stale = True
+
+    def __setitem__(self, key, subjac):
+        """
+        Set sub-Jacobian.
+
+        Parameters
+        ----------
+        key : (str, str)
+            Promoted or relative name pair of sub-Jacobian.
+        subjac : int or float or ndarray or sparse matrix
+            sub-Jacobian as a scalar, vector, array, or AIJ list or tuple.
+        """
+        super().__setitem__(key, subjac)
+        self._ops_stale = True
+
+    def _update(self, system):
+        """
+        Mark the compiled operators as needing their data read from the sub-Jacobians.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        """
+        self._ops_stale = True
+
+    def set_complex_step_mode(self, active):
+        """
+        Turn on or off complex stepping mode.
+
+        Parameters
+        ----------
+        active : bool
+            Complex mode flag; set to True prior to commencing complex step.
+        """
+        super().set_complex_step_mode(active)
+        self._ops_stale = True
 
     def _iter_abs_keys(self, system, vec_name):
         """
@@ -63,6 +112,191 @@ class DictionaryJacobian(Jacobian):
 
         return self._iter_keys[entry]
 
+    def _compile_ops(self, keys, d_inputs, d_outputs, is_explicit):
+        """
+        Build the structure of the sparse operators that apply the subjacs of a component.
+
+        Parameters
+        ----------
+        keys : list of (str, str)
+            Keys of the subjacs to include.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+        is_explicit : bool
+            If True, subjacs of outputs wrt themselves are applied as -identity.
+
+        Returns
+        -------
+        dict or None
+            Operator info, or None if any of the subjacs is not stored as an ndarray.
+        """
+        subjacs_info = self._subjacs_info
+        offsets = {}
+        sizes = {}
+        for io, vec in (('output', d_outputs), ('input', d_inputs)):
+            for name, slc in vec.get_slice_dict().items():
+                offsets[name] = (io, slc.start)
+            sizes[io] = vec.asarray().size
+
+        parts = {'output': ([], [], []), 'input': ([], [], [])}
+        sig = []
+        val_keys = []
+        nvals = 0
+        for key in keys:
+            res_name, other_name = key
+            meta = subjacs_info[key]
+            val = meta['val']
+            if not isinstance(val, np.ndarray):
+                return None
+
+            rows = meta['rows']
+            sig.append((rows, val.shape))
+            _, row_start = offsets[res_name]
+            io, col_start = offsets[other_name]
+            if is_explicit and res_name == other_name:
+                # identity subjacs use the -1. stored at the end of the data source
+                slc = d_outputs.get_slice_dict()[res_name]
+                rows = cols = np.arange(slc.stop - slc.start)
+                src = np.full(rows.size, -1, dtype=INT_DTYPE)
+            else:
+                if rows is None:
+                    nrows, ncols = val.shape
+                    rows = np.repeat(np.arange(nrows), ncols)
+                    cols = np.tile(np.arange(ncols), nrows)
+                else:
+                    cols = meta['cols']
+                src = np.arange(nvals, nvals + val.size)
+                nvals += val.size
+                val_keys.append(key)
+
+            part_rows, part_cols, part_src = parts[io]
+            part_rows.append(rows + row_start)
+            part_cols.append(cols + col_start)
+            part_src.append(src)
+
+        ops = {'sig': sig, 'val_keys': val_keys, 'nvals': nvals, 'masks': {}}
+        for io, (part_rows, part_cols, part_src) in parts.items():
+            if not part_rows:
+                ops[io] = None
+                continue
+            rows = np.concatenate(part_rows)
+            cols = np.concatenate(part_cols)
+            src = np.concatenate(part_src)
+            src[src < 0] = nvals
+
+            # duplicate row/col entries are kept and summed by the matvec, like the bincount
+            # in the uncompiled product.
+            order = np.lexsort((cols, rows))
+            indptr = np.zeros(sizes['output'] + 1, dtype=INT_DTYPE)
+            np.cumsum(np.bincount(rows, minlength=sizes['output']), out=indptr[1:])
+            op = csr_matrix((np.zeros(rows.size), cols[order], indptr),
+                            shape=(sizes['output'], sizes[io]))
+            ops[io] = (op, op.T, src[order])
+
+        return ops
+
+    def _get_ops(self, system, vec_name, d_inputs, d_outputs):
+        """
+        Return the compiled operators of a component, refreshing their data if necessary.
+
+        Parameters
+        ----------
+        system : System
+            System that is updating this jacobian.
+        vec_name : str
+            The name of the current RHS vector.
+        d_inputs : Vector
+            inputs linear vector.
+        d_outputs : Vector
+            outputs linear vector.
+
+        Returns
+        -------
+        dict or None
+            Operator info, or None if the uncompiled product must be used.
+        """
+        # avoid circular import
+        from openmdao.core.component import Component
+        from openmdao.core.explicitcomponent import ExplicitComponent
+
+        if self._randomize or self._under_complex_step or \
+                self._subjacs_info is not system._subjacs_info or \
+                not isinstance(system, Component):
+            return None
+
+        entry = (system.pathname, vec_name)
+        keys = self._iter_abs_keys(system, vec_name)
+        subjacs_info = self._subjacs_info
+        ops = self._ops.get(entry, False)
+
+        if ops is not False and self._ops_stale:
+            # make sure the sparsity and storage of the subjacs haven't changed since the
+            # operators were built, e.g. by a sparsity computation.
+            for key, (rows, shape) in zip(keys, ops['sig'] if ops else ()):
+                meta = subjacs_info[key]
+                val = meta['val']
+                if meta['rows'] is not rows or not isinstance(val, np.ndarray) or \
+                        val.shape != shape:
+                    ops = False
+                    break
+
+        if ops is False:
+            ops = self._compile_ops(keys, d_inputs, d_outputs,
+                                    isinstance(system, ExplicitComponent))
+            self._ops[entry] = ops
+            self._ops_stale = True
+
+        if ops is not None and self._ops_stale:
+            data = np.empty(ops['nvals'] + 1)
+            start = 0
+            for key in ops['val_keys']:
+                val = subjacs_info[key]['val']
+                data[start:start + val.size] = val.ravel()
+                start += val.size
+            data[-1] = -1.
+            for io in ('output', 'input'):
+                if ops[io] is not None:
+                    op, _, src = ops[io]
+                    op.data[:] = data[src]
+            self._ops_stale = False
+
+        return ops
+
+    def _get_mask(self, ops, vec, io):
+        """
+        Return a mask of the entries of vec that belong to its current set of variables.
+
+        Parameters
+        ----------
+        ops : dict
+            Operator info.
+        vec : Vector
+            The linear vector.
+        io : str
+            'output' or 'input'.
+
+        Returns
+        -------
+        ndarray or None
+            The mask, or None if all variables are active.
+        """
+        names = vec._names
+        if len(names) == len(vec._views):
+            return None
+
+        mkey = (io, frozenset(names))
+        masks = ops['masks']
+        if mkey not in masks:
+            mask = np.zeros(vec.asarray().size)
+            slices = vec.get_slice_dict()
+            for name in names:
+                mask[slices[name]] = 1.
+            masks[mkey] = mask
+
+        return masks[mkey]
+
     def _apply(self, system, d_inputs, d_outputs, d_residuals, mode):
         """
         Compute matrix-vector product.
@@ -91,6 +325,29 @@ class DictionaryJacobian(Jacobian):
         if not d_out_names and not d_inp_names:
             return
 
+        if len(d_res_names) == len(d_residuals._views):
+            ops = self._get_ops(system, d_residuals._name, d_inputs, d_outputs)
+        else:
+            ops = None
+
+        if ops is not None:
+            with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+                r = d_residuals.asarray()
+                for io, vec, names in (('output', d_outputs, d_out_names),
+                                       ('input', d_inputs, d_inp_names)):
+                    if not names or ops[io] is None:
+                        continue
+                    op, op_T, _ = ops[io]
+                    mask = self._get_mask(ops, vec, io)
+                    v = vec.asarray()
+                    if fwd:
+                        r += op.dot(v if mask is None else v * mask)
+                    elif mask is None:
+                        v += op_T.dot(r)
+                    else:
+                        v += op_T.dot(r) * mask
+            return
+
         rflat = d_residuals._abs_get_val
         oflat = d_outputs._abs_get_val
         iflat = d_inputs._abs_get_val
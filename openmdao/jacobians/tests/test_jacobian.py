@@ -1071,6 +1071,44 @@ class OverlappingPartialsTestCase(unittest.TestCase):
                                                  [ 0., -1.,  0.],
                                                  [ 0., 13., -1.]]))
 
+    def test_csc_matrix_reused(self):
+        for src_indices, has_dups in (([1, 1], True), ([1, 0], False)):
+            with self.subTest(src_indices=src_indices):
+                p = Problem()
+                p.model.add_subsystem('indeps', IndepVarComp('x', np.ones(2)))
+                p.model.add_subsystem('C1', ExecComp('z=3.0*x[0]**3 + 2.0*x[1]**2',
+                                                     x=np.zeros(2)))
+
+                p.model.options['assembled_jac_type'] = 'csc'
+                p.model.linear_solver = DirectSolver(assemble_jac=True)
+
+                p.model.connect('indeps.x', 'C1.x', src_indices=src_indices)
+                p.setup()
+
+                for x in ([1.0, 1.0], [3.0, 2.0]):
+                    p['indeps.x'] = x
+                    p.run_model()
+                    p.compute_totals(of=['C1.z'], wrt=['indeps.x'])
+
+                    int_mtx = p.model._assembled_jac._int_mtx
+                    if x[0] == 1.0:
+                        matrix = int_mtx._matrix
+                        indices = matrix.indices
+
+                    # the CSC matrix and its structure are built once and updated in place
+                    self.assertIs(int_mtx._matrix, matrix)
+                    self.assertIs(int_mtx._matrix.indices, indices)
+                    self.assertEqual(int_mtx._has_dups, has_dups)
+
+                    x0, x1 = np.array(x)[src_indices]
+                    dz = np.zeros(2)
+                    dz[src_indices[0]] += 9.0 * x0**2
+                    dz[src_indices[1]] += 4.0 * x1
+                    np.testing.assert_almost_equal(matrix.toarray(),
+                                                   np.array([[-1., 0., 0.],
+                                                             [0., -1., 0.],
+                                                             [dz[0], dz[1], -1.]]))
+
     def test_repeated_src_indices_dense(self):
         size = 2
         p = Problem()
@@ -1194,6 +1232,141 @@ class MaskingTestCase(unittest.TestCase):
 
         np.testing.assert_allclose(totals, expected)
 
+    @parameterized.expand(itertools.product(['csc', 'dense'], ['fwd', 'rev']),
+                          name_func=_test_func_name)
+    def test_ext_mtx_masking(self, jac_type, mode):
+        from openmdao.test_suite.components.quad_implicit import QuadraticComp
+
+        def build(assemble):
+            prob = Problem()
+            model = prob.model
+
+            sub1 = model.add_subsystem('sub1', Group(assembled_jac_type=jac_type))
+            sub1.add_subsystem('q1', QuadraticComp())
+            sub1.add_subsystem('z1', ExecComp('y = -6.0 + .01 * x'))
+            sub2 = model.add_subsystem('sub2', Group(assembled_jac_type=jac_type))
+            sub2.add_subsystem('q2', QuadraticComp())
+            sub2.add_subsystem('z2', ExecComp('y = -6.0 + .01 * x'))
+
+            model.connect('sub1.q1.x', 'sub1.z1.x')
+            model.connect('sub1.z1.y', 'sub2.q2.c')
+            model.connect('sub2.q2.x', 'sub2.z2.x')
+            model.connect('sub2.z2.y', 'sub1.q1.c')
+
+            model.nonlinear_solver = NewtonSolver(solve_subsystems=False)
+            model.linear_solver = ScipyKrylov()
+            model.linear_solver.precon = LinearBlockGS()
+            model.options['assembled_jac_type'] = jac_type
+
+            prob.setup(mode=mode)
+
+            sub1.linear_solver = DirectSolver(assemble_jac=assemble)
+            sub2.linear_solver = DirectSolver(assemble_jac=assemble)
+
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            return prob
+
+        prob = build(True)
+        ref = build(False)
+        of = ['sub2.z2.y', 'sub1.q1.x']
+        wrt = ['sub1.q1.a', 'sub2.q2.b']
+
+        # the cached masked submatrices must pick up the new values after each linearize
+        for a, b in [(1., 1.), (2., -3.)]:
+            for p in (prob, ref):
+                p.set_val('sub1.q1.a', a)
+                p.set_val('sub2.q2.b', b)
+                p.run_model()
+
+            J = prob.compute_totals(of=of, wrt=wrt, return_format='array')
+            expected = ref.compute_totals(of=of, wrt=wrt, return_format='array')
+            assert_near_equal(J, expected, 1e-8)
+
+        self.assertTrue(len(prob.model.sub1._assembled_jac._ext_mtx['sub1']._masked_mats) > 0)
+
+class CompiledOpsComp(ImplicitComponent):
+    def setup(self):
+        self.add_input('x', val=np.ones(3))
+        self.add_input('w', val=np.ones(2))
+        self.add_output('y', val=np.ones(3))
+        self.add_output('z', val=np.ones(2))
+
+        self.declare_partials('y', 'x')
+        self.declare_partials('y', 'y', rows=[0, 1, 2, 0], cols=[0, 1, 2, 1])
+        self.declare_partials('y', 'w', rows=[2], cols=[1], val=5.)
+        self.declare_partials('z', 'x', rows=[0, 1], cols=[2, 0])
+        self.declare_partials('z', 'z')
+
+    def linearize(self, inputs, outputs, partials):
+        x = inputs['x']
+        partials['y', 'x'] = np.outer(np.arange(1., 4.), x)
+        partials['y', 'y'] = np.array([1., 2., 3., x[0]])
+        partials['z', 'x'] = np.array([x[1], 7.])
+        # modify a subjac in place
+        partials['z', 'z'][:] = [[1., 2.], [3., 4.]]
+        partials['z', 'z'][1, 0] = x[2]
+
+
+class CompiledOpsTestCase(unittest.TestCase):
+    def _jac(self, x):
+        J = np.zeros((5, 10))
+        J[:3, :3] = np.diag([1., 2., 3.])
+        J[0, 1] = x[0]
+        J[3:, 3:5] = [[1., 2.], [x[2], 4.]]
+        J[:3, 5:8] = np.outer(np.arange(1., 4.), x)
+        J[2, 9] = 5.
+        J[3, 7] = x[1]
+        J[4, 5] = 7.
+        return J
+
+    def _check(self, prob, scope_in=None):
+        comp = prob.model.comp
+        d_inputs, d_outputs, d_residuals = comp.get_linear_vectors()
+        J = self._jac(prob.get_val('comp.x'))
+        if scope_in is not None:
+            J[:, 8:] = 0.
+
+        np.random.seed(11)
+        vec = np.random.random(5)
+        ivec = np.random.random(5)
+
+        d_outputs.set_val(vec[:5])
+        d_inputs.set_val(ivec)
+        d_residuals.set_val(0.)
+        comp.run_apply_linear('fwd', scope_in=scope_in)
+        assert_near_equal(d_residuals.asarray(), J.dot(np.hstack((vec, ivec))), 1e-12)
+
+        d_residuals.set_val(vec)
+        d_outputs.set_val(0.)
+        d_inputs.set_val(0.)
+        comp.run_apply_linear('rev', scope_in=scope_in)
+        rev = J.T.dot(vec)
+        assert_near_equal(d_outputs.asarray(), rev[:5], 1e-12)
+        assert_near_equal(d_inputs.asarray(), rev[5:], 1e-12)
+
+    def test_compiled_ops(self):
+        prob = Problem()
+        prob.model.add_subsystem('comp', CompiledOpsComp())
+        prob.setup()
+        prob.set_val('comp.x', [2., 3., 4.])
+        prob.final_setup()
+        prob.model.run_linearize()
+
+        self._check(prob)
+        self._check(prob, scope_in={'comp.x'})
+
+        # new partials after the next linearize must be used
+        prob.set_val('comp.x', [-1., 5., 6.])
+        prob.model.run_linearize()
+        self._check(prob)
+        self._check(prob, scope_in={'comp.x'})
+
+        jac = prob.model.comp._jacobian
+        self.assertEqual(len(jac._ops), 1)
+        self.assertIsNotNone(list(jac._ops.values())[0])
+
 
 if __name__ == '__main__':
     unittest.main()
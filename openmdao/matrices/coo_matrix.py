@@ -1,7 +1,7 @@
 """Define the COOmatrix class."""
 import numpy as np
 from numpy import ndarray
-from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 
 from collections import OrderedDict
 
@@ -17,6 +17,10 @@ class COOMatrix(Matrix):
     ----------
     _coo : coo_matrix
         COO matrix. Used as a basis for conversion to CSC, CSR, Dense in inherited classes.
+    _masked_mats : dict
+        Submatrices with the masked entries removed, keyed on id(mask).  Values are tuples of
+        the form (mask, src, submat), where src gives the location in the data of _matrix of
+        each entry in submat.
     """
 
     def __init__(self, comm, is_internal):
@@ -32,6 +36,7 @@ class COOMatrix(Matrix):
         """
         super().__init__(comm, is_internal)
         self._coo = None
+        self._masked_mats = {}
 
     def _build_coo(self, system):
         """
@@ -208,24 +213,65 @@ class COOMatrix(Matrix):
 
         # NOTE: mask applies only to ext_mtx.
 
+        if mask is not None:
+            mat = self._get_masked_mat(mask)
+
         if mode == 'fwd':
-            if mask is None:
-                return mat.dot(in_vec)
-            else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.dot(in_vec)
-                mat.data[mask] = save
-                return val
+            return mat.dot(in_vec)
         else:  # rev
-            if mask is None:
-                return mat.T.dot(in_vec)
+            return mat.T.dot(in_vec)
+
+    def _get_masked_mat(self, mask):
+        """
+        Return the cached submatrix that excludes the entries that are masked out.
+
+        Parameters
+        ----------
+        mask : ndarray of type bool
+            Array of the entries of the matrix data to exclude.
+
+        Returns
+        -------
+        csr_matrix
+            The submatrix.
+        """
+        try:
+            _mask, src, submat = self._masked_mats[id(mask)]
+        except KeyError:
+            _mask = None
+
+        data = self._matrix.data
+
+        if _mask is not mask:
+            coo = self._matrix.tocoo(copy=False)
+            keep = np.nonzero(~mask)[0]
+            rows = coo.row[keep]
+            src = keep[np.lexsort((coo.col[keep], rows))]
+
+            nrows = coo.shape[0]
+            indptr = np.zeros(nrows + 1, dtype=INT_DTYPE)
+            np.cumsum(np.bincount(rows, minlength=nrows), out=indptr[1:])
+
+            # repeated entries are summed during the product
+            submat = csr_matrix((data[src], coo.col[src], indptr), shape=coo.shape)
+            self._masked_mats[id(mask)] = (mask, src, submat)
+
+        elif submat.dtype != data.dtype:
+            # complex step mode was changed since the last update
+            submat.data = data[src]
+
+        return submat
+
+    def _update_masked_mats(self):
+        """
+        Refresh the data of any cached masked submatrices after AssembledJacobian._update.
+        """
+        data = self._matrix.data
+        for _, src, submat in self._masked_mats.values():
+            if submat.dtype == data.dtype:
+                np.take(data, src, out=submat.data)
             else:
-                save = mat.data[mask]
-                mat.data[mask] = 0.0
-                val = mat.T.dot(in_vec)
-                mat.data[mask] = save
-                return val
+                submat.data = data[src]
 
     def _create_mask_cache(self, d_inputs):
         """
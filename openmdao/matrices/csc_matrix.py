@@ -3,14 +3,42 @@
 import numpy as np
 from scipy.sparse import csc_matrix
 
+from openmdao.core.constants import INT_DTYPE
 from openmdao.matrices.coo_matrix import COOMatrix
 
 
 class CSCMatrix(COOMatrix):
     """
     Sparse matrix in Compressed Col Storage format.
+
+    Attributes
+    ----------
+    _csc : csc_matrix
+        CSC matrix.  It is built once, and its data array is updated in place.
+    _coo2csc : ndarray or None
+        Index into the CSC data of each entry of the COO data.
+    _has_dups : bool
+        If True, some COO entries share a location, so the CSC data must be computed by summing
+        the COO data after each update.  Otherwise the subjacs are written directly into the
+        CSC data.
     """
 
+    def __init__(self, comm, is_internal):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm>
+            communicator of the top-level system that owns the <Jacobian>.
+        is_internal : bool
+            If True, this is the int_mtx of an AssembledJacobian.
+        """
+        super().__init__(comm, is_internal)
+        self._csc = None
+        self._coo2csc = None
+        self._has_dups = False
+
     def _build(self, num_rows, num_cols, system=None):
         """
         Allocate the matrix.
@@ -25,24 +53,55 @@ class CSCMatrix(COOMatrix):
             owning system.
         """
         super()._build(num_rows, num_cols, system)
-        self._coo = self._matrix
+        coo = self._coo
+
+        # Sort the COO entries into CSC order and give each distinct location a position in the
+        # CSC data.
+        order = np.lexsort((coo.row, coo.col))
+        rows = coo.row[order]
+        cols = coo.col[order]
+
+        distinct = np.ones(rows.size, dtype=bool)
+        distinct[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        self._has_dups = not np.all(distinct)
+
+        self._coo2csc = coo2csc = np.empty(rows.size, dtype=INT_DTYPE)
+        coo2csc[order] = np.cumsum(distinct) - 1
+
+        indptr = np.zeros(num_cols + 1, dtype=INT_DTYPE)
+        np.cumsum(np.bincount(cols[distinct], minlength=num_cols), out=indptr[1:])
+
+        self._matrix = self._csc = csc_matrix((np.zeros(indptr[-1]), rows[distinct], indptr),
+                                              shape=coo.shape)
+
+        if not self._has_dups:
+            # Subjacs can be written straight into the CSC data.
+            metadata = self._metadata
+            for key, (idxs, jac_type, factor) in metadata.items():
+                metadata[key] = (coo2csc[idxs], jac_type, factor)
 
     def _pre_update(self):
         """
         Do anything that needs to be done at the start of AssembledJacobian._update.
         """
-        self._matrix = self._coo
+        if self._has_dups:
+            self._matrix = self._coo
 
     def _post_update(self):
         """
         Do anything that needs to be done at the end of AssembledJacobian._update.
         """
-        coo = self._coo
-        # this will add any repeated entries together
-        # NOTE: The CSC matrix was created in the following way instead of using self._coo.tocsc()
-        # because on older versions of scipy, self._coo.tocsc() reuses the row/col arrays and the
-        # result is that self._coo.row and self._coo.col get scrambled after csc conversion.
-        self._matrix = csc_matrix((coo.data, (coo.row, coo.col)), shape=coo.shape)
+        if self._has_dups:
+            # this will add any repeated entries together
+            data = self._coo.data
+            csc = self._csc
+            nnz = csc.data.size
+            if np.iscomplexobj(data):
+                csc.data[:] = np.bincount(self._coo2csc, data.real, minlength=nnz) + \
+                    1j * np.bincount(self._coo2csc, data.imag, minlength=nnz)
+            else:
+                csc.data[:] = np.bincount(self._coo2csc, data, minlength=nnz)
+            self._matrix = csc
 
     def _convert_mask(self, mask):
         """
@@ -58,9 +117,9 @@ class CSCMatrix(COOMatrix):
         ndarray
             The converted mask array.
         """
-        coo = self._coo
-        csc = csc_matrix((mask, (coo.row, coo.col)), shape=coo.shape)
-        return csc.data
+        csc_mask = np.zeros(self._csc.data.size, dtype=bool)
+        csc_mask[self._coo2csc[mask]] = True
+        return csc_mask
 
     def set_complex_step_mode(self, active):
         """
@@ -75,13 +134,13 @@ class CSCMatrix(COOMatrix):
             Complex mode flag; set to True prior to commencing complex step.
         """
         if active:
-            if 'complex' not in self._matrix.dtype.__str__():
-                self._matrix.data = self._matrix.data.astype(np.complex)
-                self._matrix.dtype = np.complex
+            if 'complex' not in self._csc.dtype.__str__():
+                self._csc.data = self._csc.data.astype(np.complex)
+                self._csc.dtype = np.complex
                 self._coo.data = self._coo.data.astype(np.complex)
                 self._coo.dtype = np.complex
         else:
-            self._matrix.data = self._matrix.data.real
-            self._matrix.dtype = np.float
+            self._csc.data = self._csc.data.real
+            self._csc.dtype = np.float
             self._coo.data = self._coo.data.real
             self._coo.dtype = np.float
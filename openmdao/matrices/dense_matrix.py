@@ -58,22 +58,54 @@ class DenseMatrix(COOMatrix):
             if mask is None:
                 return mat.dot(in_vec)
             else:
-                # Use the special dot product function from masking module so that we
-                # ignore masked parts.
-                return np.ma.dot(mat, np.ma.array(in_vec, mask=mask))
+                keep, submat = self._get_masked_mat(mask)
+                return submat.dot(in_vec[keep])
         else:  # rev
             if mask is None:
                 return mat.T.dot(in_vec)
             else:
                 # Mask need to be applied to ext_mtx so that we can ignore multiplication
                 # by certain columns.
-                mat_T = mat.T
-                arrmask = np.zeros(mat_T.shape, dtype=np.bool)
-                arrmask[mask, :] = True
-                masked_mtx = np.ma.array(mat_T, mask=arrmask, fill_value=0.0)
+                keep, submat = self._get_masked_mat(mask)
+                prod = np.zeros(mat.shape[1], dtype=np.result_type(submat, in_vec))
+                prod[keep] = submat.T.dot(in_vec)
+                return prod
 
-                masked_product = np.ma.dot(masked_mtx, in_vec).flatten()
-                return np.ma.filled(masked_product, fill_value=0.0)
+    def _get_masked_mat(self, mask):
+        """
+        Return the cached submatrix made up of the columns that are not masked out.
+
+        Parameters
+        ----------
+        mask : ndarray of type bool
+            Array of the columns of the matrix to exclude.
+
+        Returns
+        -------
+        ndarray
+            Indices of the columns that are kept.
+        ndarray
+            The submatrix.
+        """
+        try:
+            _mask, keep, submat = self._masked_mats[id(mask)]
+        except KeyError:
+            _mask = None
+
+        if _mask is not mask or submat.dtype != self._matrix.dtype:
+            keep = np.nonzero(~mask)[0]
+            submat = self._matrix[:, keep]
+            self._masked_mats[id(mask)] = (mask, keep, submat)
+
+        return keep, submat
+
+    def _update_masked_mats(self):
+        """
+        Refresh the data of any cached masked submatrices after AssembledJacobian._update.
+        """
+        mat = self._matrix
+        for key, (mask, keep, _) in self._masked_mats.items():
+            self._masked_mats[key] = (mask, keep, mat[:, keep])
 
     def _create_mask_cache(self, d_inputs):
         """
@@ -95,9 +127,9 @@ class DenseMatrix(COOMatrix):
         if d_inputs._in_matvec_context():
             sub = d_inputs._names
             mask = np.ones(len(d_inputs), dtype=np.bool)
-            for key, val in self._metadata.items():
+            for key, (_, (_, icol), _, shape, _) in self._submats.items():
                 if key[1] in sub:
-                    mask[val[1]] = False
+                    mask[icol:icol + shape[1]] = False
 
             return mask
 
@@ -128,6 +128,12 @@ class Matrix(object):
         """
         pass
 
+    def _update_masked_mats(self):
+        """
+        Refresh the data of any cached masked submatrices after AssembledJacobian._update.
+        """
+        pass
+
     def set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
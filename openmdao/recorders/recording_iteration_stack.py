@@ -1,4 +1,5 @@
 """Management of iteration stack for recording."""
+import threading
 import weakref
 
 from openmdao.utils.mpi import MPI
@@ -6,12 +7,13 @@ from openmdao.utils.mpi import MPI
 _norec_funcs = frozenset(['_run_apply', '_compute_totals'])
 
 
-class _RecIteration(object):
+class _RecIteration(threading.local):
     """
     A class that encapsulates the iteration stack.
 
     Some tests needed to reset the stack and this avoids issues
-    with data left over from other tests.
+    with data left over from other tests. Each thread has its own stack, so subsystems
+    solved on threads don't interleave their iteration coordinates.
 
     Attributes
     ----------
@@ -29,6 +31,17 @@ class _RecIteration(object):
         self.prefix = None
         self._norec_refcount = 0
 
+    def __reduce__(self):
+        """
+        Pickle the state of the current thread, since thread local objects can't be pickled.
+
+        Returns
+        -------
+        tuple
+            The class, its constructor arguments, and the state of the current thread.
+        """
+        return (self.__class__, (), self.__dict__.copy())
+
     def print_recording_iteration_stack(self):
         """
         Print the record iteration stack.
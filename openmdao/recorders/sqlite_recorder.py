@@ -149,6 +149,8 @@ class SqliteRecorder(CaseRecorder):
         set of recording requesters for which this recorder has been started.
     _record_on_proc : bool
         Flag indicating whether to record on this processor when running in parallel.
+    _append : bool
+        If True, append to an existing case recorder file.
     """
 
     def __init__(self, filepath, append=False, pickle_version=4, record_viewer_data=True):
@@ -160,15 +162,14 @@ class SqliteRecorder(CaseRecorder):
         filepath : str
             Path to the recorder file.
         append : bool, optional
-            Optional. If True, append to an existing case recorder file.
+            Optional. If True, append to an existing case recorder file.  The file must have been
+            created by a SqliteRecorder for the same model.
         pickle_version : int, optional
             The pickle protocol version to use when pickling metadata.
         record_viewer_data : bool, optional
             If True, record data needed for visualization.
         """
-        if append:
-            raise NotImplementedError("Append feature not implemented for SqliteRecorder")
-
+        self._append = append
         self.connection = None
         self.metadata_connection = None
         self._record_metadata = True
@@ -191,6 +192,8 @@ class SqliteRecorder(CaseRecorder):
         """
         Initialize the database.
         """
+        create_metadata = True
+
         if MPI:
             rank = MPI.COMM_WORLD.rank
             if self._parallel and self._record_on_proc:
@@ -201,13 +204,16 @@ class SqliteRecorder(CaseRecorder):
                 if rank == 0:
                     metadata_filepath = f'{self._filepath}_meta'
                     print(f"Note: Metadata is being recorded separately as {metadata_filepath}.")
-                    try:
-                        os.remove(metadata_filepath)
-                        issue_warning('The existing case recorder metadata file, '
-                                      f'{metadata_filepath}, is being overwritten.',
-                                      category=UserWarning)
-                    except OSError:
-                        pass
+                    if self._append and os.path.exists(metadata_filepath):
+                        create_metadata = False
+                    else:
+                        try:
+                            os.remove(metadata_filepath)
+                            issue_warning('The existing case recorder metadata file, '
+                                          f'{metadata_filepath}, is being overwritten.',
+                                          category=UserWarning)
+                        except OSError:
+                            pass
                     self.metadata_connection = sqlite3.connect(metadata_filepath)
                 else:
                     self._record_metadata = False
@@ -219,6 +225,14 @@ class SqliteRecorder(CaseRecorder):
             filepath = self._filepath
 
         if filepath:
+            if self._append and os.path.exists(filepath):
+                # tables already exist, so just connect to the existing file
+                self.connection = sqlite3.connect(filepath)
+                if self._record_metadata and self.metadata_connection is None:
+                    self.metadata_connection = self.connection
+                self._database_initialized = True
+                return
+
             try:
                 os.remove(filepath)
                 issue_warning(f'The existing case recorder file, {filepath},'
@@ -260,7 +274,7 @@ class SqliteRecorder(CaseRecorder):
                           "solver_inputs TEXT, solver_output TEXT, solver_residuals TEXT)")
                 c.execute("CREATE INDEX solv_iter_ind on solver_iterations(iteration_coordinate)")
 
-            if self._record_metadata:
+            if self._record_metadata and create_metadata:
                 with self.metadata_connection as m:
                     m.execute("CREATE TABLE metadata(format_version INT, openmdao_version TEXT, "
                               "abs2prom BLOB, prom2abs BLOB, abs2meta BLOB, var_settings BLOB,"
@@ -324,6 +338,11 @@ class SqliteRecorder(CaseRecorder):
         if not self._database_initialized:
             self._initialize_database()
 
+        if self._append and self.connection is not None:
+            # continue numbering after the cases already in the file
+            cur = self.connection.execute("SELECT COUNT(*) FROM global_iterations")
+            self._counter = cur.fetchone()[0]
+
         # grab the system and driver
         if isinstance(recording_requester, Driver):
             system = recording_requester._problem().model
@@ -691,10 +710,13 @@ class SqliteRecorder(CaseRecorder):
         if self._record_metadata and self.metadata_connection:
             json_data = json.dumps(model_viewer_data, default=default_noraise)
 
+            # when appending, the data from the earlier run is replaced
+            insert = "INSERT OR REPLACE" if self._append else "INSERT"
+
             # Note: recorded to 'driver_metadata' table for legacy/compatibility reasons.
             try:
                 with self.metadata_connection as m:
-                    m.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
+                    m.execute(f"{insert} INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
                               (key, json_data))
             except sqlite3.IntegrityError:
                 print("Model viewer data has already has already been recorded for %s." % key)
@@ -746,8 +768,11 @@ class SqliteRecorder(CaseRecorder):
             else:
                 name = META_KEY_SEP.join([path, str(run_number)])
 
+            # when appending, the data from the earlier run is replaced
+            insert = "INSERT OR REPLACE" if self._append else "INSERT"
+
             with self.metadata_connection as m:
-                m.execute("INSERT INTO system_metadata"
+                m.execute(f"{insert} INTO system_metadata"
                           "(id, scaling_factors, component_metadata) "
                           "VALUES(?,?,?)", (name, scaling_factors,
                                             pickled_metadata))
@@ -778,8 +803,11 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = zlib.compress(pickle.dumps(solver.options, self._pickle_version))
 
+            # when appending, the data from the earlier run is replaced
+            insert = "INSERT OR REPLACE" if self._append else "INSERT"
+
             with self.metadata_connection as m:
-                m.execute("INSERT INTO solver_metadata(id, solver_options, solver_class)"
+                m.execute(f"{insert} INTO solver_metadata(id, solver_options, solver_class)"
                           " VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
     def record_derivatives_driver(self, recording_requester, data, metadata):
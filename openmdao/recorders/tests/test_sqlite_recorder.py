@@ -438,6 +438,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -453,6 +455,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p2",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -468,9 +472,13 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : comp",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "    Subsystem : con",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
@@ -533,6 +541,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p1",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -548,6 +558,8 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : p2",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        name: UNDEFINED",
             "        val: 1.0",
             "        shape: None",
@@ -563,9 +575,13 @@ class TestSqliteRecorder(unittest.TestCase):
             "    Subsystem : comp",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "    Subsystem : con",
             "        distributed: False",
             "        run_root_only: False",
+            "        cache_size: 0",
+            "        cache_file: None",
             "        has_diag_partials: False",
             "        units: None",
             "        shape: None",
@@ -1954,6 +1970,27 @@ class TestSqliteRecorder(unittest.TestCase):
         expected_data = ((coordinate, (t0, t1), expected_outputs, None, None),)
         assertDriverIterDataRecorded(self, expected_data, self.eps)
 
+    def test_duplicate_metadata(self):
+        # metadata is only replaced when appending
+        for append in (False, True):
+            prob = SellarProblem()
+            recorder = om.SqliteRecorder(self.filename, append=append)
+            prob.model.add_recorder(recorder)
+            prob.model.nonlinear_solver.add_recorder(recorder)
+            prob.setup()
+            prob.run_model()
+
+            if append:
+                recorder.record_metadata_system(prob.model)
+                recorder.record_metadata_solver(prob.model.nonlinear_solver)
+            else:
+                with self.assertRaises(sqlite3.IntegrityError):
+                    recorder.record_metadata_system(prob.model)
+                with self.assertRaises(sqlite3.IntegrityError):
+                    recorder.record_metadata_solver(prob.model.nonlinear_solver)
+
+            prob.cleanup()
+
     def test_recorder_cleanup(self):
         def assert_closed(self, recorder):
             try:
@@ -2737,7 +2774,11 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['name'], 'DOEDriver')
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'load_balance': False, 'prefetch': 1,
+                                               'local_workers': 0, 'case_timeout': None,
+                                               'resume': False, 'batch_size': 1,
+                                               'batched_vars': []})
 
         # Optimization
         driver = prob.driver = om.ScipyOptimizeDriver()
@@ -6,6 +6,7 @@ import numpy as np
 import scipy.linalg
 import scipy.sparse.linalg
 from scipy.sparse import csc_matrix
+from scipy.sparse.csgraph import connected_components, maximum_bipartite_matching
 
 from openmdao.solvers.solver import LinearSolver
 from openmdao.matrices.dense_matrix import DenseMatrix
@@ -163,13 +164,102 @@ def format_nan_error(system, matrix):
     return msg.format(system.msginfo, ', '.join(varnames))
 
 
+def _block_triangular_order(matrix):
+    """
+    Compute row and column orderings that put a square sparse matrix in block lower triangular form.
+
+    A column ordering from a maximum matching puts nonzeros on the whole diagonal, and the
+    strongly connected components of the resulting graph, in dependency order, are the diagonal
+    blocks (the fine Dulmage-Mendelsohn decomposition of a structurally nonsingular matrix).
+
+    Parameters
+    ----------
+    matrix : csc_matrix
+        The matrix. Only its sparsity is used.
+
+    Returns
+    -------
+    tuple(ndarray, ndarray, ndarray) or None
+        Row ordering, column ordering, and the start index of each diagonal block followed by
+        the matrix size, or None if the matrix is structurally singular.
+    """
+    n = matrix.shape[0]
+    pattern = csc_matrix((np.ones(matrix.nnz), matrix.indices, matrix.indptr), shape=matrix.shape)
+
+    # col_match[i] is the column placed on the diagonal in row i.
+    col_match = maximum_bipartite_matching(pattern.tocsr(), perm_type='column')
+    if np.any(col_match < 0):
+        return None
+
+    # Row i of the matched matrix depends on the unknowns of the rows whose diagonal columns
+    # it touches.
+    matched = pattern[:, col_match].tocsr()
+    nblocks, labels = connected_components(matched, directed=True, connection='strong')
+
+    # Order the blocks so that each one comes after all the blocks it depends on.
+    coo = matched.tocoo()
+    mask = labels[coo.row] != labels[coo.col]
+    edges = np.unique(np.vstack([labels[coo.row][mask], labels[coo.col][mask]]), axis=1)
+    ndeps = np.bincount(edges[0], minlength=nblocks)
+    dependents = [[] for _ in range(nblocks)]
+    for block, dep in edges.T:
+        dependents[dep].append(block)
+
+    ready = list(np.nonzero(ndeps == 0)[0])
+    block_order = np.empty(nblocks, dtype=int)
+    for i in range(nblocks):
+        block = ready.pop()
+        block_order[block] = i
+        for dependent in dependents[block]:
+            ndeps[dependent] -= 1
+            if ndeps[dependent] == 0:
+                ready.append(dependent)
+
+    rows = np.argsort(block_order[labels], kind='stable')
+    sizes = np.bincount(block_order[labels], minlength=nblocks)
+    starts = np.concatenate(([0], np.cumsum(sizes)))
+
+    # Merge runs of 1x1 blocks, which form triangular blocks that factor without fill.
+    keep = [0]
+    for i in range(1, nblocks):
+        if sizes[i] > 1 or sizes[i - 1] > 1:
+            keep.append(i)
+    keep.append(nblocks)
+
+    return rows, col_match[rows], starts[keep]
+
+
 class DirectSolver(LinearSolver):
     """
     LinearSolver that uses linalg.solve or LU factor/solve.
+
+    Attributes
+    ----------
+    _btf : tuple or None
+        Cached row ordering, column ordering, block starts, and the mapping from the stored
+        entries of the permuted matrix to the stored entries of the assembled matrix. Only used
+        if the block_triangular option is True.
+    _btf_blocks : list or None
+        For each diagonal block, its start, end, LU factorization, the rows of the permuted matrix
+        to its left, and the columns of the permuted matrix below it.
     """
 
     SOLVER = 'LN: Direct'
 
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+
+        self._btf = None
+        self._btf_blocks = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -178,6 +268,11 @@ class DirectSolver(LinearSolver):
 
         self.options.declare('err_on_singular', types=bool, default=True,
                              desc="Raise an error if LU decomposition is singular.")
+        self.options.declare('block_triangular', types=bool, default=False,
+                             desc="When True, permute a sparse assembled jacobian to block "
+                             "triangular form and only factor its diagonal blocks. The ordering "
+                             "is computed once from the sparsity pattern. This is ignored for "
+                             "dense or unassembled jacobians.")
 
         # this solver does not iterate
         self.options.undeclare("maxiter")
@@ -203,6 +298,9 @@ class DirectSolver(LinearSolver):
         super()._setup_solvers(system, depth)
         self._disallow_distrib_solve()
 
+        self._btf = None
+        self._btf_blocks = None
+
     def _linearize_children(self):
         """
         Return a flag that is True when we need to call linearize on our subsystems' solvers.
@@ -273,7 +371,11 @@ class DirectSolver(LinearSolver):
             # Perform dense or sparse lu factorization.
             elif isinstance(matrix, csc_matrix):
                 try:
-                    self._lu = scipy.sparse.linalg.splu(matrix)
+                    if self.options['block_triangular'] and self._factor_block_triangular(matrix):
+                        self._lu = None
+                    else:
+                        self._btf_blocks = None
+                        self._lu = scipy.sparse.linalg.splu(matrix)
                 except RuntimeError as err:
                     if 'exactly singular' in str(err):
                         raise RuntimeError(format_singular_error(system, matrix))
@@ -323,6 +425,100 @@ class DirectSolver(LinearSolver):
                 except ValueError as err:
                     raise RuntimeError(format_nan_error(system, mtx))
 
+    def _factor_block_triangular(self, matrix):
+        """
+        Factor the diagonal blocks of the block triangular form of the matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled matrix.
+
+        Returns
+        -------
+        bool
+            False if the matrix has no useful block triangular form, so it must be factored whole.
+        """
+        btf = self._btf
+        if btf is None or btf[3].size != matrix.nnz:
+            order = _block_triangular_order(matrix)
+            if order is None or order[2].size < 3:
+                # structurally singular, or a single block
+                self._btf = (None, None, None, np.empty(matrix.nnz, dtype=int))
+                return False
+
+            rows, cols, starts = order
+
+            # find where each stored entry of the assembled matrix lands in the permuted one.
+            positions = csc_matrix((np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices,
+                                    matrix.indptr), shape=matrix.shape)
+            permuted = positions[rows][:, cols].tocsc()
+            permuted.sort_indices()
+            self._btf = btf = (rows, cols, starts, permuted.data.astype(int) - 1,
+                               permuted.indices, permuted.indptr)
+
+        rows, cols, starts, src = btf[:4]
+        if rows is None:
+            return False
+
+        permuted = csc_matrix((matrix.data[src], btf[4], btf[5]), shape=matrix.shape)
+        permuted_rows = permuted.tocsr()
+
+        blocks = []
+        for start, end in zip(starts[:-1], starts[1:]):
+            diag = permuted[:, start:end][start:end, :].tocsc()
+            if scipy.sparse.triu(diag, 1).nnz == 0:
+                # merged run of 1x1 blocks, which is lower triangular.
+                lu = scipy.sparse.linalg.splu(diag, permc_spec='NATURAL', diag_pivot_thresh=0.0)
+            else:
+                lu = scipy.sparse.linalg.splu(diag)
+
+            blocks.append((start, end, lu, permuted_rows[start:end, :start],
+                           permuted[start:, start:end].T.tocsr()))
+
+        self._btf_blocks = blocks
+        return True
+
+    def _solve_block_triangular(self, b_vec, trans):
+        """
+        Solve with the factored block triangular form.
+
+        Parameters
+        ----------
+        b_vec : ndarray
+            Right hand side.
+        trans : bool
+            If True, solve with the transpose.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        rows, cols = self._btf[:2]
+        y = np.zeros(b_vec.size, dtype=np.result_type(b_vec, self._btf_blocks[0][2].U.dtype))
+
+        if trans:
+            # block back substitution with the transposed (upper triangular) form.
+            b = b_vec[cols]
+            for start, end, lu, _, lower in reversed(self._btf_blocks):
+                rhs = b[start:end] - lower[:, end - start:].dot(y[end:])
+                y[start:end] = lu.solve(rhs, 'T')
+
+            x = np.empty_like(y)
+            x[rows] = y
+        else:
+            # block forward substitution
+            b = b_vec[rows]
+            for start, end, lu, left, _ in self._btf_blocks:
+                rhs = b[start:end] - left.dot(y[:start]) if start > 0 else b[start:end]
+                y[start:end] = lu.solve(rhs)
+
+            x = np.empty_like(y)
+            x[cols] = y
+
+        return x
+
     def _inverse(self):
         """
         Return the inverse Jacobian.
@@ -441,6 +637,8 @@ class DirectSolver(LinearSolver):
             with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
                 if isinstance(self._assembled_jac._int_mtx, DenseMatrix):
                     arr = scipy.linalg.lu_solve(self._lup, full_b, trans=trans_lu)
+                elif self._btf_blocks is not None:
+                    arr = self._solve_block_triangular(full_b, mode == 'rev')
                 else:
                     arr = self._lu.solve(full_b, trans_splu)
 
@@ -9,6 +9,35 @@ class LinearBlockJac(BlockLinearSolver):
 
     SOLVER = 'LN: LNBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to solve the subsystems concurrently. '
+                             'This only helps if the subsystem solves release the GIL, e.g., '
+                             'when they are done by a DirectSolver.')
+        self.options.declare('min_thread_speedup', default=1.2, lower=0.0,
+                             desc='Minimum speedup, measured over the first threaded iterations, '
+                             'needed to keep solving the subsystems on threads. Otherwise they '
+                             'are solved serially.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._setup_threads(system)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -30,9 +59,6 @@ class LinearBlockJac(BlockLinearSolver):
             b_vec *= -1.0
             b_vec += self._rhs_vec
 
-            for subsys in subs:
-                subsys._solve_linear(mode, self._rel_systems)
-
         else:  # rev
             for subsys in subs:
                 scope_out, scope_in = system._get_scope(subsys)
@@ -44,5 +70,6 @@ class LinearBlockJac(BlockLinearSolver):
             b_vec *= -1.0
             b_vec += self._rhs_vec
 
-            for subsys in subs:
-                subsys._solve_linear(mode, self._rel_systems)
+        # the subsystem solves are independent, so they can run concurrently.
+        rel_systems = self._rel_systems
+        self._run_subsystems(lambda subsys: subsys._solve_linear(mode, rel_systems), subs)
@@ -0,0 +1,579 @@
+"""Define preconditioners that work directly on an assembled jacobian."""
+
+import numpy as np
+import scipy.sparse.linalg
+from scipy.sparse import csc_matrix, csr_matrix, diags
+
+from openmdao.core.constants import INT_DTYPE
+from openmdao.solvers.solver import LinearSolver
+from openmdao.solvers.linear.direct import format_singular_error
+
+
+class AssembledPreconditioner(LinearSolver):
+    """
+    Base class for linear solvers that approximately invert the assembled jacobian.
+
+    These are meant to be used as the preconditioner of a Krylov solver.  The assembled matrix
+    is factored once per linearization, and each solve is a single application of the
+    approximate inverse.
+    """
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        # this solver does not iterate
+        self.options.undeclare("maxiter")
+        self.options.undeclare("err_on_non_converge")
+
+        self.options.undeclare("atol")
+        self.options.undeclare("rtol")
+
+        # Use an assembled jacobian by default.
+        self.options['assemble_jac'] = True
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._disallow_distrib_solve()
+
+        if not self.options['assemble_jac']:
+            raise RuntimeError(f"{self.msginfo}: {type(self).__name__} requires an assembled "
+                               "jacobian, so the 'assemble_jac' option must be True.")
+
+    def _linearize_children(self):
+        """
+        Return a flag that is True when we need to call linearize on our subsystems' solvers.
+
+        Returns
+        -------
+        boolean
+            Flag for indicating child linearization.
+        """
+        return False
+
+    def _linearize(self):
+        """
+        Perform factorization of the assembled matrix.
+        """
+        matrix = self._assembled_jac._int_mtx._matrix
+        if not isinstance(matrix, csc_matrix):
+            matrix = csc_matrix(matrix)
+
+        self._factor(matrix)
+
+    def _factor(self, matrix):
+        """
+        Compute the approximate factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled jacobian.
+        """
+        pass
+
+    def _precon_solve(self, b, trans):
+        """
+        Apply the approximate inverse of the matrix, or of its transpose, to b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        trans : bool
+            If True, apply the approximate inverse of the transposed matrix.
+
+        Returns
+        -------
+        ndarray
+            The approximate solution.
+        """
+        pass
+
+    def solve(self, mode, rel_systems=None):
+        """
+        Run the solver.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rel_systems : set of str
+            Names of systems relevant to the current solve.
+        """
+        system = self._system()
+
+        d_residuals = system._vectors['residual']['linear']
+        d_outputs = system._vectors['output']['linear']
+
+        # assign x and b vectors based on mode
+        if mode == 'fwd':
+            x_vec = d_outputs.asarray()
+            b_vec = d_residuals.asarray()
+        else:  # rev
+            x_vec = d_residuals.asarray()
+            b_vec = d_outputs.asarray()
+
+        # AssembledJacobians are unscaled.
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            x_vec[:] = self._precon_solve(b_vec, mode == 'rev')
+
+
+class ILUPreconditioner(AssembledPreconditioner):
+    """
+    Preconditioner that uses an incomplete LU factorization of the assembled jacobian.
+
+    Attributes
+    ----------
+    _ilu : SuperLU or None
+        The incomplete LU factorization.
+    """
+
+    SOLVER = 'LN: ILU'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+        self._ilu = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('drop_tol', default=1e-4, lower=0.0,
+                             desc='Drop tolerance for the entries of the factors.')
+        self.options.declare('fill_factor', default=10.0, lower=1.0,
+                             desc='Upper bound on the ratio of the number of nonzeros in the '
+                                  'factors to the number of nonzeros in the matrix.')
+        self.options.declare('drop_rule', default=None, types=str, allow_none=True,
+                             desc='Comma separated list of SuperLU ILU drop rules. If None, '
+                                  'the SuperLU default is used.')
+
+    def _factor(self, matrix):
+        """
+        Compute the incomplete LU factorization of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled jacobian.
+        """
+        try:
+            self._ilu = scipy.sparse.linalg.spilu(matrix, drop_tol=self.options['drop_tol'],
+                                                  fill_factor=self.options['fill_factor'],
+                                                  drop_rule=self.options['drop_rule'])
+        except RuntimeError as err:
+            if 'exactly singular' in str(err):
+                raise RuntimeError(format_singular_error(self._system(), matrix))
+            else:
+                raise err
+
+    def _precon_solve(self, b, trans):
+        """
+        Apply the incomplete LU factors of the matrix, or of its transpose, to b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        trans : bool
+            If True, apply the approximate inverse of the transposed matrix.
+
+        Returns
+        -------
+        ndarray
+            The approximate solution.
+        """
+        return self._ilu.solve(b, 'T' if trans else 'N')
+
+
+class BlockJacobiPreconditioner(AssembledPreconditioner):
+    """
+    Preconditioner that uses the LU factorizations of the diagonal blocks of the assembled jacobian.
+
+    There is one block for the outputs of each subsystem of the owning Group.
+
+    Attributes
+    ----------
+    _blocks : list of (int, int, SuperLU)
+        Start and end of the rows of each block, with the factorization of the block.
+    """
+
+    SOLVER = 'LN: BJAC-LU'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+        self._blocks = []
+
+    def _block_ranges(self):
+        """
+        Return the ranges of the linear output vector that belong to each subsystem.
+
+        Returns
+        -------
+        list of (int, int, System)
+            Start and end of each block, with the subsystem that owns it.
+        """
+        system = self._system()
+        slices = system._vectors['output']['linear'].get_slice_dict()
+        ranges = []
+        for subsys in system._subsystems_myproc:
+            sub_slices = [slices[n] for n in subsys._var_abs2meta['output']]
+            if sub_slices:
+                ranges.append((sub_slices[0].start, sub_slices[-1].stop, subsys))
+
+        if not ranges:  # our system is a component
+            size = len(system._vectors['output']['linear'])
+            ranges.append((0, size, system))
+
+        return ranges
+
+    def _factor(self, matrix):
+        """
+        Compute the LU factorizations of the diagonal blocks of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled jacobian.
+        """
+        self._blocks = blocks = []
+        for start, end, subsys in self._block_ranges():
+            block = matrix[start:end, start:end].tocsc()
+            try:
+                blocks.append((start, end, scipy.sparse.linalg.splu(block)))
+            except RuntimeError as err:
+                if 'exactly singular' in str(err):
+                    raise RuntimeError(f"{self.msginfo}: The diagonal block of the jacobian for "
+                                       f"{subsys.msginfo} is singular.")
+                else:
+                    raise err
+
+    def _precon_solve(self, b, trans):
+        """
+        Apply the inverse of the diagonal blocks of the matrix, or of its transpose, to b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        trans : bool
+            If True, apply the approximate inverse of the transposed matrix.
+
+        Returns
+        -------
+        ndarray
+            The approximate solution.
+        """
+        trans = 'T' if trans else 'N'
+        x = np.zeros_like(b)
+        for start, end, lu in self._blocks:
+            x[start:end] = lu.solve(b[start:end], trans)
+
+        return x
+
+
+class AMGPreconditioner(AssembledPreconditioner):
+    """
+    Preconditioner that applies one smoothed aggregation algebraic multigrid V-cycle.
+
+    Attributes
+    ----------
+    _levels : dict
+        Multigrid hierarchy for the matrix (key False) and its transpose (key True).  Each is a
+        tuple of the form (levels, coarse_solve), where levels is a list of
+        (A, P, R, Dinv) tuples, one per level.
+    _matrix : csr_matrix or None
+        The assembled jacobian, used to build the hierarchy of its transpose on demand.
+    """
+
+    SOLVER = 'LN: AMG'
+
+    def __init__(self, **kwargs):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        **kwargs : dict
+            options dictionary.
+        """
+        super().__init__(**kwargs)
+        self._levels = {}
+        self._matrix = None
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('max_levels', default=10, types=int, lower=1,
+                             desc='Maximum number of levels in the multigrid hierarchy.')
+        self.options.declare('max_coarse', default=100, types=int, lower=1,
+                             desc='Stop coarsening once the matrix has this many rows or less. '
+                                  'The coarsest matrix is solved with a sparse LU.')
+        self.options.declare('strength', default=0.25, lower=0.0,
+                             desc='Off-diagonal entries larger in magnitude than this fraction '
+                                  'of the geometric mean of their diagonal entries are strong '
+                                  'connections used to form the aggregates.')
+        self.options.declare('smooth_sweeps', default=1, types=int, lower=0,
+                             desc='Number of weighted Jacobi sweeps before and after each '
+                                  'coarse grid correction.')
+        self.options.declare('jacobi_weight', default=2.0 / 3.0, lower=0.0,
+                             desc='Weight of the Jacobi smoother.')
+
+    def _factor(self, matrix):
+        """
+        Build the multigrid hierarchy of the given matrix.
+
+        Parameters
+        ----------
+        matrix : csc_matrix
+            The assembled jacobian.
+        """
+        self._matrix = matrix.tocsr()
+        # the hierarchy of the transpose is only built if a rev solve needs it
+        self._levels = {False: self._build_hierarchy(self._matrix)}
+
+    def _build_hierarchy(self, A):
+        """
+        Build the smoothed aggregation hierarchy of A.
+
+        Parameters
+        ----------
+        A : csr_matrix
+            The matrix.
+
+        Returns
+        -------
+        tuple
+            The list of levels and the solve function of the coarsest matrix.
+        """
+        levels = []
+        while A.shape[0] > self.options['max_coarse'] and \
+                len(levels) + 1 < self.options['max_levels']:
+            agg, nagg = _aggregate(_strength(A, self.options['strength']))
+            if nagg == A.shape[0]:  # no coarsening is possible
+                break
+
+            diag = A.diagonal()
+            dinv = np.zeros(diag.shape, dtype=diag.dtype)
+            nonzero = diag != 0.
+            dinv[nonzero] = 1.0 / diag[nonzero]
+            DinvA = diags(dinv) @ A
+
+            # tentative prolongator with one (normalized) column per aggregate
+            n = A.shape[0]
+            counts = np.bincount(agg, minlength=nagg)
+            T = csr_matrix((1.0 / np.sqrt(counts[agg]), (np.arange(n), agg)), shape=(n, nagg))
+
+            # smooth the prolongator with a damped Jacobi step
+            omega = 4.0 / 3.0 / _spectral_radius(DinvA)
+            P = (T - omega * (DinvA @ T)).tocsr()
+            R = P.T.tocsr()
+
+            levels.append((A, P, R, dinv))
+            A = (R @ A @ P).tocsr()
+
+        try:
+            coarse_lu = scipy.sparse.linalg.splu(A.tocsc())
+            coarse_solve = coarse_lu.solve
+        except RuntimeError:
+            # coarse matrix is singular, so use a least squares solution
+            pinv = np.linalg.pinv(A.toarray())
+            coarse_solve = pinv.dot
+
+        return levels, coarse_solve
+
+    def _vcycle(self, levels, coarse_solve, b, lvl=0):
+        """
+        Apply a V-cycle starting at the given level.
+
+        Parameters
+        ----------
+        levels : list
+            Multigrid levels.
+        coarse_solve : function
+            Solve function of the coarsest matrix.
+        b : ndarray
+            Right hand side.
+        lvl : int
+            Current level.
+
+        Returns
+        -------
+        ndarray
+            The approximate solution.
+        """
+        if lvl == len(levels):
+            return coarse_solve(b)
+
+        A, P, R, dinv = levels[lvl]
+        w = self.options['jacobi_weight']
+        nsweeps = self.options['smooth_sweeps']
+
+        x = np.zeros(b.size, dtype=np.result_type(b, A.dtype))
+        for i in range(nsweeps):
+            x += w * dinv * (b - A.dot(x))
+
+        x += P.dot(self._vcycle(levels, coarse_solve, R.dot(b - A.dot(x)), lvl + 1))
+
+        for i in range(nsweeps):
+            x += w * dinv * (b - A.dot(x))
+
+        return x
+
+    def _precon_solve(self, b, trans):
+        """
+        Apply one V-cycle for the matrix, or for its transpose, to b.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right hand side.
+        trans : bool
+            If True, apply the approximate inverse of the transposed matrix.
+
+        Returns
+        -------
+        ndarray
+            The approximate solution.
+        """
+        if trans not in self._levels:
+            self._levels[trans] = self._build_hierarchy(self._matrix.T.tocsr())
+
+        levels, coarse_solve = self._levels[trans]
+        return self._vcycle(levels, coarse_solve, b)
+
+
+def _strength(A, theta):
+    """
+    Return the symmetric pattern of strong connections between the rows of A.
+
+    Parameters
+    ----------
+    A : csr_matrix
+        The matrix.
+    theta : float
+        Strength threshold.
+
+    Returns
+    -------
+    csr_matrix
+        Matrix with a nonzero entry for each strong connection.
+    """
+    coo = A.tocoo()
+    diag = np.abs(A.diagonal())
+    offdiag = coo.row != coo.col
+    rows = coo.row[offdiag]
+    cols = coo.col[offdiag]
+    vals = np.abs(coo.data[offdiag])
+
+    strong = (vals > 0.) & (vals >= theta * np.sqrt(diag[rows] * diag[cols]))
+    S = csr_matrix((np.ones(np.count_nonzero(strong)), (rows[strong], cols[strong])),
+                   shape=A.shape)
+    return (S + S.T).tocsr()
+
+
+def _aggregate(S):
+    """
+    Group the rows of a strength matrix into aggregates.
+
+    Parameters
+    ----------
+    S : csr_matrix
+        Pattern of strong connections.
+
+    Returns
+    -------
+    ndarray
+        Aggregate index of each row.
+    int
+        Number of aggregates.
+    """
+    n = S.shape[0]
+    indptr = S.indptr
+    indices = S.indices
+    agg = np.full(n, -1, dtype=INT_DTYPE)
+    nagg = 0
+
+    # rows whose neighbors are all unaggregated become the roots of new aggregates
+    for i in range(n):
+        if agg[i] < 0:
+            nbrs = indices[indptr[i]:indptr[i + 1]]
+            if np.all(agg[nbrs] < 0):
+                agg[i] = nagg
+                agg[nbrs] = nagg
+                nagg += 1
+
+    # remaining rows join the aggregate of a neighbor, or form their own
+    for i in np.nonzero(agg < 0)[0]:
+        nbrs = indices[indptr[i]:indptr[i + 1]]
+        nbr_aggs = agg[nbrs]
+        nbr_aggs = nbr_aggs[nbr_aggs >= 0]
+        if nbr_aggs.size > 0:
+            agg[i] = nbr_aggs[0]
+        else:
+            agg[i] = nagg
+            nagg += 1
+
+    return agg, nagg
+
+
+def _spectral_radius(A, maxiter=15):
+    """
+    Estimate the spectral radius of A using power iteration.
+
+    Parameters
+    ----------
+    A : csr_matrix
+        The matrix.
+    maxiter : int
+        Number of iterations.
+
+    Returns
+    -------
+    float
+        Estimate of the spectral radius.
+    """
+    x = np.random.RandomState(0).random_sample(A.shape[0])
+    rho = 1.0
+    for i in range(maxiter):
+        y = A.dot(x)
+        norm = np.linalg.norm(y)
+        if norm == 0.:
+            break
+        rho = norm / np.linalg.norm(x)
+        x = y / norm
+
+    return max(rho, 1e-8)
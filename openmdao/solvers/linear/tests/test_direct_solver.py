@@ -3,11 +3,13 @@
 import unittest
 
 import numpy as np
+from scipy.sparse import csc_matrix
 
 import openmdao.api as om
 from openmdao.core.tests.test_distrib_derivs import DistribExecComp
 from openmdao.solvers.linear.tests.linear_test_base import LinearSolverTests
-from openmdao.test_suite.components.double_sellar import DoubleSellar
+from openmdao.solvers.linear.direct import _block_triangular_order
+from openmdao.test_suite.components.double_sellar import DoubleSellar, SubSellar
 from openmdao.test_suite.components.expl_comp_simple import TestExplCompSimpleJacVec
 from openmdao.test_suite.components.sellar import SellarDerivatives
 from openmdao.test_suite.groups.implicit_group import TestImplicitGroup
@@ -852,6 +854,114 @@ class TestDirectSolver(LinearSolverTests.LinearSolverTestCase):
             prob.run_model()
 
 
+def _build_chained_sellars(block_triangular, assembled_jac_type='csc'):
+    prob = om.Problem()
+    model = prob.model
+    model.options['assembled_jac_type'] = assembled_jac_type
+
+    model.add_subsystem('g1', SubSellar())
+    model.add_subsystem('c1', om.ExecComp('a = 0.5 * y'))
+    model.add_subsystem('c2', om.ExecComp('b = a ** 2 + 0.1 * y'))
+    model.add_subsystem('g2', SubSellar())
+    model.connect('g1.y2', ['c1.y', 'c2.y'])
+    model.connect('c1.a', 'c2.a')
+    model.connect('c2.b', 'g2.x')
+
+    model.set_input_defaults('g1.x', 1.0)
+    model.set_input_defaults('g1.z', np.array([5.0, 2.0]))
+    model.set_input_defaults('g2.z', np.array([5.0, 2.0]))
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=30,
+                                              atol=1e-12, rtol=1e-12)
+    model.linear_solver = om.DirectSolver(block_triangular=block_triangular)
+
+    return prob
+
+
+class TestDirectSolverBlockTriangular(unittest.TestCase):
+
+    def test_order(self):
+        # two coupled 2x2 blocks with a lower triangular run between them, scrambled.
+        A = np.array([[1., 2., 0., 0., 0., 0.],
+                      [3., 4., 0., 0., 0., 0.],
+                      [5., 0., 6., 0., 0., 0.],
+                      [0., 0., 7., 8., 0., 0.],
+                      [0., 0., 0., 9., 1., 2.],
+                      [0., 0., 0., 0., 3., 4.]])
+        perm = np.array([3, 5, 0, 2, 4, 1])
+        mtx = csc_matrix(A[perm][:, perm[::-1]])
+
+        rows, cols, starts = _block_triangular_order(mtx)
+
+        assert_near_equal(starts, [0, 2, 4, 6])
+        permuted = mtx.toarray()[rows][:, cols]
+        assert_near_equal(np.triu(permuted, 1)[:2, 2:], np.zeros((2, 4)))
+        assert_near_equal(np.triu(permuted, 1)[2:4, 4:], np.zeros((2, 2)))
+        self.assertEqual(np.count_nonzero(permuted[2:4, 3]), 1)
+
+        # structurally singular
+        A[1, 1] = A[1, 0] = 0.0
+        self.assertIsNone(_block_triangular_order(csc_matrix(A)))
+
+    def test_totals(self):
+        of = ['g2.y1', 'g2.y2', 'c1.a']
+        wrt = ['g1.x', 'g1.z', 'g2.z']
+
+        for mode in ('fwd', 'rev'):
+            outputs = []
+            totals = []
+            for block_triangular in (False, True):
+                prob = _build_chained_sellars(block_triangular)
+                prob.setup(mode=mode)
+                prob.set_solver_print(level=0)
+                prob.run_model()
+
+                self.assertLess(prob.model.nonlinear_solver._iter_count, 30)
+                outputs.append(prob['g2.y1'])
+                totals.append(prob.compute_totals(of=of, wrt=wrt, return_format='array'))
+
+            assert_near_equal(outputs[1], outputs[0], 1e-12)
+            assert_near_equal(totals[1], totals[0], 1e-12)
+
+    def test_blocks(self):
+        prob = _build_chained_sellars(True)
+        prob.setup()
+        prob.run_model()
+
+        blocks = [(start, end) for start, end, _, _, _ in prob.model.linear_solver._btf_blocks]
+        # auto_ivc outputs, the first Sellar, the chain, and the second Sellar
+        self.assertEqual(blocks, [(0, 5), (5, 7), (7, 9), (9, 11)])
+
+    def test_dense_fallback(self):
+        prob = _build_chained_sellars(True, 'dense')
+        prob.setup()
+        prob.run_model()
+
+        self.assertIsNone(prob.model.linear_solver._btf_blocks)
+        self.assertLess(prob.model.nonlinear_solver._iter_count, 30)
+
+    def test_singular(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', 1.0))
+        model.add_subsystem('c', om.ExecComp('y = 2.0 * x'))
+        model.add_subsystem('s', SingularComp())
+        model.connect('p.x', 'c.x')
+        model.connect('c.y', 's.x')
+
+        model.linear_solver = om.DirectSolver(block_triangular=True)
+        prob.setup()
+        prob.run_model()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['s.y'], wrt=['p.x'])
+
+        self.assertIn("Singular entry found in <model> <class Group> for row associated with "
+                      "state/residual 's.y' index 0.",
+                      str(cm.exception))
+
+
 @unittest.skipUnless(MPI and PETScVector, "only run with MPI and PETSc.")
 class TestDirectSolverRemoteErrors(unittest.TestCase):
 
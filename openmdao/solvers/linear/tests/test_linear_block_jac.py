@@ -31,6 +31,60 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
             self.assertEqual(str(context.exception),
                              "Linear solver 'LN: LNBJ' doesn't support assembled jacobians.")
 
+    def _build_sellar(self, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        for name in ('g1', 'g2'):
+            sub = model.add_subsystem(name, om.Group(), promotes=['*'])
+            sub.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+            sub.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+            sub.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            sub.linear_solver = om.DirectSolver()
+            sub.set_input_defaults('x', 1.0)
+            sub.set_input_defaults('z', np.array([5.0, 2.0]))
+            promotes = ['x', 'z', 'y1', 'y2']
+            model.promotes(name, any=[(n, name + '_' + n) for n in promotes])
+
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = g1_y1 + g2_y2'), promotes=['*'])
+
+        model.linear_solver = om.LinearBlockJac(**options)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_threaded(self):
+        of = ['obj', 'g1_y1', 'g2_y2']
+        wrt = ['g1_x', 'g1_z', 'g2_x', 'g2_z']
+
+        prob = self._build_sellar()
+        expected = prob.compute_totals(of=of, wrt=wrt, return_format='array')
+
+        prob = self._build_sellar(num_threads=2, min_thread_speedup=0.0)
+        J = prob.compute_totals(of=of, wrt=wrt, return_format='array')
+
+        assert_near_equal(J, expected, 1e-12)
+
+        threads = prob.model.linear_solver._threads
+        self.assertIsNotNone(threads.speedup)
+        self.assertTrue(threads.threaded)
+
+    def test_threaded_fallback(self):
+        # a speedup this large can't be reached, so the solver goes back to serial solves.
+        prob = self._build_sellar(num_threads=2, min_thread_speedup=1e6)
+        J = prob.compute_totals(of=['obj'], wrt=['g1_x', 'g2_x'], return_format='array')
+
+        threads = prob.model.linear_solver._threads
+        self.assertIsNotNone(threads.speedup)
+        self.assertFalse(threads.threaded)
+
+        expected = self._build_sellar().compute_totals(of=['obj'], wrt=['g1_x', 'g2_x'],
+                                                       return_format='array')
+        assert_near_equal(J, expected, 1e-12)
+
 
 class TestBJacSolverFeature(unittest.TestCase):
 
@@ -0,0 +1,152 @@
+"""Test the preconditioners that work on an assembled jacobian."""
+
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.double_sellar import DoubleSellar
+from openmdao.utils.assert_utils import assert_near_equal
+
+try:
+    from parameterized import parameterized
+except ImportError:
+    from openmdao.utils.assert_utils import SkipParameterized as parameterized
+
+
+class DiffusionComp(om.ImplicitComponent):
+    """
+    Implicit component with residuals from a 1D convection-diffusion stencil.
+    """
+
+    def initialize(self):
+        self.options.declare('n', types=int, default=100)
+
+    def setup(self):
+        n = self.options['n']
+        self.add_input('f', val=np.ones(n))
+        self.add_input('c', val=1.0)
+        self.add_output('u', val=np.zeros(n))
+
+        arange = np.arange(n)
+        rows = np.concatenate([arange, arange[1:], arange[:-1]])
+        cols = np.concatenate([arange, arange[:-1], arange[1:]])
+        self.declare_partials('u', 'u', rows=rows, cols=cols)
+        self.declare_partials('u', 'f', rows=arange, cols=arange, val=-0.05)
+        self.declare_partials('u', 'c', rows=[0, n - 1], cols=[0, 0], val=-1.0)
+
+    def _stencil(self):
+        n = self.options['n']
+        diag = np.full(n, 2.1)
+        lower = np.full(n - 1, -1.05)
+        upper = np.full(n - 1, -0.95)
+        return diag, lower, upper
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        diag, lower, upper = self._stencil()
+        u = outputs['u']
+        residuals['u'] = diag * u - 0.05 * inputs['f']
+        residuals['u'][1:] += lower * u[:-1]
+        residuals['u'][:-1] += upper * u[1:]
+        residuals['u'][[0, -1]] -= inputs['c']
+
+    def linearize(self, inputs, outputs, partials):
+        diag, lower, upper = self._stencil()
+        partials['u', 'u'] = np.concatenate([diag, lower, upper])
+
+
+def _build_model(precon, assembled_jac_type='csc'):
+    prob = om.Problem()
+    model = prob.model
+    model.options['assembled_jac_type'] = assembled_jac_type
+
+    model.add_subsystem('ivc', om.IndepVarComp('c', 1.0))
+    model.add_subsystem('d1', DiffusionComp())
+    model.add_subsystem('d2', DiffusionComp())
+    model.connect('ivc.c', 'd1.c')
+    model.connect('d1.u', 'd2.f')
+    model.connect('d2.u', 'd1.f')
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=5)
+    model.linear_solver = om.ScipyKrylov(atol=1e-12, restart=200)
+    if precon is not None:
+        model.linear_solver.precon = precon
+
+    return prob
+
+
+class TestAssembledPreconditioners(unittest.TestCase):
+
+    @parameterized.expand([
+        ('ilu', om.ILUPreconditioner, {}),
+        ('block_jacobi', om.BlockJacobiPreconditioner, {}),
+        ('amg', om.AMGPreconditioner, {'max_coarse': 20}),
+        ('amg_dense', om.AMGPreconditioner, {'max_coarse': 20}, 'dense'),
+    ], name_func=lambda f, n, p: 'test_precon_' + p.args[0])
+    def test_precon(self, name, precon_class, options, jac_type='csc'):
+        counts = {}
+        totals = {}
+        for precon in (None, precon_class(**options)):
+            for mode in ('fwd', 'rev'):
+                prob = _build_model(precon, jac_type)
+                prob.setup(mode=mode)
+                prob.set_solver_print(level=-1)
+                prob.run_model()
+
+                krylov = prob.model.linear_solver
+                iters = []
+                monitor = krylov._monitor
+                krylov._monitor = lambda res: (monitor(res), iters.append(krylov._iter_count))
+
+                key = (precon is not None, mode)
+                totals[key] = prob.compute_totals(of=['d2.u'], wrt=['ivc.c'],
+                                                  return_format='array')
+                counts[key] = len(iters)
+
+        expected = totals[False, 'fwd']
+        for key, J in totals.items():
+            assert_near_equal(J, expected, 1e-8)
+
+        for mode in ('fwd', 'rev'):
+            self.assertLess(counts[True, mode], counts[False, mode] / 2)
+
+    def test_block_jacobi_blocks(self):
+        prob = _build_model(om.BlockJacobiPreconditioner())
+        prob.setup()
+        prob.run_model()
+
+        blocks = [(start, end) for start, end, _ in prob.model.linear_solver.precon._blocks]
+        # _auto_ivc, ivc, d1, d2
+        self.assertEqual(blocks, [(0, 1), (1, 2), (2, 102), (102, 202)])
+
+    def test_as_solver(self):
+        # an ILU without dropping is an exact solver
+        prob = om.Problem(model=DoubleSellar())
+        prob.model.linear_solver = om.ILUPreconditioner(drop_tol=0.0)
+        prob.setup()
+        prob.run_model()
+
+        expected = om.Problem(model=DoubleSellar())
+        expected.model.linear_solver = om.DirectSolver()
+        expected.setup()
+        expected.run_model()
+
+        of = ['g1.y1', 'g2.y1']
+        wrt = ['g1.x', 'g2.x']
+        assert_near_equal(prob.compute_totals(of=of, wrt=wrt, return_format='array'),
+                          expected.compute_totals(of=of, wrt=wrt, return_format='array'), 1e-10)
+
+    def test_requires_assembled_jac(self):
+        prob = _build_model(om.AMGPreconditioner(assemble_jac=False))
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "AMGPreconditioner in <model> <class Group>: AMGPreconditioner requires "
+                         "an assembled jacobian, so the 'assemble_jac' option must be True.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -54,6 +54,12 @@ class LinesearchSolver(NonlinearSolver):
         Lower bounds array.
     _upper_bounds : ndarray or None
         Upper bounds array.
+    _bounded_inds : ndarray or None
+        Indices of the outputs that have a lower or upper bound.
+    _bounded_lower : ndarray or None
+        Lower bounds of the outputs in _bounded_inds.
+    _bounded_upper : ndarray or None
+        Upper bounds of the outputs in _bounded_inds.
     """
 
     def __init__(self, **kwargs):
@@ -70,6 +76,9 @@ class LinesearchSolver(NonlinearSolver):
         self._do_subsolve = False
         self._lower_bounds = None
         self._upper_bounds = None
+        self._bounded_inds = None
+        self._bounded_lower = None
+        self._bounded_upper = None
 
     def _declare_options(self):
         """
@@ -137,8 +146,20 @@ class LinesearchSolver(NonlinearSolver):
                     self._upper_bounds[start:end] = (var_upper - ref0) / (ref - ref0)
 
                 start = end
+
+            # Only the bounded entries are checked when the bounds are enforced.
+            bounded = np.zeros(len(system._outputs), dtype=bool)
+            if self._lower_bounds is not None:
+                bounded |= self._lower_bounds > -np.inf
+            if self._upper_bounds is not None:
+                bounded |= self._upper_bounds < np.inf
+
+            self._bounded_inds = inds = np.nonzero(bounded)[0]
+            self._bounded_lower = None if self._lower_bounds is None else self._lower_bounds[inds]
+            self._bounded_upper = None if self._upper_bounds is None else self._upper_bounds[inds]
         else:
             self._lower_bounds = self._upper_bounds = None
+            self._bounded_inds = self._bounded_lower = self._bounded_upper = None
 
     def _enforce_bounds(self, step, alpha):
         """
@@ -159,18 +180,20 @@ class LinesearchSolver(NonlinearSolver):
 
         options = self.options
         method = options['bound_enforcement']
-        lower = self._lower_bounds
-        upper = self._upper_bounds
 
         if options['print_bound_enforce']:
-            _print_violations(system._outputs, lower, upper)
+            _print_violations(system._outputs, self._lower_bounds, self._upper_bounds)
+
+        inds = self._bounded_inds
+        lower = self._bounded_lower
+        upper = self._bounded_upper
 
         if method == 'vector':
-            _enforce_bounds_vector(system._outputs, step, alpha, lower, upper)
+            _enforce_bounds_vector(system._outputs, step, alpha, lower, upper, inds)
         elif method == 'scalar':
-            _enforce_bounds_scalar(system._outputs, step, alpha, lower, upper)
+            _enforce_bounds_scalar(system._outputs, step, alpha, lower, upper, inds)
         elif method == 'wall':
-            _enforce_bounds_wall(system._outputs, step, alpha, lower, upper)
+            _enforce_bounds_wall(system._outputs, step, alpha, lower, upper, inds)
 
 
 class BoundsEnforceLS(LinesearchSolver):
@@ -238,6 +261,8 @@ class ArmijoGoldsteinLS(LinesearchSolver):
     ----------
     _analysis_error_raised : bool
         Flag is set to True if a subsystem raises an AnalysisError.
+    _prev_alpha : tuple(float, float) or None
+        Previous step length and its line search objective, used by the cubic interpolation.
     """
 
     SOLVER = 'LS: AG'
@@ -254,6 +279,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         super().__init__(**kwargs)
 
         self._analysis_error_raised = False
+        self._prev_alpha = None
 
     def _line_search_objective(self):
         """
@@ -331,6 +357,11 @@ class ArmijoGoldsteinLS(LinesearchSolver):
                     desc="Backtrack and retry if an AnalysisError is raised.")
         opt.declare('method', default='Armijo', values=['Armijo', 'Goldstein'],
                     desc="Method to calculate stopping condition.")
+        opt.declare('interpolation', default=None, values=[None, 'quadratic', 'cubic'],
+                    desc="When set, the next step length is the minimum of a quadratic or cubic "
+                    "model of the line search objective, fit through the step lengths tried so "
+                    "far and safeguarded to lie between 0.1 and 0.5 times the last one. "
+                    "Otherwise the step length is multiplied by rho.")
 
     def _single_iteration(self):
         """
@@ -340,7 +371,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         system = self._system()
 
         # Hybrid newton support.
-        if self._do_subsolve and self._iter_count > 0:
+        if self._do_subsolve:
             self._solver_info.append_solver()
 
             try:
@@ -392,16 +423,55 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         elif method == 'goldstein':
             return fval0 + (1 - c1) * alpha * df_dalpha <= fval <= fval0 + c1 * alpha * df_dalpha
 
-    def _update_step_length_parameter(self, rho):
+    def _update_step_length_parameter(self, rho, phi=None):
         """
-        Update the step length parameter by multiplying with the contraction factor.
+        Update the step length parameter.
+
+        The step length is multiplied by the contraction factor, unless the interpolation option
+        is set and the objective at the current step length is known.
 
         Parameters
         ----------
         rho : float
             Contraction factor
+        phi : float or None
+            Line search objective at the current step length.
         """
-        self.alpha *= rho  # update alpha
+        alpha = self.alpha
+        method = self.options['interpolation']
+
+        if method is None or phi is None or not np.isfinite(phi):
+            self._prev_alpha = None
+            self.alpha *= rho  # update alpha
+            return
+
+        # Model the merit function 0.5 * phi**2, whose slope for a Newton step is -phi0**2.
+        phi0 = 0.5 * self._phi0 ** 2
+        slope = -2.0 * phi0
+        phi = 0.5 * phi ** 2
+
+        # Curvature of the quadratic through phi0, slope and phi.
+        d_alpha = phi - phi0 - slope * alpha
+        new_alpha = -slope * alpha * alpha / (2.0 * d_alpha) if d_alpha > 0.0 else rho * alpha
+
+        if method == 'cubic' and self._prev_alpha is not None:
+            alpha_prev, phi_prev = self._prev_alpha
+            d_prev = phi_prev - phi0 - slope * alpha_prev
+            denom = alpha * alpha * alpha_prev * alpha_prev * (alpha - alpha_prev)
+
+            a = (alpha_prev * alpha_prev * d_alpha - alpha * alpha * d_prev) / denom
+            b = (alpha ** 3 * d_prev - alpha_prev ** 3 * d_alpha) / denom
+
+            if a == 0.0:
+                if b > 0.0:
+                    new_alpha = -slope / (2.0 * b)
+            else:
+                disc = b * b - 3.0 * a * slope
+                if disc >= 0.0:
+                    new_alpha = (-b + np.sqrt(disc)) / (3.0 * a)
+
+        self._prev_alpha = (alpha, phi)
+        self.alpha = min(max(new_alpha, 0.1 * alpha), 0.5 * alpha)
 
     def _solve(self):
         """
@@ -417,6 +487,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
         du = system._vectors['output']['linear']  # Newton step
 
         self._iter_count = 0
+        self._prev_alpha = None
         phi = self._iter_initialize()
         phi0 = self._phi0
 
@@ -426,18 +497,23 @@ class ArmijoGoldsteinLS(LinesearchSolver):
 
             with Recording('ArmijoGoldsteinLS', self._iter_count, self) as rec:
 
-                if self._iter_count > 0:
-                    alpha_old = self.alpha
-                    self._update_step_length_parameter(rho)
-                    # Moving on the line search with the difference of the old and new step length.
-                    u.add_scal_vec(self.alpha - alpha_old, du)
+                # The objective at the current step length is already known, so backtrack first.
+                alpha_old = self.alpha
+                self._update_step_length_parameter(rho, phi)
+                # Moving on the line search with the difference of the old and new step length.
+                u.add_scal_vec(self.alpha - alpha_old, du)
                 cache = self._solver_info.save_cache()
 
                 try:
                     self._single_iteration()
                     self._iter_count += 1
 
-                    phi = self._line_search_objective()
+                    if self._analysis_error_raised:
+                        # The residuals are from the failed evaluation, so they don't belong to
+                        # this step length.
+                        phi = np.nan
+                    else:
+                        phi = self._line_search_objective()
 
                     # Save the norm values in the context manager so they can also be recorded.
                     rec.abs = phi
@@ -446,6 +522,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
                 except AnalysisError as err:
                     self._solver_info.restore_cache(cache)
                     self._iter_count += 1
+                    phi = np.nan
 
                     if self.options['retry_on_analysis_error']:
                         self._analysis_error_raised = True
@@ -459,7 +536,7 @@ class ArmijoGoldsteinLS(LinesearchSolver):
             self._mpi_print(self._iter_count, phi, self.alpha)
 
 
-def _enforce_bounds_vector(u, du, alpha, lower_bounds, upper_bounds):
+def _enforce_bounds_vector(u, du, alpha, lower_bounds, upper_bounds, inds):
     """
     Enforce lower/upper bounds, backtracking the entire vector together.
 
@@ -473,10 +550,12 @@ def _enforce_bounds_vector(u, du, alpha, lower_bounds, upper_bounds):
         Newton step; the backtracking is applied to this vector in-place.
     alpha : float
         step size.
-    lower_bounds : ndarray
-        Lower bounds array.
-    upper_bounds : ndarray
-        Upper bounds array.
+    lower_bounds : ndarray or None
+        Lower bounds of the outputs in inds.
+    upper_bounds : ndarray or None
+        Upper bounds of the outputs in inds.
+    inds : ndarray
+        Indices of the bounded outputs.
     """
     # The assumption is that alpha * du has been added to self (i.e., u)
     # just prior to this method being called. We are currently in the
@@ -489,11 +568,11 @@ def _enforce_bounds_vector(u, du, alpha, lower_bounds, upper_bounds):
 
     # Find the largest amount a bound is violated
     # where positive means a bound is violated - i.e. the required d_alpha.
-    du_arr = du.asarray()
+    du_arr = du.asarray()[inds]
     mask = du_arr != 0
     if mask.any():
         abs_du_mask = np.abs(du_arr[mask])
-        u_mask = u.asarray()[mask]
+        u_mask = u.asarray()[inds][mask]
 
         # Check lower bound
         if lower_bounds is not None:
@@ -522,7 +601,7 @@ def _enforce_bounds_vector(u, du, alpha, lower_bounds, upper_bounds):
         du *= 1 - d_alpha / alpha
 
 
-def _enforce_bounds_scalar(u, du, alpha, lower_bounds, upper_bounds):
+def _enforce_bounds_scalar(u, du, alpha, lower_bounds, upper_bounds, inds):
     """
     Enforce lower/upper bounds on each scalar separately, then backtrack as a vector.
 
@@ -536,10 +615,12 @@ def _enforce_bounds_scalar(u, du, alpha, lower_bounds, upper_bounds):
         Newton step; the backtracking is applied to this vector in-place.
     alpha : float
         step size.
-    lower_bounds : ndarray
-        Lower bounds array.
-    upper_bounds : ndarray
-        Upper bounds array.
+    lower_bounds : ndarray or None
+        Lower bounds of the outputs in inds.
+    upper_bounds : ndarray or None
+        Upper bounds of the outputs in inds.
+    inds : ndarray
+        Indices of the bounded outputs.
     """
     # The assumption is that alpha * step has been added to this vector
     # just prior to this method being called. We are currently in the
@@ -549,24 +630,27 @@ def _enforce_bounds_scalar(u, du, alpha, lower_bounds, upper_bounds):
 
     # enforce bounds on step in-place.
     u_data = u.asarray()
+    u_bounded = u_data[inds]
 
     # If u > lower, we're just adding zero. Otherwise, we're adding
     # the step required to get up to the lower bound.
     # For du, we normalize by alpha since du eventually gets
     # multiplied by alpha.
-    change_lower = 0. if lower_bounds is None else np.maximum(u_data, lower_bounds) - u_data
+    change_lower = 0. if lower_bounds is None else \
+        np.maximum(u_bounded, lower_bounds) - u_bounded
 
     # If u < upper, we're just adding zero. Otherwise, we're adding
     # the step required to get down to the upper bound, but normalized
     # by alpha since du eventually gets multiplied by alpha.
-    change_upper = 0. if upper_bounds is None else np.minimum(u_data, upper_bounds) - u_data
+    change_upper = 0. if upper_bounds is None else \
+        np.minimum(u_bounded, upper_bounds) - u_bounded
 
     change = change_lower + change_upper
-    u_data += change
-    du += change / alpha
+    u_data[inds] += change
+    du.asarray()[inds] += change / alpha
 
 
-def _enforce_bounds_wall(u, du, alpha, lower_bounds, upper_bounds):
+def _enforce_bounds_wall(u, du, alpha, lower_bounds, upper_bounds, inds):
     """
     Enforce lower/upper bounds on each scalar separately, then backtrack along the wall.
 
@@ -580,10 +664,12 @@ def _enforce_bounds_wall(u, du, alpha, lower_bounds, upper_bounds):
         Newton step; the backtracking is applied to this vector in-place.
     alpha : float
         step size.
-    lower_bounds : ndarray
-        Lower bounds array.
-    upper_bounds : ndarray
-        Upper bounds array.
+    lower_bounds : ndarray or None
+        Lower bounds of the outputs in inds.
+    upper_bounds : ndarray or None
+        Upper bounds of the outputs in inds.
+    inds : ndarray
+        Indices of the bounded outputs.
     """
     # The assumption is that alpha * step has been added to this vector
     # just prior to this method being called. We are currently in the
@@ -594,24 +680,27 @@ def _enforce_bounds_wall(u, du, alpha, lower_bounds, upper_bounds):
     # enforce bounds on step in-place.
     u_data = u.asarray()
     du_data = du.asarray()
+    u_bounded = u_data[inds]
 
     # If u > lower, we're just adding zero. Otherwise, we're adding
     # the step required to get up to the lower bound.
     # For du, we normalize by alpha since du eventually gets
     # multiplied by alpha.
-    change_lower = 0. if lower_bounds is None else np.maximum(u_data, lower_bounds) - u_data
+    change_lower = 0. if lower_bounds is None else \
+        np.maximum(u_bounded, lower_bounds) - u_bounded
 
     # If u < upper, we're just adding zero. Otherwise, we're adding
     # the step required to get down to the upper bound, but normalized
     # by alpha since du eventually gets multiplied by alpha.
-    change_upper = 0. if upper_bounds is None else np.minimum(u_data, upper_bounds) - u_data
+    change_upper = 0. if upper_bounds is None else \
+        np.minimum(u_bounded, upper_bounds) - u_bounded
 
     change = change_lower + change_upper
 
-    u_data += change
-    du_data += change / alpha
+    u_data[inds] += change
+    du_data[inds] += change / alpha
 
     # Now we ensure that we will backtrack along the wall during the
     # line search by setting the entries of du at the bounds to zero.
     changed_either = change.astype(bool)
-    du_data[changed_either] = 0.
+    du_data[inds[changed_either]] = 0.
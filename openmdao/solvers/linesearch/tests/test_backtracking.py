@@ -425,6 +425,16 @@ class TestBoundsEnforceLSArrayBounds(unittest.TestCase):
         self.top = top
         self.ub = np.array([2.6, 2.5, 2.65])
 
+    def test_bounded_inds(self):
+        top = self.top
+        top.final_setup()
+
+        # only comp.z has bounds, so only its entries are checked.
+        ls = top.model.nonlinear_solver.linesearch
+        np.testing.assert_array_equal(ls._bounded_inds, [6, 7, 8])
+        np.testing.assert_array_equal(ls._bounded_lower, [1.5, 1.5, 1.5])
+        np.testing.assert_array_equal(ls._bounded_upper, self.ub)
+
     def test_linesearch_vector_bound_enforcement(self):
         top = self.top
 
@@ -787,6 +797,125 @@ class CompAtan(om.ImplicitComponent):
         jacobian['y', 'x'] = 1.0
 
 
+class CompArctan(om.ImplicitComponent):
+    """
+    Implicit component with residuals atan(y - c), where full Newton steps far from the
+    solution overshoot.
+    """
+
+    def setup(self):
+        self.add_output('y', np.ones(3))
+        self.declare_partials('y', 'y', rows=np.arange(3), cols=np.arange(3))
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals['y'] = np.arctan(outputs['y'] - np.array([1., 2., 3.]))
+
+    def linearize(self, inputs, outputs, partials):
+        partials['y', 'y'] = 1.0 / (1.0 + (outputs['y'] - np.array([1., 2., 3.])) ** 2)
+
+
+class CompArctanAE(CompArctan):
+    """
+    CompArctan that raises an AnalysisError inside a band of its first output.
+    """
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        self.failed = -80.0 < outputs['y'][0] < -20.0
+        if self.failed:
+            raise om.AnalysisError('In the band.')
+        super().apply_nonlinear(inputs, outputs, residuals)
+
+
+class TestArmijoGoldsteinInterpolation(unittest.TestCase):
+
+    def _run(self, y0, interpolation):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', CompArctan())
+
+        newton = prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
+                                                               maxiter=50, atol=1e-10, rtol=1e-10)
+        newton.linesearch = om.ArmijoGoldsteinLS(maxiter=20, interpolation=interpolation)
+        prob.model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.set_val('comp.y', y0)
+
+        count = [0]
+        apply_nonlinear = comp.apply_nonlinear
+
+        def counted_apply_nonlinear(*args):
+            count[0] += 1
+            return apply_nonlinear(*args)
+
+        comp.apply_nonlinear = counted_apply_nonlinear
+
+        prob.run_model()
+        assert_near_equal(prob.get_val('comp.y'), [1., 2., 3.], 1e-8)
+
+        return count[0]
+
+    def test_interpolation(self):
+        for y0 in (10.0, -8.0):
+            count = self._run(y0, None)
+            for interpolation in ('quadratic', 'cubic'):
+                self.assertLess(self._run(y0, interpolation), count)
+
+    def test_retry_interpolation(self):
+        # the first backtrack lands in the band, after a successful full step.
+        for solve_subsystems in (False, True):
+            for interpolation in ('quadratic', 'cubic'):
+                prob = om.Problem()
+                comp = prob.model.add_subsystem('comp', CompArctanAE())
+
+                newton = prob.model.nonlinear_solver = \
+                    om.NewtonSolver(solve_subsystems=solve_subsystems, maxiter=50, atol=1e-10,
+                                    rtol=1e-10)
+                ls = newton.linesearch = om.ArmijoGoldsteinLS(maxiter=20,
+                                                              interpolation=interpolation)
+                prob.model.linear_solver = om.DirectSolver()
+
+                prob.setup()
+                prob.set_solver_print(level=0)
+                prob.set_val('comp.y', 10.0)
+
+                failed_phis = []
+                update = ls._update_step_length_parameter
+
+                def checked_update(rho, phi=None):
+                    if comp.failed:
+                        failed_phis.append(phi)
+                    return update(rho, phi)
+
+                ls._update_step_length_parameter = checked_update
+
+                prob.run_model()
+                assert_near_equal(prob.get_val('comp.y'), [1., 2., 3.], 1e-8)
+
+                # no model was fit through the objective of a failed evaluation.
+                self.assertTrue(failed_phis)
+                self.assertTrue(np.all(np.isnan(failed_phis)))
+
+    def test_step_length_safeguard(self):
+        ls = om.ArmijoGoldsteinLS(interpolation='quadratic')
+        ls._phi0 = 1.0
+
+        # a huge objective would put the quadratic minimum near zero.
+        ls.alpha = 1.0
+        ls._update_step_length_parameter(0.5, 1e6)
+        self.assertEqual(ls.alpha, 0.1)
+
+        # an objective that barely changed would put it beyond the current step.
+        ls.alpha = 1.0
+        ls._update_step_length_parameter(0.5, 0.99)
+        self.assertEqual(ls.alpha, 0.5)
+
+        # no model is fit through a failed evaluation.
+        ls.alpha = 1.0
+        ls._update_step_length_parameter(0.5, np.nan)
+        self.assertEqual(ls.alpha, 0.5)
+
+
 class TestFeatureLineSearch(unittest.TestCase):
 
     def test_feature_specification(self):
@@ -37,8 +37,8 @@ class BroydenSolver(NonlinearSolver):
         Most recent change in state vector.
     fxm : ndarray
         Most recent residual.
-    Gm : ndarray
-        Most recent Jacobian matrix.
+    Gm : ndarray or None
+        Most recent Jacobian matrix. This is None when the limited_memory option is used.
     linear_solver : LinearSolver
         Linear solver to use for calculating inverse Jacobian.
     linesearch : NonlinearSolver
@@ -55,6 +55,13 @@ class BroydenSolver(NonlinearSolver):
         Number of consecutive iterations that failed to converge to the tol definied in options.
     _full_inverse : bool
         When True, Broyden considers the whole vector rather than a list of states.
+    _lm_pairs : list of tuple(ndarray, ndarray, ndarray)
+        Latest changes in the states and residuals, along with the initial inverse Jacobian times
+        the residual change, from which the limited-memory inverse Jacobian is built.
+    _lm_u : list of ndarray
+        Update vectors of the limited-memory inverse Jacobian, one for each pair in _lm_pairs.
+    _lm_linearized : bool
+        True if the initial limited-memory inverse Jacobian is applied with the linear solver.
     _recompute_jacobian : bool
         Flag that becomes True when Broyden detects it needs to recompute the inverse Jacobian.
     """
@@ -94,6 +101,10 @@ class BroydenSolver(NonlinearSolver):
         # This gets set to True if the user doesn't declare any states.
         self._full_inverse = False
 
+        self._lm_pairs = []
+        self._lm_u = []
+        self._lm_linearized = False
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -124,6 +135,12 @@ class BroydenSolver(NonlinearSolver):
                                   "Jacobian.")
         self.options.declare('max_jacobians', default=10,
                              desc="Maximum number of jacobians to compute.")
+        self.options.declare('limited_memory', types=int, default=0, lower=0,
+                             desc="When greater than zero, keep only this many of the latest "
+                                  "Broyden updates instead of a dense inverse Jacobian. The "
+                                  "initial inverse Jacobian is then applied by solving with the "
+                                  "linear solver, e.g., from a DirectSolver factorization, rather "
+                                  "than being formed.")
         self.options.declare('state_vars', [], desc="List of the state-variable/residuals that "
                                                     "are to be solved here.")
         self.options.declare('update_broyden', default=True,
@@ -194,7 +211,7 @@ class BroydenSolver(NonlinearSolver):
             n = np.sum(system._owned_sizes)
 
         self.size = n
-        self.Gm = np.empty((n, n))
+        self.Gm = np.empty((n, n)) if self.options['limited_memory'] == 0 else None
         self.xm = np.empty((n, ))
         self.fxm = np.empty((n, ))
         self.delta_xm = None
@@ -202,9 +219,10 @@ class BroydenSolver(NonlinearSolver):
 
         if self._full_inverse:
 
-            # Can only use DirectSolver here.
+            # Can only use DirectSolver here, unless the inverse jacobian is never formed.
             from openmdao.solvers.linear.direct import DirectSolver
-            if not isinstance(self.linear_solver, DirectSolver):
+            if not isinstance(self.linear_solver, DirectSolver) and \
+               self.options['limited_memory'] == 0:
                 msg = "{}: Linear solver must be DirectSolver when solving the full model."
                 raise ValueError(msg.format(self.msginfo, ', '.join(bad_names)))
 
@@ -297,11 +315,13 @@ class BroydenSolver(NonlinearSolver):
 
         # Convert local storage if we are under complex step.
         if system.under_complex_step:
-            self.Gm = self.Gm.astype(np.complex)
+            if self.Gm is not None:
+                self.Gm = self.Gm.astype(np.complex)
             self.xm = self.xm.astype(np.complex)
             self.fxm = self.fxm.astype(np.complex)
         elif np.iscomplexobj(self.xm):
-            self.Gm = self.Gm.real
+            if self.Gm is not None:
+                self.Gm = self.Gm.real
             self.xm = self.xm.real
             self.fxm = self.fxm.real
 
@@ -375,10 +395,15 @@ class BroydenSolver(NonlinearSolver):
         Perform the operations in the iteration loop.
         """
         system = self._system()
-        Gm = self._update_inverse_jacobian()
         fxm = self.fxm
 
-        delta_xm = -Gm.dot(fxm)
+        if self.options['limited_memory'] > 0:
+            Gm = None
+            self._update_lm_inverse_jacobian()
+            delta_xm = -self._apply_lm_inverse_jacobian(fxm)
+        else:
+            Gm = self._update_inverse_jacobian()
+            delta_xm = -Gm.dot(fxm)
 
         if self.linesearch:
             self._solver_info.append_subsolver()
@@ -472,6 +497,120 @@ class BroydenSolver(NonlinearSolver):
 
         return Gm
 
+    def _update_lm_inverse_jacobian(self):
+        """
+        Update the limited-memory inverse Jacobian for a new Broyden iteration.
+
+        The inverse Jacobian is G = G0 + sum_i u_i dfx_i^T, where G0 is either the inverse of the
+        linearized system or identity scaled by -alpha. Each u_i follows from the Broyden update
+        for the i-th stored pair, given the updates before it.
+        """
+        if self.options['update_broyden'] and not self._recompute_jacobian:
+            dfxm = self.delta_fxm
+            fact = np.linalg.norm(dfxm)
+
+            # Sometimes you can get stuck, particularly when enforcing bounds in a linesearch.
+            # Make sure we don't update in this case because of divide by zero.
+            if fact > self.options['atol']:
+                pairs = self._lm_pairs
+                pairs.append((self.delta_xm, dfxm, self._apply_initial_inverse(dfxm)))
+
+                if len(pairs) > self.options['limited_memory']:
+                    # Drop the oldest pair, and rebuild the updates for the remaining ones.
+                    pairs.pop(0)
+                    self._lm_u = []
+
+                for dxm_i, dfxm_i, g0_dfxm_i in pairs[len(self._lm_u):]:
+                    g_dfxm_i = g0_dfxm_i.copy()
+                    for u, (_, dfxm_j, _) in zip(self._lm_u, pairs):
+                        g_dfxm_i += u * dfxm_j.dot(dfxm_i)
+
+                    self._lm_u.append((dxm_i - g_dfxm_i) * (1.0 / dfxm_i.dot(dfxm_i)))
+
+            return
+
+        self._lm_pairs = []
+        self._lm_u = []
+
+        # Linearize the system, so the linear solver can apply the initial inverse Jacobian.
+        if self.options['compute_jacobian']:
+            system = self._system()
+
+            # Disable local fd
+            approx_status = system._owns_approx_jac
+            system._owns_approx_jac = False
+
+            ln_solver = self.linear_solver
+            do_sub_ln = ln_solver._linearize_children()
+            my_asm_jac = ln_solver._assembled_jac
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac:
+                my_asm_jac._update(system)
+            self._linearize()
+
+            # Enable local fd
+            system._owns_approx_jac = approx_status
+
+            self._lm_linearized = True
+            self._computed_jacobians += 1
+
+        # Start from identity scaled by alpha.
+        else:
+            self._lm_linearized = False
+
+    def _apply_initial_inverse(self, vec):
+        """
+        Return the product of the initial limited-memory inverse Jacobian and vec.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Array with the size of the states.
+
+        Returns
+        -------
+        ndarray
+            Product of the initial inverse Jacobian and vec.
+        """
+        if not self._lm_linearized:
+            return -self.options['alpha'] * vec
+
+        system = self._system()
+        d_res = system._vectors['residual']['linear']
+
+        if self._full_inverse:
+            d_res.set_val(vec)
+        else:
+            d_res.set_val(0.0)
+            for name in self.options['state_vars']:
+                if name in d_res:
+                    i, j = self._idx[name]
+                    d_res[name] = vec[i:j]
+
+        self.linear_solver.solve('fwd')
+
+        return self.get_vector(system._vectors['output']['linear'])
+
+    def _apply_lm_inverse_jacobian(self, vec):
+        """
+        Return the product of the limited-memory inverse Jacobian and vec.
+
+        Parameters
+        ----------
+        vec : ndarray
+            Array with the size of the states.
+
+        Returns
+        -------
+        ndarray
+            Product of the inverse Jacobian and vec.
+        """
+        prod = self._apply_initial_inverse(vec)
+        for u, (_, dfxm, _) in zip(self._lm_u, self._lm_pairs):
+            prod += u * dfxm.dot(vec)
+
+        return prod
+
     def get_vector(self, vec):
         """
         Return a vector containing the values of vec at the states specified in options.
@@ -22,6 +22,19 @@ class NewtonSolver(NonlinearSolver):
         is the parent system's linear solver.
     linesearch : NonlinearSolver
         Line search algorithm. Default is None for no line search.
+    _jac_valid : bool
+        True if the linear solver holds a linearization from this solver that can be reused.
+    _qn_dr : list of ndarray
+        Residual changes of the rank one updates of the inverse jacobian. Only used if the
+        reuse_jac option is True.
+    _qn_u : list of ndarray
+        Update vectors of the rank one updates of the inverse jacobian. Only used if the
+        reuse_jac option is True.
+    _qn_prev : tuple or None
+        Outputs, residuals and linear solution from the previous iteration, used to form the
+        next rank one update.
+    _qn_norm : float or None
+        Residual norm at the start of the previous iteration.
     """
 
     SOLVER = 'NL: Newton'
@@ -43,6 +56,12 @@ class NewtonSolver(NonlinearSolver):
         # Slot for linesearch
         self.linesearch = BoundsEnforceLS()
 
+        self._jac_valid = False
+        self._qn_dr = []
+        self._qn_u = []
+        self._qn_prev = None
+        self._qn_norm = None
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -60,6 +79,18 @@ class NewtonSolver(NonlinearSolver):
                              desc='When the option is true, a solver will reraise any '
                              'AnalysisError that arises during subsolve; when false, it will '
                              'continue solving.')
+        self.options.declare('reuse_jac', types=bool, default=False,
+                             desc='When True, keep the linearization from earlier iterations and '
+                             'earlier solves and correct it with rank one (bad Broyden) '
+                             'updates. The system is only linearized again when the '
+                             'convergence rate degrades.')
+        self.options.declare('reuse_jac_rate', default=0.5, lower=0.0,
+                             desc='When reuse_jac is True, linearize again if the ratio of the '
+                             'residual norm to the one from the previous iteration is larger '
+                             'than this.')
+        self.options.declare('max_jac_updates', types=int, default=10, lower=0,
+                             desc='When reuse_jac is True, maximum number of rank one updates '
+                             'applied before the system is linearized again.')
 
         self.supports['gradients'] = True
         self.supports['implicit_components'] = True
@@ -92,6 +123,9 @@ class NewtonSolver(NonlinearSolver):
         if self.linesearch is not None:
             self.linesearch._setup_solvers(system, self._depth + 1)
 
+        self._jac_valid = False
+        self._qn_reset()
+
     def _assembled_jac_solver_iter(self):
         """
         Return a generator of linear solvers using assembled jacs.
@@ -189,6 +223,10 @@ class NewtonSolver(NonlinearSolver):
         # Execute guess_nonlinear if specified.
         system._guess_nonlinear()
 
+        # Keep the linearization from the last solve, but not the secant updates, since the
+        # residuals at a new point can't be compared with the ones from the last solve.
+        self._qn_reset()
+
         with Recording('Newton_subsolve', 0, self):
             if self.options['solve_subsystems'] and \
                (self._iter_count <= self.options['max_sub_solves']):
@@ -222,16 +260,26 @@ class NewtonSolver(NonlinearSolver):
 
         system._vectors['residual']['linear'].set_vec(system._residuals)
         system._vectors['residual']['linear'] *= -1.0
-        my_asm_jac = self.linear_solver._assembled_jac
 
-        system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
-        if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
-            my_asm_jac._update(system)
+        reuse_jac = self.options['reuse_jac'] and not system.under_complex_step
+
+        if not reuse_jac or self._qn_needs_linearize():
+            my_asm_jac = self.linear_solver._assembled_jac
 
-        self._linearize()
+            system._linearize(my_asm_jac, sub_do_ln=do_sub_ln)
+            if (my_asm_jac is not None and system.linear_solver._assembled_jac is not my_asm_jac):
+                my_asm_jac._update(system)
+
+            self._linearize()
+
+            self._jac_valid = reuse_jac
+            self._qn_reset()
 
         self.linear_solver.solve('fwd')
 
+        if reuse_jac:
+            self._qn_update_step()
+
         if self.linesearch:
             self.linesearch._do_subsolve = do_subsolve
             self.linesearch.solve()
@@ -250,6 +298,72 @@ class NewtonSolver(NonlinearSolver):
         # Enable local fd
         system._owns_approx_jac = approx_status
 
+    def _qn_reset(self):
+        """
+        Discard the rank one updates of the inverse jacobian.
+        """
+        self._qn_dr = []
+        self._qn_u = []
+        self._qn_prev = None
+        self._qn_norm = None
+
+    def _qn_needs_linearize(self):
+        """
+        Return True if the system must be linearized again before the next Newton step.
+
+        Returns
+        -------
+        bool
+            True if the stored linearization can't be reused.
+        """
+        if not self._jac_valid or len(self._qn_u) >= self.options['max_jac_updates']:
+            return True
+
+        norm = self._iter_get_norm()
+        prev_norm = self._qn_norm
+        self._qn_norm = norm
+
+        return prev_norm is not None and norm > self.options['reuse_jac_rate'] * prev_norm
+
+    def _qn_update_step(self):
+        """
+        Add a rank one update to the inverse jacobian and apply the updates to the Newton step.
+
+        The inverse jacobian is H = H0 + sum_i u_i dr_i^T, where H0 is the inverse of the
+        stored linearization. The update from the latest step enforces H dr = dx (bad Broyden).
+        """
+        system = self._system()
+        d_outputs = system._vectors['output']['linear']
+        weights = self._dot_weights()
+
+        outputs = system._outputs.asarray(copy=True)
+        residuals = system._residuals.asarray(copy=True)
+
+        # the linear solution is H0 (-r), so H0 dr follows from the solutions at both points.
+        step0 = d_outputs.asarray(copy=True)
+
+        if self._qn_prev is not None:
+            prev_outputs, prev_residuals, prev_step0 = self._qn_prev
+            dx = outputs - prev_outputs
+            dr = residuals - prev_residuals
+
+            drdr = self._dist_dot(dr, dr, weights)
+            if drdr > 0.0:
+                h_dr = prev_step0 - step0
+                for u, dr_i in zip(self._qn_u, self._qn_dr):
+                    h_dr += u * self._dist_dot(dr_i, dr, weights)
+
+                self._qn_u.append((dx - h_dr) / drdr)
+                self._qn_dr.append(dr)
+
+        self._qn_prev = (outputs, residuals, step0)
+
+        if self._qn_u:
+            step = step0.copy()
+            for u, dr_i in zip(self._qn_u, self._qn_dr):
+                step -= u * self._dist_dot(dr_i, residuals, weights)
+            d_outputs.set_val(step)
+
     def _set_complex_step_mode(self, active):
         """
         Turn on or off complex stepping mode.
@@ -266,6 +380,8 @@ class NewtonSolver(NonlinearSolver):
             if self.linear_solver._assembled_jac is not None:
                 self.linear_solver._assembled_jac.set_complex_step_mode(active)
 
+        self._jac_valid = False
+
     def cleanup(self):
         """
         Clean up resources prior to exit.
@@ -12,6 +12,21 @@ class NonlinearBlockGS(NonlinearSolver):
 
     Attributes
     ----------
+    _accel_dx : ndarray or None
+        Ring buffer holding the latest changes in the outputs between iterations, one per row.
+        Only used if the acceleration option is set.
+    _accel_df : ndarray or None
+        Ring buffer holding the latest changes in the Gauss-Seidel updates between iterations,
+        one per row. Only used if the acceleration option is set.
+    _accel_u : ndarray or None
+        Ring buffer holding the update vectors of the rank one corrections of the inverse
+        jacobian. Only used if the acceleration option is 'broyden'.
+    _accel_count : int
+        Number of updates added to the ring buffers since the solver started iterating.
+    _accel_x_n_1 : ndarray or None
+        Cached outputs at the start of the previous iteration.
+    _accel_f_n_1 : ndarray or None
+        Cached Gauss-Seidel update from the previous iteration.
     _delta_outputs_n_1 : ndarray
         Cached change in the full output vector for the previous iteration. Only used if the aitken
         acceleration option is turned on.
@@ -36,6 +51,13 @@ class NonlinearBlockGS(NonlinearSolver):
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
 
+        self._accel_dx = None
+        self._accel_df = None
+        self._accel_u = None
+        self._accel_count = 0
+        self._accel_x_n_1 = None
+        self._accel_f_n_1 = None
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -55,6 +77,10 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_aitken'] and self.options['acceleration'] is not None:
+            raise RuntimeError(f"{self.msginfo}: Aitken relaxation can't be combined with "
+                               f"'{self.options['acceleration']}' acceleration.")
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -69,6 +95,15 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        self.options.declare('acceleration', default=None, values=[None, 'anderson', 'broyden'],
+                             desc="Use Anderson mixing or Broyden's (second) method to "
+                             "accelerate the Gauss-Seidel iterations, based on the outputs from "
+                             "the latest 'accel_depth' iterations.")
+        self.options.declare('accel_depth', types=int, default=5, lower=1,
+                             desc='Number of previous iterations kept for the acceleration.')
+        self.options.declare('accel_relax_factor', default=1.0, lower=0.0,
+                             desc='Relaxation factor applied to the Gauss-Seidel update in the '
+                             'accelerated iterations.')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -97,6 +132,16 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['acceleration'] is not None:
+            outputs = system._outputs.asarray()
+            shape = (self.options['accel_depth'], outputs.size)
+            self._accel_dx = np.zeros(shape, dtype=outputs.dtype)
+            self._accel_df = np.zeros(shape, dtype=outputs.dtype)
+            if self.options['acceleration'] == 'broyden':
+                self._accel_u = np.zeros(shape, dtype=outputs.dtype)
+            self._accel_count = 0
+            self._accel_x_n_1 = self._accel_f_n_1 = None
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -116,6 +161,7 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        use_accel = self.options['acceleration'] is not None
 
         if use_aitken:
 
@@ -130,7 +176,11 @@ class NonlinearBlockGS(NonlinearSolver):
             # store a copy of the outputs, used to compute the change in outputs later
             delta_outputs_n = outputs.asarray(copy=True)
 
-        if use_aitken or not self.options['use_apply_nonlinear']:
+        if use_accel:
+            # store a copy of the outputs, used to compute the Gauss-Seidel update later
+            accel_outputs_n = outputs.asarray(copy=True)
+
+        if use_aitken or use_accel or not self.options['use_apply_nonlinear']:
             # store a copy of the outputs
             if not self.options['use_apply_nonlinear']:
                 with system._unscaled_context(outputs=[outputs]):
@@ -200,11 +250,77 @@ class NonlinearBlockGS(NonlinearSolver):
             # save update to use in next iteration
             delta_outputs_n_1[:] = delta_outputs_n
 
+        elif use_accel:
+            outputs.set_val(self._accel_outputs(accel_outputs_n, outputs.asarray() -
+                                                accel_outputs_n))
+
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
                 residuals.set_val(outputs.asarray() - outputs_n)
 
+    def _accel_outputs(self, x_n, f_n):
+        """
+        Return the accelerated outputs for the next iteration and update the history.
+
+        Parameters
+        ----------
+        x_n : ndarray
+            Outputs at the start of this iteration.
+        f_n : ndarray
+            Change in the outputs made by the Gauss-Seidel sweep in this iteration.
+
+        Returns
+        -------
+        ndarray
+            The new outputs.
+        """
+        beta = self.options['accel_relax_factor']
+        depth = self.options['accel_depth']
+        dx = self._accel_dx
+        df = self._accel_df
+        weights = self._dot_weights()
+
+        if self._accel_x_n_1 is not None:
+            # add the newest pair of differences to the ring buffers, replacing the oldest.
+            slot = self._accel_count % depth
+            dx[slot] = x_n - self._accel_x_n_1
+            df[slot] = f_n - self._accel_f_n_1
+
+            if self.options['acceleration'] == 'broyden':
+                # rank one update of the inverse jacobian, H_n = H_n-1 + u df^T, with
+                # u = (dx - H_n-1 df) / (df . df), where H = -beta * I + sum_i u_i df_i^T.
+                # The oldest term, stored in this slot, is dropped first.
+                u = self._accel_u
+                u[slot] = 0.0
+                dfdf = self._dist_dot(df[slot], df[slot], weights)
+                if dfdf != 0.0:
+                    u[slot] = (dx[slot] + beta * df[slot] -
+                               u.T.dot(self._dist_dot(df, df[slot], weights))) / dfdf
+
+            self._accel_count += 1
+
+        self._accel_x_n_1 = x_n
+        self._accel_f_n_1 = f_n
+
+        x_new = x_n + beta * f_n
+        nhist = min(self._accel_count, depth)
+
+        if nhist > 0:
+            if self.options['acceleration'] == 'anderson':
+                # least squares fit of the newest update by the update differences
+                gram = self._dist_dot(df[:nhist], df[:nhist].T, weights)
+                gamma = np.linalg.lstsq(gram, self._dist_dot(df[:nhist], f_n, weights),
+                                        rcond=None)[0]
+                step = (dx[:nhist] + beta * df[:nhist]).T.dot(gamma)
+            else:
+                step = self._accel_u.T.dot(self._dist_dot(df, f_n, weights))
+
+            if np.all(np.isfinite(step)):
+                x_new -= step
+
+        return x_new
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
@@ -11,6 +11,35 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to solve the subsystems concurrently. '
+                             'This only helps if the subsystems release the GIL while they run, '
+                             'e.g., when they call compiled code.')
+        self.options.declare('min_thread_speedup', default=1.2, lower=0.0,
+                             desc='Minimum speedup, measured over the first threaded iterations, '
+                             'needed to keep solving the subsystems on threads. Otherwise they '
+                             'are solved serially.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+        self._setup_threads(system)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -20,15 +49,14 @@ class NonlinearBlockJac(NonlinearSolver):
         system._transfer('nonlinear', 'fwd')
 
         with Recording('NonlinearBlockJac', 0, self) as rec:
+            subs = system._subsystems_myproc
 
             # If this is a parallel group, check for analysis errors and reraise.
-            if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
+            if len(subs) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    self._run_subsystems(lambda subsys: subsys._solve_nonlinear(), subs)
             else:
-                for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                self._run_subsystems(lambda subsys: subsys._solve_nonlinear(), subs)
 
             rec.abs = 0.0
             rec.rel = 0.0
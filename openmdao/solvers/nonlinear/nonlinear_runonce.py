@@ -23,6 +23,10 @@ class NonlinearRunOnce(NonlinearSolver):
         """
         system = self._system()
 
+        # if we're only running systems relevant to some subset of the variables (e.g. during
+        # an approximation of total derivatives), skip the rest.
+        rel_systems = system._problem_meta['nl_rel_systems']
+
         with Recording('NLRunOnce', 0, self) as rec:
             # If this is a parallel group, transfer all at once then run each subsystem.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
@@ -30,11 +34,12 @@ class NonlinearRunOnce(NonlinearSolver):
 
                 with multi_proc_fail_check(system.comm):
                     for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                        if rel_systems is None or subsys.pathname in rel_systems:
+                            subsys._solve_nonlinear()
 
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
-                self._gs_iter()
+                self._gs_iter(rel_systems)
 
             rec.abs = 0.0
             rec.rel = 0.0
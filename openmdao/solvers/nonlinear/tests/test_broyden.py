@@ -547,6 +547,99 @@ class TestBryoden(unittest.TestCase):
 
         assert_near_equal(prob['comp.y'], np.array([-36.26230985,  10.20857237, -54.17658612]), 1e-6)
 
+    def _build_limited_memory_models(self):
+        def vector():
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+            model.add_subsystem('vec', VectorEquation())
+            model.connect('p1.c', 'vec.c')
+            model.nonlinear_solver = om.BroydenSolver(state_vars=['vec.x'], maxiter=15,
+                                                      compute_jacobian=False)
+            prob.setup()
+            return prob, ['vec.x']
+
+        def mixed():
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('p1', om.IndepVarComp('c', 0.01))
+            model.add_subsystem('mixed', MixedEquation())
+            model.connect('p1.c', 'mixed.c')
+            model.nonlinear_solver = om.BroydenSolver(state_vars=['mixed.x12', 'mixed.x3',
+                                                                  'mixed.x45'], maxiter=15)
+            model.nonlinear_solver.linear_solver = om.DirectSolver()
+            prob.setup()
+            return prob, ['mixed.x12', 'mixed.x3', 'mixed.x45']
+
+        def sellar_full():
+            prob = om.Problem()
+            prob.model = SellarStateConnection(nonlinear_solver=om.BroydenSolver(),
+                                               linear_solver=om.LinearRunOnce())
+            prob.setup()
+            prob.model.nonlinear_solver.linear_solver = om.DirectSolver()
+            return prob, ['y1', 'state_eq.y2_command']
+
+        def spedicato_huang():
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('p1', om.IndepVarComp('x', np.array([0, 20.0])))
+            model.add_subsystem('comp', SpedicatoHuang())
+            model.connect('p1.x', 'comp.x')
+            model.nonlinear_solver = om.BroydenSolver(state_vars=['comp.y'], maxiter=20,
+                                                      diverge_limit=0.5)
+            model.nonlinear_solver.linear_solver = om.DirectSolver()
+            prob.setup()
+            return prob, ['comp.y']
+
+        return [vector, mixed, sellar_full, spedicato_huang]
+
+    def test_limited_memory(self):
+        # With room for all updates, the limited-memory variant takes the same steps.
+        for build in self._build_limited_memory_models():
+            results = []
+            for limited_memory in (0, 50):
+                prob, names = build()
+                solver = prob.model.nonlinear_solver
+                solver.options['limited_memory'] = limited_memory
+                prob.set_solver_print(level=-1)
+                prob.run_model()
+
+                self.assertEqual(solver.Gm is None, limited_memory > 0)
+                results.append((solver._iter_count, [prob.get_val(n) for n in names]))
+
+            self.assertEqual(results[1][0], results[0][0], build.__name__)
+            for actual, expected in zip(results[1][1], results[0][1]):
+                assert_near_equal(actual, expected, 1e-8)
+
+    def test_limited_memory_short(self):
+        for build in self._build_limited_memory_models():
+            prob, names = build()
+            solver = prob.model.nonlinear_solver
+            solver.options['limited_memory'] = 2
+            solver.options['maxiter'] = 50
+            prob.set_solver_print(level=-1)
+            prob.run_model()
+
+            self.assertLessEqual(len(solver._lm_pairs), 2)
+            self.assertLess(solver._iter_count, 50, build.__name__)
+
+    def test_limited_memory_full_iterative(self):
+        # The inverse jacobian is never formed, so any linear solver can seed it.
+        prob = om.Problem()
+        model = prob.model = SellarStateConnection(nonlinear_solver=om.BroydenSolver(),
+                                                   linear_solver=om.LinearRunOnce())
+
+        prob.setup()
+
+        model.nonlinear_solver.options['limited_memory'] = 5
+        model.nonlinear_solver.linear_solver = om.ScipyKrylov()
+
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830273, .00001)
+        assert_near_equal(prob['state_eq.y2_command'], 12.05848819, .00001)
+        self.assertTrue(model.nonlinear_solver._iter_count < 5)
+
     def test_backtracking(self):
         top = om.Problem()
         top.model.add_subsystem('px', om.IndepVarComp('x', 1.0))
@@ -823,6 +823,99 @@ class TestNewton(unittest.TestCase):
         msg = "NewtonSolver in <model> <class Group>: solve_subsystems must be set by the user."
         self.assertEqual(str(context.exception), msg)
 
+    def _count_linearize(self, system):
+        counts = [0]
+        linearize = system._linearize
+
+        def counted_linearize(*args, **kwargs):
+            counts[0] += 1
+            return linearize(*args, **kwargs)
+
+        system._linearize = counted_linearize
+        return counts
+
+    def test_reuse_jac(self):
+        results = {}
+        for reuse_jac in (False, True):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['*'])
+            model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['*'])
+
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, reuse_jac=reuse_jac,
+                                                     atol=1e-12, rtol=1e-12, maxiter=20)
+            model.linear_solver = om.DirectSolver()
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            counts = self._count_linearize(model)
+
+            # a sweep over design points, each starting from the last solution
+            values = []
+            for x in np.linspace(1.0, 2.0, 6):
+                prob.set_val('x', x)
+                prob.run_model()
+                values.append(prob.get_val('y1').copy())
+
+            results[reuse_jac] = (values, counts[0])
+
+        for expected, actual in zip(*(results[key][0] for key in (False, True))):
+            assert_near_equal(actual, expected, 1e-10)
+
+        self.assertEqual(results[False][1], 18)
+        # the linearization from the first solve is used for the whole sweep.
+        self.assertEqual(results[True][1], 1)
+
+    def test_reuse_jac_relinearize(self):
+
+        class CubeRoot(om.ImplicitComponent):
+
+            def setup(self):
+                self.add_input('a', np.ones(3))
+                self.add_output('x', np.ones(3))
+                self.declare_partials('x', ['x', 'a'], rows=np.arange(3), cols=np.arange(3))
+
+            def apply_nonlinear(self, inputs, outputs, residuals):
+                residuals['x'] = outputs['x'] ** 3 - inputs['a']
+
+            def linearize(self, inputs, outputs, partials):
+                partials['x', 'x'] = 3.0 * outputs['x'] ** 2
+                partials['x', 'a'] = -1.0
+
+        counts = {}
+        for options in ({'reuse_jac': False}, {'reuse_jac': True, 'max_jac_updates': 0},
+                        {'reuse_jac': True}):
+            prob = om.Problem()
+            model = prob.model
+            model.add_subsystem('comp', CubeRoot(), promotes=['*'])
+
+            newton = model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=50,
+                                                              atol=1e-12, rtol=1e-12, **options)
+            model.linear_solver = om.DirectSolver()
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            lin_counts = self._count_linearize(model)
+
+            iters = []
+            for a in (8.0, 27.0, 1000.0):
+                prob.set_val('a', np.full(3, a))
+                prob.run_model()
+                assert_near_equal(prob.get_val('x'), np.full(3, a ** (1. / 3.)), 1e-10)
+                iters.append(newton._iter_count)
+
+            counts[len(counts)] = (iters, lin_counts[0])
+
+        # with no rank one updates allowed, this is plain Newton.
+        self.assertEqual(counts[1], counts[0])
+        self.assertEqual(counts[0], ([7, 6, 9], 22))
+
+        # a degraded convergence rate triggers a new linearization, but not every iteration.
+        iters, lin_count = counts[2]
+        self.assertTrue(1 < lin_count < 22)
+        self.assertLessEqual(max(iters), 12)
+
 
 class TestNewtonFeatures(unittest.TestCase):
 
@@ -409,6 +409,83 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_acceleration(self):
+        iters = {}
+        for accel in (None, 'anderson', 'broyden'):
+            prob = om.Problem(model=SellarDerivatives())
+            model = prob.model
+
+            prob.setup()
+            model.nonlinear_solver.options['acceleration'] = accel
+            model.nonlinear_solver.options['atol'] = 1e-12
+            model.nonlinear_solver.options['rtol'] = 1e-12
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+            assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+            iters[accel] = model.nonlinear_solver._iter_count
+
+        self.assertEqual(iters, {None: 9, 'anderson': 5, 'broyden': 6})
+
+    def test_NLBGS_acceleration_strong_coupling(self):
+        for accel, depth in (('anderson', 1), ('anderson', 5), ('broyden', 5)):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('d1', om.ExecComp('y1 = 0.98 * y2 + 1.0'), promotes=['*'])
+            model.add_subsystem('d2', om.ExecComp('y2 = 0.99 * y1 - 2.0'), promotes=['*'])
+
+            model.nonlinear_solver = om.NonlinearBlockGS(maxiter=1000, atol=1e-12, rtol=1e-12,
+                                                         acceleration=accel, accel_depth=depth)
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            # the problem is linear, so the secant updates are exact after 2 iterations.
+            self.assertLessEqual(model.nonlinear_solver._iter_count, 5)
+            assert_near_equal(prob.get_val('y1'), -0.96 / 0.0298, 1e-10)
+            assert_near_equal(prob.get_val('y2'), 0.99 * -0.96 / 0.0298 - 2.0, 1e-10)
+
+        # plain Gauss-Seidel only reduces the error by a factor of 0.9702 per iteration.
+        model.nonlinear_solver.options['acceleration'] = None
+        prob.set_val('y1', 1.0)
+        prob.set_val('y2', 1.0)
+        prob.run_model()
+        self.assertGreater(model.nonlinear_solver._iter_count, 500)
+
+    def test_NLBGS_acceleration_cs(self):
+        for accel in ('anderson', 'broyden'):
+            prob = om.Problem(model=SellarDerivatives())
+
+            model = prob.model
+            model.approx_totals(method='cs', step=1e-10)
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            model.nonlinear_solver.options['acceleration'] = accel
+            model.nonlinear_solver.options['atol'] = 1e-15
+            model.nonlinear_solver.options['rtol'] = 1e-15
+
+            prob.run_model()
+
+            J = prob.compute_totals(of=['y1'], wrt=['x'])
+            assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
+    def test_NLBGS_acceleration_with_aitken(self):
+        prob = om.Problem(model=SellarDerivatives())
+        prob.setup()
+        prob.model.nonlinear_solver.options['use_aitken'] = True
+        prob.model.nonlinear_solver.options['acceleration'] = 'anderson'
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.run_model()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: Aitken "
+                         "relaxation can't be combined with 'anderson' acceleration.")
+
     def test_NLBGS_cs(self):
 
         prob = om.Problem(model=SellarDerivatives())
@@ -6,9 +6,11 @@ import numpy as np
 
 import openmdao.api as om
 from openmdao.test_suite.components.ae_tests import AEComp, AEDriver
+from openmdao.test_suite.components.double_sellar import SubSellar
 from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.mpi import MPI
+from openmdao.utils.testing_utils import use_tempdirs
 
 try:
     from openmdao.vectors.petsc_vector import PETScVector
@@ -136,6 +138,103 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y1'], 25.5886171567, .00001)
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
+    def test_threaded(self):
+        results = {}
+        for options in ({}, {'num_threads': 2, 'min_thread_speedup': 0.0},
+                        {'num_threads': 2, 'min_thread_speedup': 1e6}):
+            prob = om.Problem()
+            model = prob.model
+
+            model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+            model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+            model.linear_solver = om.LinearBlockGS()
+            model.nonlinear_solver = om.NonlinearBlockJac(**options)
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+
+            prob.set_val('x', 1.)
+            prob.set_val('z', np.array([5.0, 2.0]))
+
+            prob.run_model()
+
+            threads = model.nonlinear_solver._threads
+            if options:
+                self.assertIsNotNone(threads.speedup)
+                # no speedup can satisfy the second threshold, so that solver runs serially.
+                self.assertEqual(threads.threaded, options['min_thread_speedup'] == 0.0)
+            else:
+                self.assertIsNone(threads)
+
+            results[len(results)] = (prob['y1'].copy(), prob['y2'].copy(),
+                                     model.nonlinear_solver._iter_count)
+
+        for i in (1, 2):
+            assert_near_equal(results[i][0], results[0][0], 1e-12)
+            assert_near_equal(results[i][1], results[0][1], 1e-12)
+            self.assertEqual(results[i][2], results[0][2])
+
+
+@use_tempdirs
+class TestNLBlockJacobiThreads(unittest.TestCase):
+
+    def _build_threaded_subsellars(self):
+        prob = om.Problem()
+        model = prob.model
+
+        ivc = model.add_subsystem('ivc', om.IndepVarComp())
+        ivc.add_output('x', 1.0)
+        ivc.add_output('z', np.array([5.0, 2.0]))
+
+        for name in ('g1', 'g2'):
+            sub = model.add_subsystem(name, SubSellar())
+            sub.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            sub.linear_solver = om.DirectSolver()
+            model.connect('ivc.x', f'{name}.x')
+            model.connect('ivc.z', f'{name}.z')
+
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=2, min_thread_speedup=0.0)
+
+        return prob
+
+    def test_threaded_stacks(self):
+        prob = self._build_threaded_subsellars()
+        prob.setup()
+        prob.set_solver_print(level=2)
+        prob.run_model()
+
+        model = prob.model
+        self.assertTrue(model.nonlinear_solver._threads.threaded)
+        assert_near_equal(prob['g1.y1'], 25.5883027, 1e-6)
+        assert_near_equal(prob['g2.y1'], 25.5883027, 1e-6)
+
+        # the workers' stacks didn't leak into the calling thread.
+        self.assertEqual(model.nonlinear_solver._solver_info.prefix, '')
+        self.assertEqual(model.nonlinear_solver._recording_iter.stack, [])
+
+    def test_threaded_recorded_child(self):
+        prob = self._build_threaded_subsellars()
+        recorder = om.SqliteRecorder('cases.sql')
+        prob.model.g1.nonlinear_solver.add_recorder(recorder)
+        prob.setup()
+        prob.set_solver_print(level=0)
+
+        msg = "NonlinearBlockJac in <model> <class Group>: Solving subsystems serially " \
+              "because 'g1' or one of its solvers has a recorder."
+        with assert_warning(om.SolverWarning, msg):
+            prob.final_setup()
+
+        self.assertIsNone(prob.model.nonlinear_solver._threads)
+
+        prob.run_model()
+        prob.cleanup()
+
+        cases = om.CaseReader('cases.sql').list_cases('root.g1.nonlinear_solver', out_stream=None)
+        self.assertEqual(len(cases), prob.model.g1.nonlinear_solver._iter_count + 1)
+        self.assertTrue(all(case.startswith('rank0:root._solve_nonlinear|0|NonlinearBlockJac|')
+                            for case in cases))
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
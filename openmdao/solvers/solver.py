@@ -5,6 +5,7 @@ import os
 import pprint
 import re
 import sys
+import threading
 import weakref
 
 import numpy as np
@@ -16,15 +17,19 @@ from openmdao.utils.mpi import MPI
 from openmdao.utils.options_dictionary import OptionsDictionary
 from openmdao.utils.record_util import create_local_meta, check_path
 from openmdao.utils.om_warnings import issue_warning, SolverWarning
+from openmdao.utils.concurrent import ThreadedEvaluator
 from openmdao.core.component import Component
 
 _emptyset = set()
 
 
-class SolverInfo(object):
+class SolverInfo(threading.local):
     """
     Communal object for storing some formatting for solver iprint.
 
+    Each thread has its own prefix and stack, so subsystems solved on threads don't interleave
+    their printing levels.
+
     Attributes
     ----------
     prefix : str
@@ -40,6 +45,17 @@ class SolverInfo(object):
         self.prefix = ""
         self.stack = []
 
+    def __reduce__(self):
+        """
+        Pickle the state of the current thread, since thread local objects can't be pickled.
+
+        Returns
+        -------
+        tuple
+            The class, its constructor arguments, and the state of the current thread.
+        """
+        return (self.__class__, (), self.__dict__.copy())
+
     def clear(self):
         """
         Clear out the iprint stack, in case something is left over from a handled exception.
@@ -137,6 +153,8 @@ class Solver(object):
         Normalization factor
     _problem_meta : dict
         Problem level metadata.
+    _threads : <ThreadedEvaluator> or None
+        Runs the subsystem solves on a pool of threads, for solvers that support it.
     """
 
     # Object to store some formatting for iprint that is shared across all solvers.
@@ -156,6 +174,7 @@ class Solver(object):
         self._mode = 'fwd'
         self._iter_count = 0
         self._problem_meta = None
+        self._threads = None
 
         # Solver options
         self.options = OptionsDictionary(parent_name=self.msginfo)
@@ -325,6 +344,84 @@ class Solver(object):
             'residual': myresiduals
         }
 
+    def _setup_threads(self, system):
+        """
+        Create the evaluator used to solve the subsystems on threads, if threads are requested.
+
+        This uses the num_threads and min_thread_speedup options. Threads aren't used if
+        anything below the system is recorded, because the recorders aren't thread safe.
+
+        Parameters
+        ----------
+        system : <System>
+            Pointer to the owning system.
+        """
+        self._threads = None
+        if self.options['num_threads'] < 2:
+            return
+
+        for subsys in system.system_iter(recurse=True):
+            recorded = [subsys] + [s for s in (subsys.nonlinear_solver, subsys.linear_solver)
+                                   if s is not None]
+            for solver in recorded[1:]:
+                recorded.extend(s for s in (getattr(solver, 'linesearch', None),
+                                            getattr(solver, 'precon', None)) if s is not None)
+            if any(obj._rec_mgr._recorders for obj in recorded):
+                issue_warning(f"{self.msginfo}: Solving subsystems serially because "
+                              f"'{subsys.pathname}' or one of its solvers has a recorder.",
+                              category=SolverWarning)
+                return
+
+        self._threads = ThreadedEvaluator(self.options['num_threads'],
+                                          self.options['min_thread_speedup'])
+
+    def _run_subsystems(self, func, subsystems):
+        """
+        Call func for each of the given subsystems, on threads if they are enabled.
+
+        Parameters
+        ----------
+        func : function
+            Function that takes a subsystem as its only argument.
+        subsystems : list of <System>
+            The subsystems to pass to func.
+        """
+        threads = self._threads
+        if threads is None or not threads.threaded or len(subsystems) < 2:
+            for subsys in subsystems:
+                func(subsys)
+            return
+
+        # the iprint and recording iteration stacks are thread local, so each worker starts
+        # from a copy of the stacks of the calling thread.
+        solver_info = self._solver_info
+        rec_iter = self._recording_iter
+        info_state = (solver_info.prefix, solver_info.stack)
+        rec_state = (rec_iter.prefix, rec_iter.stack, rec_iter._norec_refcount)
+
+        def thread_func(subsys):
+            solver_info.prefix, solver_info.stack = info_state[0], list(info_state[1])
+            rec_iter.prefix, rec_iter.stack, rec_iter._norec_refcount = \
+                rec_state[0], list(rec_state[1]), rec_state[2]
+            func(subsys)
+
+        trial = threads.speedup is None
+        try:
+            threads(thread_func, subsystems)
+        finally:
+            # thread_func may have been run serially in this thread.
+            solver_info.prefix, solver_info.stack = info_state
+            rec_iter.prefix, rec_iter.stack, rec_iter._norec_refcount = rec_state
+
+        if trial and threads.speedup is not None and self.options['iprint'] > 0:
+            system = self._system()
+            if system.comm.rank == 0 or os.environ.get('USE_PROC_FILES'):
+                msg = f"{solver_info.prefix}{self.SOLVER} Thread speedup of " \
+                      f"{threads.speedup:.2f} with {threads.num_threads} threads"
+                if not threads.threaded:
+                    msg += ", solving subsystems serially"
+                print(msg)
+
     def _set_solver_print(self, level=2, type_='all'):
         """
         Control printing for solvers and subsolvers in the model.
@@ -547,12 +644,19 @@ class NonlinearSolver(Solver):
         """
         Run the solver.
         """
+        # iterative solvers converge the whole system, so never skip irrelevant subsystems
+        # below them.
+        meta = self._system()._problem_meta
+        rel_systems = meta['nl_rel_systems']
+        meta['nl_rel_systems'] = None
         try:
             self._solve()
         except Exception as err:
             if self.options['debug_print']:
                 self._print_exc_debug_info()
             raise err
+        finally:
+            meta['nl_rel_systems'] = rel_systems
 
     def _iter_initialize(self):
         """
@@ -717,6 +821,48 @@ class NonlinearSolver(Solver):
         """
         return self._system()._residuals.get_norm()
 
+    def _dot_weights(self):
+        """
+        Return the weights that exclude duplicated outputs from distributed dot products.
+
+        These are used for dot products of arrays sized like the local output vector.
+
+        Returns
+        -------
+        ndarray or None
+            Zero for outputs owned by another proc and one otherwise, or None if not under MPI.
+        """
+        system = self._system()
+        if system.comm.size == 1 or not hasattr(system._outputs, '_get_dup_inds'):
+            return None
+
+        weights = np.ones(len(system._outputs))
+        weights[system._outputs._get_dup_inds()] = 0.0
+        return weights
+
+    def _dist_dot(self, a, b, weights):
+        """
+        Return the dot product of the given arrays, summed over all procs under MPI.
+
+        Parameters
+        ----------
+        a : ndarray
+            Array whose last axis runs over the outputs.
+        b : ndarray
+            Array whose first axis runs over the outputs.
+        weights : ndarray or None
+            Weights from _dot_weights.
+
+        Returns
+        -------
+        ndarray or float
+            The dot product.
+        """
+        if weights is None:
+            return a.dot(b)
+
+        return self._system().comm.allreduce((a * weights).dot(b))
+
     def _disallow_discrete_outputs(self):
         """
         Raise an exception if any discrete outputs exist in our System.
@@ -747,12 +893,20 @@ class NonlinearSolver(Solver):
                   "saved to '%s'." % filename)
             sys.stdout.flush()
 
-    def _gs_iter(self):
+    def _gs_iter(self, rel_systems=None):
         """
         Perform a Gauss-Seidel iteration over this Solver's subsystems.
+
+        Parameters
+        ----------
+        rel_systems : set or None
+            If not None, only subsystems whose pathnames are in this set are run.
         """
         system = self._system()
         for subsys, _ in system._subsystems_allprocs.values():
+            if rel_systems is not None and subsys.pathname not in rel_systems:
+                continue
+
             system._transfer('nonlinear', 'fwd', subsys.name)
 
             if subsys._is_local:
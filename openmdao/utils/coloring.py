@@ -2280,6 +2280,9 @@ class _ColSparsityJac(object):
         self._ncols = ncols
         self._nrows = nrows
 
+    def _update(self, system):
+        pass
+
     def set_col(self, system, i, column):
         # record only the nonzero part of the column.
         # Depending on user specified tolerance, the number of nonzeros may be further reduced later
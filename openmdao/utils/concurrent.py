@@ -1,8 +1,10 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or on a pool of threads.
 """
 import os
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
@@ -10,7 +12,7 @@ from openmdao.utils.mpi import debug
 trace = os.environ.get('OPENMDAO_TRACE')
 
 
-def concurrent_eval_lb(func, cases, comm, broadcast=False):
+def concurrent_eval_lb(func, cases, comm, broadcast=False, callback=None):
     """
     Evaluate function on multiple processors with load balancing.
 
@@ -32,6 +34,10 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
         If True, the results will be broadcast out to the worker procs so
         that the return value of concurrent_eval_lb will be the full result
         list in every process.
+    callback : function or None
+        If not None, it is called on the master rank with each (retval, err) result as soon
+        as it is received, before the next case is taken from cases.  This allows cases to be
+        generated lazily based on earlier results.
 
     Returns
     -------
@@ -42,7 +48,7 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
         if comm.rank == 0:  # master rank
             if trace:
                 debug('Running Master Rank')
-            results = _concurrent_eval_lb_master(cases, comm)
+            results = _concurrent_eval_lb_master(cases, comm, callback)
             if trace:
                 debug('Master Rank Complete')
         else:
@@ -69,11 +75,13 @@ def concurrent_eval_lb(func, cases, comm, broadcast=False):
             else:
                 err = None
             results.append((retval, err))
+            if callback is not None:
+                callback((retval, err))
 
     return results
 
 
-def _concurrent_eval_lb_master(cases, comm):
+def _concurrent_eval_lb_master(cases, comm, callback=None):
     """
     Coordinate worker processes.
 
@@ -88,6 +96,8 @@ def _concurrent_eval_lb_master(cases, comm):
     comm : MPI communicator or None
         The MPI communicator that is shared between the master and workers.
         If None, the function will be executed serially.
+    callback : function or None
+        If not None, it is called with each (retval, err) result as soon as it is received.
 
     Returns
     -------
@@ -125,11 +135,8 @@ def _concurrent_eval_lb_master(cases, comm):
 
             # store results
             results.append((retval, err))
-
-            # don't stop until we hear back from every worker process
-            # we sent a case to
-            if received == sent:
-                break
+            if callback is not None:
+                callback((retval, err))
 
             try:
                 case = next(case_iter)
@@ -140,6 +147,11 @@ def _concurrent_eval_lb_master(cases, comm):
                 comm.send(case, worker, tag=1)
                 sent += 1
 
+            # don't stop until we hear back from every worker process
+            # we sent a case to
+            if received == sent:
+                break
+
     # tell all workers to stop
     for rank in range(1, comm.size):
         comm.send((None, None), rank, tag=1)
@@ -252,3 +264,98 @@ def concurrent_eval(func, cases, comm, allgather=False, model_mpi=None):
                 results = None
 
     return results
+
+
+class ThreadedEvaluator(object):
+    """
+    Evaluate a function for a list of cases on a pool of threads.
+
+    The first few threaded evaluations are timed, and if the threads don't give at least the
+    requested speedup (e.g., because the function holds the GIL), all later evaluations are
+    done serially.
+
+    Attributes
+    ----------
+    num_threads : int
+        Maximum number of threads used for an evaluation.
+    min_speedup : float
+        Minimum measured speedup needed to keep evaluating on threads.
+    num_trials : int
+        Number of threaded evaluations used to measure the speedup.
+    speedup : float or None
+        Ratio of the summed cpu time of the cases to the elapsed time over the trial
+        evaluations, or None if the trials haven't finished.
+    threaded : bool
+        True if evaluations are still done on threads.
+    _trials : int
+        Number of threaded evaluations timed so far.
+    _cpu_time : float
+        Summed thread cpu time of all cases in the timed evaluations.
+    _wall_time : float
+        Elapsed time of the timed evaluations.
+    """
+
+    def __init__(self, num_threads, min_speedup=1.1, num_trials=3):
+        """
+        Initialize all attributes.
+
+        Parameters
+        ----------
+        num_threads : int
+            Maximum number of threads used for an evaluation.
+        min_speedup : float
+            Minimum measured speedup needed to keep evaluating on threads.
+        num_trials : int
+            Number of threaded evaluations used to measure the speedup.
+        """
+        self.num_threads = num_threads
+        self.min_speedup = min_speedup
+        self.num_trials = num_trials
+        self.speedup = None
+        self.threaded = num_threads > 1
+        self._trials = 0
+        self._cpu_time = 0.0
+        self._wall_time = 0.0
+
+    def __call__(self, func, cases):
+        """
+        Evaluate func for each case and return the results in order.
+
+        Exceptions raised by func are re-raised in the calling thread.
+
+        Parameters
+        ----------
+        func : function
+            The function to evaluate. It takes a single case as its argument.
+        cases : list
+            The cases to evaluate.
+
+        Returns
+        -------
+        list
+            The return value of func for each case.
+        """
+        if not self.threaded or len(cases) < 2:
+            return [func(case) for case in cases]
+
+        if self.speedup is not None:
+            with ThreadPoolExecutor(min(self.num_threads, len(cases))) as executor:
+                return list(executor.map(func, cases))
+
+        def timed_func(case):
+            start = time.thread_time()
+            retval = func(case)
+            return retval, time.thread_time() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(min(self.num_threads, len(cases))) as executor:
+            results = list(executor.map(timed_func, cases))
+        self._wall_time += time.perf_counter() - start
+        self._cpu_time += sum(cpu for _, cpu in results)
+
+        self._trials += 1
+        if self._trials == self.num_trials:
+            self.speedup = self._cpu_time / self._wall_time if self._wall_time > 0.0 else 1.0
+            self.threaded = self.speedup >= self.min_speedup
+
+        return [retval for retval, _ in results]
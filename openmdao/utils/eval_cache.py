@@ -0,0 +1,174 @@
+"""
+A bounded LRU cache of component evaluations keyed on input values.
+"""
+
+import hashlib
+import pickle
+import shelve
+from collections import OrderedDict
+
+import numpy as np
+
+
+class EvalCache(object):
+    """
+    Least recently used cache of results keyed on a hash of input values.
+
+    Each entry is a dict that may contain an 'outputs' entry (continuous outputs array
+    and discrete outputs) and/or a 'partials' entry (subjac values).  Entries are kept in
+    memory up to a maximum count and, if a filename is given, are also persisted to disk
+    using the shelve module so they survive across runs.  Keys are namespaced so that
+    different components (or different versions of the same component) sharing a file
+    never see each other's entries.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that found a cached result.
+    misses : int
+        Number of lookups that did not find a cached result.
+    _maxsize : int
+        Maximum number of entries kept in memory.
+    _entries : OrderedDict
+        Mapping of key to cached entry, ordered from least to most recently used.
+    _filename : str or None
+        Name of the file where entries are persisted.  If None, nothing is persisted.
+    _namespace : bytes
+        Prefix hashed into every key.
+    """
+
+    def __init__(self, maxsize=128, filename=None, namespace=''):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of entries kept in memory.
+        filename : str or None
+            Name of the file where entries are persisted.  If None, nothing is persisted.
+        namespace : str
+            String identifying the owner of the cached entries.  It is hashed into every key.
+        """
+        self.hits = 0
+        self.misses = 0
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._filename = filename
+        self._namespace = namespace.encode()
+
+    def __len__(self):
+        """
+        Return the number of entries currently held in memory.
+
+        Returns
+        -------
+        int
+            Number of in-memory entries.
+        """
+        return len(self._entries)
+
+    def get_key(self, inputs, discrete_inputs=None):
+        """
+        Return a key based on the current values of the given inputs.
+
+        Parameters
+        ----------
+        inputs : <Vector>
+            The continuous input vector.
+        discrete_inputs : dict-like or None
+            Discrete input values.
+
+        Returns
+        -------
+        str
+            Hex digest of the namespace and input values.
+        """
+        h = hashlib.sha1(self._namespace)
+        h.update(np.ascontiguousarray(inputs.asarray()).tobytes())
+        if discrete_inputs:
+            h.update(pickle.dumps(sorted(discrete_inputs.items())))
+        return h.hexdigest()
+
+    def get(self, key, field):
+        """
+        Return the named field of the entry for the given key, or None if not found.
+
+        Parameters
+        ----------
+        key : str
+            Key returned from get_key.
+        field : str
+            Name of the field ('outputs' or 'partials').
+
+        Returns
+        -------
+        object or None
+            The cached value or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            if self._filename is not None:
+                with shelve.open(self._filename) as db:
+                    entry = db.get(key)
+                if entry is not None:
+                    self._add(key, entry)
+        else:
+            self._entries.move_to_end(key)
+
+        if entry is not None and field in entry:
+            self.hits += 1
+            return entry[field]
+
+        self.misses += 1
+
+    def set(self, key, field, value):
+        """
+        Store a field of the entry for the given key.
+
+        Parameters
+        ----------
+        key : str
+            Key returned from get_key.
+        field : str
+            Name of the field ('outputs' or 'partials').
+        value : object
+            The value to be cached.  It must be picklable if the cache is persisted.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = {}
+            if self._filename is not None:
+                with shelve.open(self._filename) as db:
+                    entry = db.get(key, entry)
+            self._add(key, entry)
+        else:
+            self._entries.move_to_end(key)
+
+        entry[field] = value
+
+        if self._filename is not None:
+            with shelve.open(self._filename) as db:
+                db[key] = entry
+
+    def clear(self):
+        """
+        Remove all in-memory entries and reset hit/miss counts.
+        """
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def _add(self, key, entry):
+        """
+        Add a new entry, evicting the least recently used one if necessary.
+
+        Parameters
+        ----------
+        key : str
+            Key returned from get_key.
+        entry : dict
+            The entry to add.
+        """
+        self._entries[key] = entry
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,284 @@
+"""
+Functions for saving and restoring the state of a fully set up Problem.
+"""
+
+import copyreg
+import gc
+import io
+import pickle
+import weakref
+
+import numpy as np
+
+from openmdao import __version__
+from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.utils.mpi import MPI, FakeComm
+
+
+class _DeadReferent(object):
+    """
+    Object that only lives long enough to create a dead weak reference.
+    """
+
+    pass
+
+
+def _dead_weakref():
+    return weakref.ref(_DeadReferent())
+
+
+def _rebuild_weakref(obj):
+    return weakref.ref(obj)
+
+
+def _reduce_weakref(ref):
+    obj = ref()
+    if obj is None:
+        return _dead_weakref, ()
+    return _rebuild_weakref, (obj,)
+
+
+def _rebuild_view(base, shape, dtype, offset, strides):
+    return np.ndarray(shape, dtype=dtype, buffer=base, offset=offset, strides=strides)
+
+
+def _reduce_ndarray(arr):
+    # vectors, jacobians, etc. keep many views into a few large arrays.  Arrays pickle as copies
+    # by default, so views are saved as references into their base array to keep memory shared.
+    base = arr.base
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+    if isinstance(base, np.ndarray) and type(base) is np.ndarray and \
+            base.flags.c_contiguous and not base.dtype.hasobject:
+        offset = arr.__array_interface__['data'][0] - base.__array_interface__['data'][0]
+        return _rebuild_view, (base, arr.shape, arr.dtype, offset, arr.strides)
+    return arr.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+
+def _reduce_rec_mgr(rec_mgr):
+    # recorders hold open files/db connections, so they are not saved.  They are set up again
+    # during final_setup.
+    return RecordingManager, ()
+
+
+class _SetupPickler(pickle.Pickler):
+    """
+    Pickler that handles weak references, recorders and MPI communicators.
+
+    Attributes
+    ----------
+    dispatch_table : dict
+        Mapping of type to reduction function.
+    """
+
+    dispatch_table = copyreg.dispatch_table.copy()
+    dispatch_table[weakref.ReferenceType] = _reduce_weakref
+    dispatch_table[RecordingManager] = _reduce_rec_mgr
+    dispatch_table[np.ndarray] = _reduce_ndarray
+
+    def persistent_id(self, obj):
+        """
+        Return a persistent id for MPI communicators so they are not pickled.
+
+        Parameters
+        ----------
+        obj : object
+            Object being pickled.
+
+        Returns
+        -------
+        str or None
+            'comm' if obj is an MPI communicator, else None.
+        """
+        if MPI is not None and isinstance(obj, MPI.Comm):
+            return 'comm'
+
+
+class _SetupUnpickler(pickle.Unpickler):
+    """
+    Unpickler that replaces saved MPI communicators with the given communicator.
+
+    Attributes
+    ----------
+    _comm : MPI.Comm or <FakeComm>
+        Communicator that replaces any communicator in the saved Problem.
+    referents : dict
+        Objects referenced by the restored weak references, keyed by id.  They were alive when
+        the Problem was saved, but the pickle may hold the only references to them.
+    """
+
+    def __init__(self, file, comm):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        file : file-like
+            Binary file to read from.
+        comm : MPI.Comm or <FakeComm>
+            Communicator that replaces any communicator in the saved Problem.
+        """
+        super().__init__(file)
+        self._comm = comm
+        self.referents = {}
+
+    def find_class(self, module, name):
+        """
+        Return the named class or function, recording the referents of restored weak references.
+
+        Parameters
+        ----------
+        module : str
+            Module name.
+        name : str
+            Name of the class or function.
+
+        Returns
+        -------
+        object
+            The class or function.
+        """
+        if module == __name__ and name == '_rebuild_weakref':
+            return self._rebuild_weakref
+        return super().find_class(module, name)
+
+    def _rebuild_weakref(self, obj):
+        """
+        Return a weak reference to obj and keep obj alive.
+
+        Parameters
+        ----------
+        obj : object
+            The referent.
+
+        Returns
+        -------
+        weakref
+            Weak reference to obj.
+        """
+        self.referents[id(obj)] = obj
+        return weakref.ref(obj)
+
+    def persistent_load(self, pid):
+        """
+        Return the object corresponding to the given persistent id.
+
+        Parameters
+        ----------
+        pid : str
+            The persistent id.
+
+        Returns
+        -------
+        MPI.Comm or <FakeComm>
+            The communicator.
+        """
+        if pid == 'comm':
+            return self._comm
+        raise pickle.UnpicklingError(f"Unsupported persistent id '{pid}'.")
+
+
+def save_setup(problem, filename):
+    """
+    Save the state of a fully set up Problem to a file.
+
+    final_setup is called first if it hasn't already been.  Case recorders are not saved, so any
+    recorders must be added again after the Problem is loaded.
+
+    Parameters
+    ----------
+    problem : <Problem>
+        The Problem to be saved.
+    filename : str
+        Name of the file to save to.
+
+    Returns
+    -------
+    str
+        The md5 hash of the model structure, which can be passed to load_setup to verify that
+        the loaded model matches.
+    """
+    from openmdao.core.problem import _SetupStatus
+
+    if problem.comm.size > 1:
+        raise RuntimeError(f"{problem.msginfo}: Saving the setup of a Problem running under MPI "
+                           "is not supported.")
+
+    if problem._metadata is None or \
+            problem._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+        problem.final_setup()
+
+    md5_hash = problem.model._generate_md5_hash()
+
+    buf = io.BytesIO()
+    try:
+        _SetupPickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(problem)
+    except Exception as err:
+        raise RuntimeError(f"{problem.msginfo}: Failed to save setup: {err}")
+
+    with open(filename, 'wb') as f:
+        pickle.dump({'version': __version__, 'md5_hash': md5_hash}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(buf.getvalue())
+
+    return md5_hash
+
+
+def load_setup(filename, md5_hash=None, comm=None):
+    """
+    Load a Problem that was saved using save_setup.
+
+    The returned Problem is ready to run without calling setup or final_setup.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file saved by save_setup.
+    md5_hash : str or None
+        If not None, the expected md5 hash of the model structure.  An exception is raised if it
+        doesn't match the hash of the saved model.
+    comm : MPI.Comm or <FakeComm> or None
+        The communicator used by the loaded Problem.  It must have a size of 1.
+
+    Returns
+    -------
+    <Problem>
+        The restored Problem.
+    """
+    if comm is None:
+        comm = FakeComm() if MPI is None else MPI.COMM_SELF
+    if comm.size > 1:
+        raise RuntimeError("Loading a saved setup using a communicator with more than one "
+                           "process is not supported.")
+
+    with open(filename, 'rb') as f:
+        header = pickle.load(f)
+        if header['version'] != __version__:
+            raise RuntimeError(f"Setup file '{filename}' was saved using OpenMDAO version "
+                               f"{header['version']} but the current version is {__version__}.")
+        if md5_hash is not None and header['md5_hash'] != md5_hash:
+            raise RuntimeError(f"Model structure hash of setup file '{filename}' "
+                               f"({header['md5_hash']}) does not match the expected hash "
+                               f"({md5_hash}).")
+        # unpickling creates a very large number of objects, and repeated garbage collection
+        # passes during the load can take longer than the load itself.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            unpickler = _SetupUnpickler(f, comm)
+            problem = unpickler.load()
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    # the referents of weak references were alive when the Problem was saved, so keep them alive
+    # as long as the Problem, even if nothing else in the Problem refers to them.
+    problem._metadata['weakref_referents'] = list(unpickler.referents.values())
+
+    # vectors drop their system reference when pickled, so restore it here
+    for system in problem.model.system_iter(include_self=True, recurse=True):
+        for vecs in system._vectors.values():
+            for vec in vecs.values():
+                vec._system = weakref.ref(system)
+
+    return problem